@@ -1,294 +1,351 @@
-"""
-Mockup App für Glare Simulation Tool
-Mit Google Maps Integration zum Erstellen von Simulationsrequests
-"""
-
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
-import json
-import os
-import sys
-from datetime import datetime
-from pathlib import Path
-
-# Import configuration
-try:
-    from config import GOOGLE_MAPS_API_KEY
-except ImportError:
-    # Fallback if config.py doesn't exist
-    GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY', '')
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.main import calculate_glare
-
-app = Flask(__name__)
-
-# Store current project data
-current_project = {
-    "pv_areas": [],
-    "observation_points": [],
-    "simulation_params": {
-        "grid_width": 0.5,
-        "resolution": 1,
-        "glare_threshold": 50000
-    }
-}
-
-@app.route('/')
-def index():
-    """Main page with Google Maps"""
-    # Use the original index.html with all features
-    return render_template('index.html', 
-                         google_maps_api_key=GOOGLE_MAPS_API_KEY)
-
-@app.route('/modular')
-def index_modular():
-    """Modular version for testing"""
-    return render_template('index_modular.html',
-                         google_maps_api_key=GOOGLE_MAPS_API_KEY)
-
-@app.route('/logos/<path:filename>')
-def serve_logo(filename):
-    """Serve logo files"""
-    logos_dir = os.path.join(app.root_path, 'logos')
-    return send_from_directory(logos_dir, filename)
-
-@app.route('/api/pv_area', methods=['POST'])
-def add_pv_area():
-    """Add a PV area from map drawing"""
-    data = request.json
-    
-    pv_area = {
-        "id": len(current_project["pv_areas"]) + 1,
-        "name": data.get("name", f"PV Area {len(current_project['pv_areas']) + 1}"),
-        "corners": data["corners"],
-        "azimuth": data.get("azimuth", 180),
-        "tilt": data.get("tilt", 30),
-        "type": data.get("type", "tilted")  # tilted, vertical, or field
-    }
-    
-    current_project["pv_areas"].append(pv_area)
-    return jsonify({"success": True, "pv_area": pv_area})
-
-@app.route('/api/observation_point', methods=['POST'])
-def add_observation_point():
-    """Add an observation point"""
-    data = request.json
-    
-    op = {
-        "id": len(current_project["observation_points"]) + 1,
-        "name": data.get("name", f"OP {len(current_project['observation_points']) + 1}"),
-        "latitude": data["latitude"],
-        "longitude": data["longitude"],
-        "height_observer": data.get("height_observer", 1.5),
-        "height_object": data.get("height_object", 10.0)
-    }
-    
-    current_project["observation_points"].append(op)
-    return jsonify({"success": True, "observation_point": op})
-
-@app.route('/api/clear', methods=['POST'])
-def clear_project():
-    """Clear current project"""
-    current_project["pv_areas"] = []
-    current_project["observation_points"] = []
-    return jsonify({"success": True})
-
-@app.route('/api/simulate', methods=['POST'])
-def run_simulation():
-    """Run the glare simulation"""
-    try:
-        # Convert to required format
-        simulation_data = {
-            "pv_areas": [],
-            "list_of_pv_area_information": [],
-            "list_of_ops": [],
-            "meta_data": {
-                "project_name": "Mockup Simulation",
-                "created_at": datetime.now().isoformat()
-            },
-            "simulation_parameter": {
-                "grid_width": current_project["simulation_params"]["grid_width"],
-                "resolution": current_project["simulation_params"]["resolution"],
-                "glare_threshold": current_project["simulation_params"]["glare_threshold"]
-            }
-        }
-        
-        # Convert PV areas
-        for pv in current_project["pv_areas"]:
-            simulation_data["pv_areas"].append({
-                "name": pv["name"],
-                "corners": pv["corners"]
-            })
-            simulation_data["list_of_pv_area_information"].append({
-                "azimuth": pv["azimuth"],
-                "tilt": pv["tilt"],
-                "module_type": 0
-            })
-        
-        # Convert observation points
-        for op in current_project["observation_points"]:
-            simulation_data["list_of_ops"].append({
-                "name": op["name"],
-                "latitude": op["latitude"],
-                "longitude": op["longitude"],
-                "height_observer": op["height_observer"],
-                "height_object": op["height_object"]
-            })
-        
-        # Run simulation
-        result = calculate_glare(json.dumps(simulation_data))
-        
-        return jsonify({
-            "success": True,
-            "message": "Simulation completed successfully",
-            "output_dir": "output"
-        })
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-@app.route('/api/export', methods=['GET'])
-def export_json():
-    """Export current project as JSON"""
-    # Convert to simulation format
-    export_data = {
-        "pv_areas": [],
-        "list_of_pv_area_information": [],
-        "list_of_ops": [],
-        "meta_data": {
-            "project_name": "Mockup Export",
-            "created_at": datetime.now().isoformat()
-        },
-        "simulation_parameter": current_project["simulation_params"]
-    }
-    
-    # Convert PV areas
-    for pv in current_project["pv_areas"]:
-        export_data["pv_areas"].append({
-            "name": pv["name"],
-            "corners": pv["corners"]
-        })
-        export_data["list_of_pv_area_information"].append({
-            "azimuth": pv["azimuth"],
-            "tilt": pv["tilt"],
-            "module_type": 0
-        })
-    
-    # Convert observation points
-    for op in current_project["observation_points"]:
-        export_data["list_of_ops"].append({
-            "name": op["name"],
-            "latitude": op["latitude"],
-            "longitude": op["longitude"],
-            "height_observer": op["height_observer"],
-            "height_object": op["height_object"]
-        })
-    
-    return jsonify(export_data)
-
-@app.route('/api/project', methods=['GET'])
-def get_project():
-    """Get current project data"""
-    return jsonify(current_project)
-
-@app.route('/api/config', methods=['GET'])
-def get_config():
-    """Get runtime configuration"""
-    # Return empty config for now, can be extended later
-    return jsonify({})
-
-@app.route('/api/state', methods=['GET'])
-def get_state():
-    """Get saved application state"""
-    # For now, return empty state
-    return jsonify({
-        "pvAreas": [],
-        "observationPoints": [],
-        "moduleTypes": [
-            {
-                "id": 1,
-                "name": "Standardmodul",
-                "beamSpread": 0.5,
-                "reflectionProfile": {
-                    "0": 70000.00,
-                    "10": 70000.00,
-                    "20": 71000.00,
-                    "30": 79000.00,
-                    "40": 120000.00,
-                    "50": 280000.00,
-                    "60": 930000.00,
-                    "70": 3900000.00,
-                    "80": 16134855.82,
-                    "90": 58377635.77
-                }
-            },
-            {
-                "id": 2,
-                "name": "Phytonics Anti Glare",
-                "beamSpread": 40,
-                "reflectionProfile": {
-                    "0": 2800.00,
-                    "10": 2900.00,
-                    "20": 3200.00,
-                    "30": 3900.00,
-                    "40": 5400.00,
-                    "50": 9500.00,
-                    "60": 21000.00,
-                    "70": 65000.00,
-                    "80": 180000.00,
-                    "90": 510000.00
-                }
-            }
-        ]
-    })
-
-@app.route('/api/state', methods=['POST'])
-def save_state():
-    """Save application state"""
-    # For now, just return success
-    return jsonify({"success": True})
-
-@app.route('/api/module_types', methods=['GET'])
-def get_module_types():
-    """Get available module types"""
-    # Return default module types
-    return jsonify([
-        {
-            "id": 0,
-            "name": "Standard Modul",
-            "manufacturer": "Generic",
-            "model": "Standard",
-            "reflectionProfile": {
-                "0": 70000, "10": 70000, "20": 71000, "30": 79000, "40": 120000,
-                "50": 280000, "60": 930000, "70": 3900000, "80": 16134855, "90": 58377635
-            }
-        },
-        {
-            "id": 1,
-            "name": "Anti-Reflex Modul",
-            "manufacturer": "Phytonics",
-            "model": "Anti-Glare",
-            "reflectionProfile": {
-                "0": 2800, "10": 2900, "20": 3200, "30": 3900, "40": 5400,
-                "50": 9500, "60": 21000, "70": 65000, "80": 180000, "90": 510000
-            }
-        },
-        {
-            "id": 2,
-            "name": "Strukturglas Modul",
-            "manufacturer": "Generic",
-            "model": "Textured",
-            "reflectionProfile": {
-                "0": 8000, "10": 8000, "20": 8000, "30": 8000, "40": 12000,
-                "50": 16000, "60": 20000, "70": 24000, "80": 28000, "90": 32000
-            }
-        }
-    ])
-
-if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+"""
+Mockup App für Glare Simulation Tool
+Mit Google Maps Integration zum Erstellen von Simulationsrequests
+"""
+
+from flask import Flask, Response, render_template, request, jsonify, send_file, send_from_directory
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException
+import hashlib
+import orjson
+from operator import itemgetter
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Import configuration
+try:
+    from config import GOOGLE_MAPS_API_KEY
+except ImportError:
+    # Fallback if config.py doesn't exist
+    GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY', '')
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.main import calculate_glare
+
+try:
+    # Package mode (gunicorn mockup_app.app:app from the repo root)
+    from .project_store import ProjectStore
+except ImportError:
+    # Script mode (python mockup_app/app.py)
+    from project_store import ProjectStore
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Store current project data (Redis-backed when REDIS_URL is set)
+store = ProjectStore(redis_url=os.getenv('REDIS_URL'))
+
+# Static API payloads. These endpoints return constant data, so the
+# dicts are built and serialized once at import time instead of per request.
+_DEFAULT_STATE = {
+    "pvAreas": [],
+    "observationPoints": [],
+    "moduleTypes": [
+        {
+            "id": 1,
+            "name": "Standardmodul",
+            "beamSpread": 0.5,
+            "reflectionProfile": {
+                "0": 70000.00,
+                "10": 70000.00,
+                "20": 71000.00,
+                "30": 79000.00,
+                "40": 120000.00,
+                "50": 280000.00,
+                "60": 930000.00,
+                "70": 3900000.00,
+                "80": 16134855.82,
+                "90": 58377635.77
+            }
+        },
+        {
+            "id": 2,
+            "name": "Phytonics Anti Glare",
+            "beamSpread": 40,
+            "reflectionProfile": {
+                "0": 2800.00,
+                "10": 2900.00,
+                "20": 3200.00,
+                "30": 3900.00,
+                "40": 5400.00,
+                "50": 9500.00,
+                "60": 21000.00,
+                "70": 65000.00,
+                "80": 180000.00,
+                "90": 510000.00
+            }
+        }
+    ]
+}
+
+_DEFAULT_MODULE_TYPES = [
+    {
+        "id": 0,
+        "name": "Standard Modul",
+        "manufacturer": "Generic",
+        "model": "Standard",
+        "reflectionProfile": {
+            "0": 70000, "10": 70000, "20": 71000, "30": 79000, "40": 120000,
+            "50": 280000, "60": 930000, "70": 3900000, "80": 16134855, "90": 58377635
+        }
+    },
+    {
+        "id": 1,
+        "name": "Anti-Reflex Modul",
+        "manufacturer": "Phytonics",
+        "model": "Anti-Glare",
+        "reflectionProfile": {
+            "0": 2800, "10": 2900, "20": 3200, "30": 3900, "40": 5400,
+            "50": 9500, "60": 21000, "70": 65000, "80": 180000, "90": 510000
+        }
+    },
+    {
+        "id": 2,
+        "name": "Strukturglas Modul",
+        "manufacturer": "Generic",
+        "model": "Textured",
+        "reflectionProfile": {
+            "0": 8000, "10": 8000, "20": 8000, "30": 8000, "40": 12000,
+            "50": 16000, "60": 20000, "70": 24000, "80": 28000, "90": 32000
+        }
+    }
+]
+
+_STATE_BYTES = orjson.dumps(_DEFAULT_STATE)
+_STATE_ETAG = hashlib.blake2b(_STATE_BYTES, digest_size=16).hexdigest()
+_MODULE_TYPES_BYTES = orjson.dumps(_DEFAULT_MODULE_TYPES)
+_MODULE_TYPES_ETAG = hashlib.blake2b(_MODULE_TYPES_BYTES, digest_size=16).hexdigest()
+
+
+def _static_json_response(payload: bytes, etag: str) -> Response:
+    """Build a cacheable JSON response honouring If-None-Match."""
+    if request.if_none_match.contains(etag):
+        return Response(status=304)
+    resp = Response(payload, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.cache_control.max_age = 3600
+    return resp
+
+@app.route('/')
+def index():
+    """Main page with Google Maps"""
+    # Use the original index.html with all features
+    return render_template('index.html', 
+                         google_maps_api_key=GOOGLE_MAPS_API_KEY)
+
+@app.route('/modular')
+def index_modular():
+    """Modular version for testing"""
+    return render_template('index_modular.html',
+                         google_maps_api_key=GOOGLE_MAPS_API_KEY)
+
+# Computed once at startup instead of per request
+LOGOS_DIR = os.path.join(app.root_path, 'logos')
+
+
+@app.route('/logos/<path:filename>')
+def serve_logo(filename):
+    """Serve logo files with client-side caching"""
+    return send_from_directory(LOGOS_DIR, filename, max_age=86400, conditional=True)
+
+@app.route('/api/pv_area', methods=['POST'])
+def add_pv_area():
+    """Add a PV area from map drawing"""
+    data = orjson.loads(request.get_data())
+    pv_area = store.add_pv_area(data)
+    return jsonify({"success": True, "pv_area": pv_area})
+
+@app.route('/api/observation_point', methods=['POST'])
+def add_observation_point():
+    """Add an observation point"""
+    data = orjson.loads(request.get_data())
+    op = store.add_observation_point(data)
+    return jsonify({"success": True, "observation_point": op})
+
+@app.route('/api/clear', methods=['POST'])
+def clear_project():
+    """Clear current project"""
+    store.clear()
+    return jsonify({"success": True})
+
+# Field extraction for the payload transform. itemgetter pulls all keys
+# of a record in one C-level call instead of a Python lookup per key.
+_PV_GEOM_FIELDS = ('name', 'corners')
+_pv_geom_keys = itemgetter(*_PV_GEOM_FIELDS)
+_PV_INFO_FIELDS = ('azimuth', 'tilt', 'module_type')
+_pv_info_keys = itemgetter('azimuth', 'tilt')
+_OP_FIELDS = ('name', 'latitude', 'longitude', 'height_observer', 'height_object')
+_op_keys = itemgetter(*_OP_FIELDS)
+
+
+def _to_simulation_payload(project, project_name, simulation_parameter):
+    """Convert a project snapshot to the calculate_glare input format.
+
+    Shared by /api/simulate and /api/export. Each output list is built in
+    a single comprehension pass over the snapshot instead of growing
+    several lists inside one interleaved loop.
+    """
+    pv_areas = project["pv_areas"]
+    return {
+        "pv_areas": [
+            dict(zip(_PV_GEOM_FIELDS, _pv_geom_keys(pv)))
+            for pv in pv_areas
+        ],
+        "list_of_pv_area_information": [
+            dict(zip(_PV_INFO_FIELDS, (*_pv_info_keys(pv), 0)))
+            for pv in pv_areas
+        ],
+        "list_of_ops": [
+            dict(zip(_OP_FIELDS, _op_keys(op)))
+            for op in project["observation_points"]
+        ],
+        "meta_data": {
+            "project_name": project_name,
+            # Raw datetime: orjson serializes it natively as RFC 3339
+            "created_at": datetime.now()
+        },
+        "simulation_parameter": simulation_parameter
+    }
+
+
+# Cache of simulation results keyed by a hash of the input payload.
+# calculate_glare is deterministic, so re-running an unchanged project
+# (a common tweak-and-rerun flow in the UI) is answered from the cache.
+# meta_data is excluded from the key because created_at changes per call.
+_SIM_KEY_FIELDS = ('pv_areas', 'list_of_pv_area_information', 'list_of_ops',
+                   'simulation_parameter')
+_SIM_CACHE_MAX = 32
+_sim_cache = {}
+
+
+def _simulation_cache_key(simulation_data):
+    """Hash the simulation-relevant part of the payload."""
+    key_payload = {k: simulation_data[k] for k in _SIM_KEY_FIELDS}
+    return hashlib.blake2b(
+        orjson.dumps(key_payload, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).digest()
+
+
+@app.route('/api/simulate', methods=['POST'])
+def run_simulation():
+    """Run the glare simulation"""
+    try:
+        # Snapshot the project state in one read
+        project = store.get_project()
+
+        # The stored params are already in the simulation format, so the
+        # snapshot dict is passed through without rebuilding it key by key
+        simulation_data = _to_simulation_payload(
+            project, "Mockup Simulation", project["simulation_params"]
+        )
+        
+        # Run simulation (pass the dict directly, no serialize/re-parse
+        # round trip); identical payloads are answered from the cache
+        key = _simulation_cache_key(simulation_data)
+        result = _sim_cache.get(key)
+        if result is None:
+            result = calculate_glare(simulation_data)
+            if len(_sim_cache) >= _SIM_CACHE_MAX:
+                _sim_cache.pop(next(iter(_sim_cache)))
+            _sim_cache[key] = result
+        
+        return jsonify({
+            "success": True,
+            "message": "Simulation completed successfully",
+            "output_dir": "output"
+        })
+        
+    except (KeyError, ValueError, orjson.JSONDecodeError) as e:
+        # Expected client-input errors; anything else bubbles up to the
+        # global error handler so tracebacks stay visible in the log
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+
+@app.route('/api/export', methods=['GET'])
+def export_json():
+    """Export current project as JSON"""
+    # Snapshot the project state in one read
+    project = store.get_project()
+
+    export_data = _to_simulation_payload(
+        project, "Mockup Export", project["simulation_params"]
+    )
+    return jsonify(export_data)
+
+@app.route('/api/project', methods=['GET'])
+def get_project():
+    """Get current project data"""
+    return jsonify(store.get_project())
+
+# Prebuilt payload for the empty runtime config; skips the
+# jsonify -> dumps chain on a frequently polled endpoint
+_EMPTY_CONFIG_BYTES = b'{}'
+_EMPTY_CONFIG_ETAG = hashlib.blake2b(_EMPTY_CONFIG_BYTES, digest_size=16).hexdigest()
+
+
+@app.route('/api/config', methods=['GET'])
+def get_config():
+    """Get runtime configuration"""
+    # Return empty config for now, can be extended later
+    return _static_json_response(_EMPTY_CONFIG_BYTES, _EMPTY_CONFIG_ETAG)
+
+@app.route('/api/state', methods=['GET'])
+def get_state():
+    """Get saved application state"""
+    # Static response, serialized once at import time; conditional GETs
+    # are answered with 304 and no body
+    return _static_json_response(_STATE_BYTES, _STATE_ETAG)
+
+@app.route('/api/state', methods=['POST'])
+def save_state():
+    """Save application state"""
+    # For now, just return success
+    return jsonify({"success": True})
+
+@app.route('/api/module_types', methods=['GET'])
+def get_module_types():
+    """Get available module types"""
+    # Static response, serialized once at import time; conditional GETs
+    # are answered with 304 and no body
+    return _static_json_response(_MODULE_TYPES_BYTES, _MODULE_TYPES_ETAG)
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Serialize unexpected server errors as JSON, keeping the traceback logged."""
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception("Unhandled error")
+    return Response(
+        orjson.dumps({"success": False, "error": str(e)}),
+        status=500,
+        mimetype='application/json'
+    )
+
+
+if __name__ == '__main__':
+    # Dev server only. In production run multiple sync workers so
+    # CPU-heavy calculate_glare calls don't serialize behind the GIL:
+    #   gunicorn -w $(nproc) -k sync -b 0.0.0.0:5000 mockup_app.app:app
+    debug = os.getenv('FLASK_ENV', 'development') == 'development'
+    app.run(debug=debug, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""Project state storage for the mockup app.
+
+The project state (PV areas, observation points, simulation parameters)
+was previously a module-level dict in app.py. That races under threaded
+servers or multi-worker deployments and is lost on restart. ProjectStore
+keeps the state in Redis when available — atomic ID counters via INCR,
+shared across workers — and falls back to a lock-guarded in-process
+store when redis is not installed or not reachable.
+"""
+
+import itertools
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMULATION_PARAMS = {
+    "grid_width": 0.5,
+    "resolution": 1,
+    "glare_threshold": 50000
+}
+
+
+class ProjectStore:
+    """Stores the current project with Redis or in-memory backing.
+
+    Attributes:
+        session_id: Key namespace, allows multiple projects per Redis instance
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, session_id: str = "default"):
+        """Initialize the store.
+
+        Args:
+            redis_url: Redis connection URL (e.g. redis://localhost:6379/0).
+                If None or unreachable, an in-process store is used.
+            session_id: Namespace for the Redis keys.
+        """
+        self.session_id = session_id
+        self._redis = None
+
+        if redis_url and REDIS_AVAILABLE:
+            try:
+                client = redis.Redis.from_url(redis_url)
+                client.ping()
+                self._redis = client
+                logger.info(f"ProjectStore using Redis at {redis_url}")
+            except Exception as e:
+                logger.warning(f"Redis not reachable ({e}), using in-memory store")
+        elif redis_url and not REDIS_AVAILABLE:
+            logger.warning("redis package not installed, using in-memory store")
+
+        # In-memory fallback state. IDs come from monotonic counters
+        # (mirroring Redis INCR) so deletions can never recycle an id.
+        self._lock = threading.Lock()
+        self._pv_areas: List[Dict[str, Any]] = []
+        self._observation_points: List[Dict[str, Any]] = []
+        self._pv_id = itertools.count(1)
+        self._op_id = itertools.count(1)
+        self._simulation_params = dict(DEFAULT_SIMULATION_PARAMS)
+
+    def _key(self, suffix: str) -> str:
+        """Build a namespaced Redis key."""
+        return f"project:{self.session_id}:{suffix}"
+
+    def add_pv_area(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a PV area and return the stored record (with assigned id)."""
+        if self._redis is not None:
+            new_id = int(self._redis.incr(self._key("pv_counter")))
+            pv_area = self._build_pv_area(data, new_id)
+            self._redis.rpush(self._key("pv_areas"), orjson.dumps(pv_area))
+            return pv_area
+
+        with self._lock:
+            new_id = next(self._pv_id)
+            pv_area = self._build_pv_area(data, new_id)
+            self._pv_areas.append(pv_area)
+            return pv_area
+
+    def add_observation_point(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add an observation point and return the stored record."""
+        if self._redis is not None:
+            new_id = int(self._redis.incr(self._key("op_counter")))
+            op = self._build_observation_point(data, new_id)
+            self._redis.rpush(self._key("observation_points"), orjson.dumps(op))
+            return op
+
+        with self._lock:
+            new_id = next(self._op_id)
+            op = self._build_observation_point(data, new_id)
+            self._observation_points.append(op)
+            return op
+
+    def clear(self) -> None:
+        """Remove all PV areas and observation points."""
+        if self._redis is not None:
+            self._redis.delete(
+                self._key("pv_areas"),
+                self._key("observation_points"),
+                self._key("pv_counter"),
+                self._key("op_counter")
+            )
+            return
+
+        with self._lock:
+            self._pv_areas = []
+            self._observation_points = []
+            self._pv_id = itertools.count(1)
+            self._op_id = itertools.count(1)
+
+    @property
+    def pv_areas(self) -> List[Dict[str, Any]]:
+        """Get all stored PV areas."""
+        if self._redis is not None:
+            raw = self._redis.lrange(self._key("pv_areas"), 0, -1)
+            return [orjson.loads(item) for item in raw]
+        with self._lock:
+            return list(self._pv_areas)
+
+    @property
+    def observation_points(self) -> List[Dict[str, Any]]:
+        """Get all stored observation points."""
+        if self._redis is not None:
+            raw = self._redis.lrange(self._key("observation_points"), 0, -1)
+            return [orjson.loads(item) for item in raw]
+        with self._lock:
+            return list(self._observation_points)
+
+    @property
+    def simulation_params(self) -> Dict[str, Any]:
+        """Get the simulation parameters."""
+        if self._redis is not None:
+            raw = self._redis.get(self._key("simulation_params"))
+            if raw is not None:
+                return orjson.loads(raw)
+            return dict(DEFAULT_SIMULATION_PARAMS)
+        with self._lock:
+            return dict(self._simulation_params)
+
+    def get_project(self) -> Dict[str, Any]:
+        """Get the complete project state in a single snapshot."""
+        if self._redis is not None:
+            # Pipeline the reads so the snapshot is a single round trip
+            pipe = self._redis.pipeline()
+            pipe.lrange(self._key("pv_areas"), 0, -1)
+            pipe.lrange(self._key("observation_points"), 0, -1)
+            pipe.get(self._key("simulation_params"))
+            raw_pv, raw_ops, raw_params = pipe.execute()
+            return {
+                "pv_areas": [orjson.loads(item) for item in raw_pv],
+                "observation_points": [orjson.loads(item) for item in raw_ops],
+                "simulation_params": (
+                    orjson.loads(raw_params) if raw_params is not None
+                    else dict(DEFAULT_SIMULATION_PARAMS)
+                )
+            }
+
+        with self._lock:
+            return {
+                "pv_areas": list(self._pv_areas),
+                "observation_points": list(self._observation_points),
+                "simulation_params": dict(self._simulation_params)
+            }
+
+    @staticmethod
+    def _build_pv_area(data: Dict[str, Any], new_id: int) -> Dict[str, Any]:
+        """Build a PV area record from request data."""
+        return {
+            "id": new_id,
+            "name": data.get("name", f"PV Area {new_id}"),
+            "corners": data["corners"],
+            "azimuth": data.get("azimuth", 180),
+            "tilt": data.get("tilt", 30),
+            "type": data.get("type", "tilted")  # tilted, vertical, or field
+        }
+
+    @staticmethod
+    def _build_observation_point(data: Dict[str, Any], new_id: int) -> Dict[str, Any]:
+        """Build an observation point record from request data."""
+        return {
+            "id": new_id,
+            "name": data.get("name", f"OP {new_id}"),
+            "latitude": data["latitude"],
+            "longitude": data["longitude"],
+            "height_observer": data.get("height_observer", 1.5),
+            "height_object": data.get("height_object", 10.0)
+        }
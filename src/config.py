@@ -1,18 +1,28 @@
 """Central configuration for the Glare Analysis System."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 import json
 
+# Repository root, resolved once at import. Avoids rebuilding intermediate
+# Path objects on every Config() construction.
+_BASE_DIR = Path(__file__).resolve().parent.parent
 
-@dataclass
+
+@dataclass(frozen=True)
 class Config:
-    """Central configuration class for the application."""
+    """Central configuration class for the application.
+
+    Frozen so instances are hashable and attribute values can be trusted
+    not to change after construction; derived fields are filled in via
+    object.__setattr__ during __post_init__.
+    """
     
     # Paths
-    BASE_DIR: Path = field(default_factory=lambda: Path(__file__).parent.parent)
+    BASE_DIR: Path = _BASE_DIR
     ASSETS_DIR: Path = field(init=False)
     OUTPUT_DIR: Path = field(init=False)
     LOG_DIR: Path = field(init=False)
@@ -54,18 +64,23 @@ class Config:
     
     def __post_init__(self):
         """Initialize computed fields after dataclass initialization."""
-        self.ASSETS_DIR = self.BASE_DIR / "assets"
-        self.OUTPUT_DIR = self.BASE_DIR / "output"
-        self.LOG_DIR = self.BASE_DIR / "log"
-        
-        # Create directories if they don't exist
-        for directory in [self.OUTPUT_DIR, self.LOG_DIR]:
-            directory.mkdir(parents=True, exist_ok=True)
-            
+        object.__setattr__(self, 'ASSETS_DIR', self.BASE_DIR / "assets")
+        object.__setattr__(self, 'OUTPUT_DIR', self.BASE_DIR / "output")
+        object.__setattr__(self, 'LOG_DIR', self.BASE_DIR / "log")
+
         # Set company logo if exists
         logo_path = self.ASSETS_DIR / "logo.png"
         if logo_path.exists():
-            self.COMPANY_LOGO = logo_path
+            object.__setattr__(self, 'COMPANY_LOGO', logo_path)
+
+    def ensure_dirs(self) -> None:
+        """Create output and log directories if they don't exist.
+
+        Called once at the start of an analysis run rather than at import
+        time, so importing this module stays free of filesystem syscalls.
+        """
+        for directory in [self.OUTPUT_DIR, self.LOG_DIR]:
+            directory.mkdir(parents=True, exist_ok=True)
     
     @property
     def language(self) -> str:
@@ -94,34 +109,26 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables.
-        
+
         Environment variables should be prefixed with GLARE_.
         For example: GLARE_LOG_LEVEL, GLARE_DPI, etc.
-        
+
         Returns:
             Config instance with values from environment.
         """
         kwargs = {}
         prefix = "GLARE_"
-        
-        for key in cls.__dataclass_fields__:
-            env_key = f"{prefix}{key}"
-            if env_key in os.environ:
-                field_type = cls.__dataclass_fields__[key].type
-                value = os.environ[env_key]
-                
-                # Type conversion
-                if field_type == bool:
-                    kwargs[key] = value.lower() in ('true', '1', 'yes')
-                elif field_type == int:
-                    kwargs[key] = int(value)
-                elif field_type == float:
-                    kwargs[key] = float(value)
-                elif field_type == Path:
-                    kwargs[key] = Path(value)
-                else:
-                    kwargs[key] = value
-                    
+
+        # Single pass over the environment; field types were resolved to
+        # converters once at module load
+        for key, value in os.environ.items():
+            if not key.startswith(prefix):
+                continue
+            field_name = key[len(prefix):]
+            converter = _FIELD_CONVERTERS.get(field_name)
+            if converter is not None:
+                kwargs[field_name] = converter(value)
+
         return cls(**kwargs)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -163,6 +170,22 @@ class Config:
             raise ValueError(f"ASSETS_DIR does not exist: {self.ASSETS_DIR}")
 
 
+# Environment value converters by field type
+_CONVERTERS = {
+    bool: lambda v: v.lower() in ('true', '1', 'yes'),
+    int: int,
+    float: float,
+    Path: Path,
+}
+
+# Converter per field name, resolved once so from_env doesn't re-inspect
+# __dataclass_fields__ and compare typing objects on every call
+_FIELD_CONVERTERS = {
+    name: _CONVERTERS.get(f.type, lambda v: v)
+    for name, f in Config.__dataclass_fields__.items()
+}
+
+
 # Global configuration instance
 config = Config()
 
@@ -173,5 +196,17 @@ if CONFIG_FILE and Path(CONFIG_FILE).exists():
 elif any(key.startswith("GLARE_") for key in os.environ):
     config = Config.from_env()
 
-# Validate configuration
-config.validate()
\ No newline at end of file
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the global configuration, validated on first access.
+
+    Validation (including the ASSETS_DIR existence check) is deferred
+    until a caller actually needs the configuration instead of running
+    at import time in every process.
+
+    Returns:
+        The validated global Config instance.
+    """
+    config.validate()
+    return config
\ No newline at end of file
@@ -1,516 +1,1176 @@
-"""Geometric calculations for glare analysis.
-
-This module provides functions for geometric operations including:
-- Angular calculations (circular mean, azimuth)
-- Distance calculations (haversine)
-- Vector operations (normals, dot products)
-- Plane fitting and interpolation
-"""
-
-import math
-from typing import List, Tuple, Union, Optional, Sequence
-import numpy as np
-import numpy.typing as npt
-
-from .models import Coordinate, Vector3D
-
-
-class GeometryError(Exception):
-    """Exception raised for geometry calculation errors."""
-    pass
-
-
-def circular_mean(angles: Sequence[float]) -> float:
-    """Calculate the circular mean of angles.
-    
-    This function correctly handles the circular nature of angles where
-    0° = 360°. For example, the mean of 350° and 10° is 0°, not 180°.
-    
-    Args:
-        angles: Sequence of angles in degrees
-        
-    Returns:
-        Circular mean angle in degrees (0-360)
-        
-    Raises:
-        ValueError: If angles list is empty
-        
-    Example:
-        >>> circular_mean([350, 10])
-        0.0
-        >>> circular_mean([90, 180, 270])
-        180.0
-    """
-    if not angles:
-        raise ValueError("Cannot calculate circular mean of empty list")
-    
-    # Convert to radians
-    angles_rad = [math.radians(a) for a in angles]
-    
-    # Calculate mean of sin and cos components
-    sin_mean = sum(math.sin(a) for a in angles_rad) / len(angles_rad)
-    cos_mean = sum(math.cos(a) for a in angles_rad) / len(angles_rad)
-    
-    # Calculate mean angle
-    mean_angle = math.atan2(sin_mean, cos_mean)
-    
-    # Convert back to degrees and ensure 0-360 range
-    mean_degrees = math.degrees(mean_angle)
-    if mean_degrees < 0:
-        mean_degrees += 360
-        
-    return mean_degrees
-
-
-def recenter_azimuth(az: float, center_az: float) -> float:
-    """Recenter an azimuth angle around a given center.
-    
-    This function recenters an azimuth angle to be within ±180° of
-    a center azimuth. Useful for avoiding discontinuities at 0°/360°.
-    
-    Args:
-        az: Azimuth angle to recenter (degrees)
-        center_az: Center azimuth (degrees)
-        
-    Returns:
-        Recentered azimuth in range [center_az - 180, center_az + 180]
-        
-    Example:
-        >>> recenter_azimuth(10, 180)
-        -170.0
-        >>> recenter_azimuth(350, 180)
-        170.0
-    """
-    diff = az - center_az
-    
-    # Wrap to ±180
-    while diff > 180:
-        diff -= 360
-    while diff < -180:
-        diff += 360
-        
-    return diff
-
-
-def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate the great circle distance between two points on Earth.
-    
-    Uses the haversine formula to calculate distance accounting for
-    Earth's spherical shape.
-    
-    Args:
-        lat1: Latitude of first point (degrees)
-        lon1: Longitude of first point (degrees)
-        lat2: Latitude of second point (degrees)
-        lon2: Longitude of second point (degrees)
-        
-    Returns:
-        Distance in meters
-        
-    Example:
-        >>> haversine(52.5200, 13.4050, 48.1351, 11.5820)  # Berlin to Munich
-        504238.7
-    """
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-    
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    
-    # Earth radius in meters
-    R = 6371000
-    
-    return R * c
-
-
-def calculate_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate the azimuth from point 1 to point 2.
-    
-    Args:
-        lat1: Latitude of start point (degrees)
-        lon1: Longitude of start point (degrees)
-        lat2: Latitude of end point (degrees)
-        lon2: Longitude of end point (degrees)
-        
-    Returns:
-        Azimuth in degrees (0-360, where 0=North, 90=East)
-        
-    Example:
-        >>> calculate_azimuth(0, 0, 1, 0)  # North
-        0.0
-        >>> calculate_azimuth(0, 0, 0, 1)  # East
-        90.0
-    """
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-    
-    # Calculate bearing
-    dlon = lon2 - lon1
-    y = math.sin(dlon) * math.cos(lat2)
-    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
-    
-    # Calculate azimuth
-    azimuth = math.atan2(y, x)
-    
-    # Convert to degrees and normalize to 0-360
-    azimuth_degrees = math.degrees(azimuth)
-    return (azimuth_degrees + 360) % 360
-
-
-def get_panel_normal(pan_az: float, pan_tilt: float) -> np.ndarray:
-    """Calculate the normal vector of a tilted panel.
-    
-    The normal vector points outward from the panel surface.
-    For a horizontal panel (tilt=0), the normal points straight up (0,0,1).
-    
-    Args:
-        pan_az: Panel azimuth in degrees (0=North, 90=East, 180=South)
-        pan_tilt: Panel tilt in degrees (0=horizontal, 90=vertical)
-        
-    Returns:
-        3D normal vector as numpy array [x, y, z]
-        
-    Example:
-        >>> get_panel_normal(180, 0)  # Horizontal panel
-        array([0., 0., 1.])
-        >>> get_panel_normal(180, 90)  # Vertical south-facing
-        array([0., -1., 0.])
-    """
-    # Convert to radians
-    az_rad = math.radians(pan_az)
-    tilt_rad = math.radians(pan_tilt)
-    
-    # Calculate normal vector components
-    # For a south-facing panel (az=180°), the normal should point south (negative y)
-    # x: East-West component (positive = East)
-    # y: North-South component (positive = North)
-    # z: Vertical component (positive = Up)
-    x = -math.sin(az_rad) * math.sin(tilt_rad)
-    y = math.cos(az_rad) * math.sin(tilt_rad)
-    z = math.cos(tilt_rad)
-    
-    return np.array([x, y, z])
-
-
-def get_sun_vector(sun_az: float, sun_el: float) -> np.ndarray:
-    """Calculate the unit vector from sun to observer.
-    
-    The vector points from the sun towards the ground/observer.
-    
-    Args:
-        sun_az: Sun azimuth in degrees (0=North, 90=East, 180=South)
-        sun_el: Sun elevation in degrees (0=horizon, 90=zenith)
-        
-    Returns:
-        3D sun vector as numpy array [x, y, z]
-        
-    Example:
-        >>> get_sun_vector(180, 45)  # Sun in south at 45° elevation
-        array([0., -0.707, -0.707])
-    """
-    # Convert to radians
-    az_rad = math.radians(sun_az)
-    el_rad = math.radians(sun_el)
-    
-    # Calculate sun vector components (from sun to ground)
-    # When sun is in the south (az=180), the vector should point north (positive y)
-    # x: East-West component
-    # y: North-South component  
-    # z: Vertical component (negative because pointing down)
-    x = math.sin(az_rad) * math.cos(el_rad)
-    y = -math.cos(az_rad) * math.cos(el_rad)
-    z = -math.sin(el_rad)
-    
-    return np.array([x, y, z])
-
-
-def calculate_incidence_angle(sun_az: float, sun_el: float, 
-                            pan_az: float, pan_tilt: float) -> float:
-    """Calculate the angle of incidence of sunlight on a panel.
-    
-    The incidence angle is the angle between the incoming sunlight
-    and the panel normal. 0° means perpendicular (direct) incidence.
-    
-    Args:
-        sun_az: Sun azimuth in degrees
-        sun_el: Sun elevation in degrees
-        pan_az: Panel azimuth in degrees
-        pan_tilt: Panel tilt in degrees
-        
-    Returns:
-        Incidence angle in degrees (0-180)
-        
-    Example:
-        >>> calculate_incidence_angle(180, 30, 180, 30)  # Optimal alignment
-        0.0
-    """
-    # Get vectors
-    sun_vec = get_sun_vector(sun_az, sun_el)
-    panel_normal = get_panel_normal(pan_az, pan_tilt)
-    
-    # Calculate dot product (note: sun vector points from sun to ground)
-    # So we need the negative for the angle with the normal
-    cos_angle = -np.dot(sun_vec, panel_normal)
-    
-    # Clamp to valid range to handle numerical errors
-    cos_angle = np.clip(cos_angle, -1.0, 1.0)
-    
-    # Calculate angle
-    angle_rad = math.acos(cos_angle)
-    return math.degrees(angle_rad)
-
-
-def calculate_angle_between_vectors(v1: np.ndarray, v2: np.ndarray) -> float:
-    """Calculate the angle between two vectors in degrees.
-    
-    Args:
-        v1: First vector
-        v2: Second vector
-        
-    Returns:
-        Angle between vectors in degrees (0-180)
-        
-    Example:
-        >>> v1 = np.array([1, 0, 0])
-        >>> v2 = np.array([0, 1, 0])
-        >>> calculate_angle_between_vectors(v1, v2)
-        90.0
-    """
-    # Normalize vectors
-    v1_norm = v1 / np.linalg.norm(v1)
-    v2_norm = v2 / np.linalg.norm(v2)
-    
-    # Calculate dot product
-    cos_angle = np.dot(v1_norm, v2_norm)
-    
-    # Clamp to valid range
-    cos_angle = np.clip(cos_angle, -1.0, 1.0)
-    
-    # Calculate angle
-    angle_rad = math.acos(cos_angle)
-    return math.degrees(angle_rad)
-
-
-def fit_plane_least_squares(points: List[Tuple[float, float, float]]) -> Tuple[float, float, float]:
-    """Fit a plane through 3D points using least squares.
-    
-    Fits a plane of the form z = A*x + B*y + C to the given points.
-    
-    Args:
-        points: List of (x, y, z) tuples
-        
-    Returns:
-        Tuple of (A, B, C) coefficients
-        
-    Raises:
-        ValueError: If fewer than 3 points provided
-        GeometryError: If points are colinear
-        
-    Example:
-        >>> points = [(0, 0, 0), (1, 0, 1), (0, 1, 2)]
-        >>> A, B, C = fit_plane_least_squares(points)
-        >>> # z = 1*x + 2*y + 0
-    """
-    if len(points) < 3:
-        raise ValueError("Need at least 3 points to fit a plane")
-    
-    # Extract coordinates
-    points_array = np.array(points)
-    x = points_array[:, 0]
-    y = points_array[:, 1]
-    z = points_array[:, 2]
-    
-    # Build matrix for least squares
-    # We want to solve: A*x + B*y + C = z
-    A_matrix = np.column_stack([x, y, np.ones(len(points))])
-    
-    # Solve least squares
-    try:
-        coeffs, residuals, rank, s = np.linalg.lstsq(A_matrix, z, rcond=None)
-        
-        if rank < 3:
-            raise GeometryError("Points are colinear or coplanar, cannot fit unique plane")
-            
-        return float(coeffs[0]), float(coeffs[1]), float(coeffs[2])
-        
-    except np.linalg.LinAlgError as e:
-        raise GeometryError(f"Failed to fit plane: {e}")
-
-
-def bilinear_interpolate(x: float, y: float, 
-                        grid_x: np.ndarray, grid_y: np.ndarray,
-                        grid_z: np.ndarray) -> float:
-    """Perform bilinear interpolation on a regular grid.
-    
-    Args:
-        x: X coordinate to interpolate at
-        y: Y coordinate to interpolate at
-        grid_x: 1D array of x coordinates of grid
-        grid_y: 1D array of y coordinates of grid
-        grid_z: 2D array of z values at grid points [y, x]
-        
-    Returns:
-        Interpolated z value
-        
-    Raises:
-        ValueError: If point is outside grid
-        
-    Example:
-        >>> grid_x = np.array([0, 1])
-        >>> grid_y = np.array([0, 1])
-        >>> grid_z = np.array([[1, 2], [3, 4]])
-        >>> bilinear_interpolate(0.5, 0.5, grid_x, grid_y, grid_z)
-        2.5
-    """
-    # Check if point is outside grid
-    if x < grid_x[0] or x > grid_x[-1]:
-        raise ValueError(f"x={x} is outside grid range [{grid_x[0]}, {grid_x[-1]}]")
-    if y < grid_y[0] or y > grid_y[-1]:
-        raise ValueError(f"y={y} is outside grid range [{grid_y[0]}, {grid_y[-1]}]")
-    
-    # Find surrounding grid points
-    x_idx = np.searchsorted(grid_x, x) - 1
-    y_idx = np.searchsorted(grid_y, y) - 1
-    
-    # Handle edge cases
-    if x_idx < 0:
-        x_idx = 0
-    if y_idx < 0:
-        y_idx = 0
-    if x_idx >= len(grid_x) - 1:
-        x_idx = len(grid_x) - 2
-    if y_idx >= len(grid_y) - 1:
-        y_idx = len(grid_y) - 2
-    
-    # Get corner points
-    x1, x2 = grid_x[x_idx], grid_x[x_idx + 1]
-    y1, y2 = grid_y[y_idx], grid_y[y_idx + 1]
-    
-    # Get corner values
-    z11 = grid_z[y_idx, x_idx]
-    z12 = grid_z[y_idx, x_idx + 1]
-    z21 = grid_z[y_idx + 1, x_idx]
-    z22 = grid_z[y_idx + 1, x_idx + 1]
-    
-    # Bilinear interpolation formula
-    dx = x2 - x1
-    dy = y2 - y1
-    
-    if dx == 0 or dy == 0:
-        raise ValueError("Grid spacing cannot be zero")
-    
-    # Interpolate
-    result = (z11 * (x2 - x) * (y2 - y) +
-              z12 * (x - x1) * (y2 - y) +
-              z21 * (x2 - x) * (y - y1) +
-              z22 * (x - x1) * (y - y1)) / (dx * dy)
-    
-    return float(result)
-
-
-def rotate_point_2d(x: float, y: float, angle: float, 
-                    center_x: float = 0, center_y: float = 0) -> Tuple[float, float]:
-    """Rotate a 2D point around a center.
-    
-    Args:
-        x: X coordinate of point
-        y: Y coordinate of point
-        angle: Rotation angle in degrees (positive = counterclockwise)
-        center_x: X coordinate of rotation center
-        center_y: Y coordinate of rotation center
-        
-    Returns:
-        Tuple of (rotated_x, rotated_y)
-        
-    Example:
-        >>> rotate_point_2d(1, 0, 90)  # Rotate (1,0) by 90°
-        (0.0, 1.0)
-    """
-    # Convert angle to radians
-    angle_rad = math.radians(angle)
-    
-    # Translate to origin
-    x_translated = x - center_x
-    y_translated = y - center_y
-    
-    # Rotate
-    cos_angle = math.cos(angle_rad)
-    sin_angle = math.sin(angle_rad)
-    
-    x_rotated = x_translated * cos_angle - y_translated * sin_angle
-    y_rotated = x_translated * sin_angle + y_translated * cos_angle
-    
-    # Translate back
-    return x_rotated + center_x, y_rotated + center_y
-
-
-def distance_point_to_line_3d(point: np.ndarray, line_point: np.ndarray, 
-                             line_direction: np.ndarray) -> float:
-    """Calculate the distance from a point to a line in 3D.
-    
-    Args:
-        point: 3D point
-        line_point: Any point on the line
-        line_direction: Direction vector of the line
-        
-    Returns:
-        Distance from point to line
-        
-    Example:
-        >>> point = np.array([1, 1, 0])
-        >>> line_point = np.array([0, 0, 0])
-        >>> line_direction = np.array([1, 0, 0])  # X-axis
-        >>> distance_point_to_line_3d(point, line_point, line_direction)
-        1.0
-    """
-    # Vector from line point to point
-    w = point - line_point
-    
-    # Normalize line direction
-    line_dir_norm = line_direction / np.linalg.norm(line_direction)
-    
-    # Calculate perpendicular distance
-    # |w - (w·d)d| where d is normalized line direction
-    projection = np.dot(w, line_dir_norm) * line_dir_norm
-    perpendicular = w - projection
-    
-    return float(np.linalg.norm(perpendicular))
-
-
-def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
-    """Check if point is inside polygon using ray casting algorithm.
-    
-    Args:
-        point: Point coordinates (x, y)
-        polygon: List of polygon vertices as (x, y) tuples
-        
-    Returns:
-        True if point is inside polygon
-        
-    Example:
-        >>> square = [(0, 0), (1, 0), (1, 1), (0, 1)]
-        >>> point_in_polygon((0.5, 0.5), square)
-        True
-        >>> point_in_polygon((2, 2), square)
-        False
-    """
-    x, y = point
-    n = len(polygon)
-    inside = False
-
-    p1x, p1y = polygon[0]
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
-
-    return inside
\ No newline at end of file
+"""Geometric calculations for glare analysis.
+
+This module provides functions for geometric operations including:
+- Angular calculations (circular mean, azimuth)
+- Distance calculations (haversine)
+- Vector operations (normals, dot products)
+- Plane fitting and interpolation
+"""
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Tuple, Union, Optional, Sequence
+import numpy as np
+import numpy.typing as npt
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    prange = range
+
+from .models import Coordinate, Vector3D
+
+# Conversion factors and Earth radius hoisted to module level: hot paths
+# multiply by a constant instead of calling math.radians/math.degrees,
+# and numba kernels constant-fold them into the instruction stream
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+R_EARTH = 6371000.0
+
+
+class GeometryError(Exception):
+    """Exception raised for geometry calculation errors."""
+    pass
+
+
+def _unit3(v: np.ndarray) -> np.ndarray:
+    """Normalize a 3-vector with one sqrt and a scalar multiply.
+
+    np.linalg.norm dispatches through LAPACK's overflow-guarded nrm2,
+    which is overkill for the well-scaled 3-vectors used here.
+    """
+    d = v[0] * v[0] + v[1] * v[1] + v[2] * v[2]
+    return v * (1.0 / math.sqrt(d))
+
+
+def circular_mean(angles: Sequence[float]) -> float:
+    """Calculate the circular mean of angles.
+    
+    This function correctly handles the circular nature of angles where
+    0° = 360°. For example, the mean of 350° and 10° is 0°, not 180°.
+    
+    Args:
+        angles: Sequence of angles in degrees
+        
+    Returns:
+        Circular mean angle in degrees (0-360)
+        
+    Raises:
+        ValueError: If angles list is empty
+        
+    Example:
+        >>> circular_mean([350, 10])
+        0.0
+        >>> circular_mean([90, 180, 270])
+        180.0
+    """
+    angles_rad = np.deg2rad(np.asarray(angles, dtype=np.float64))
+    if angles_rad.size == 0:
+        raise ValueError("Cannot calculate circular mean of empty list")
+
+    # sin/cos run as single SIMD passes over the array instead of a
+    # Python-level math call per element
+    sin_mean = np.sin(angles_rad).mean()
+    cos_mean = np.cos(angles_rad).mean()
+
+    # Convert back to degrees and ensure 0-360 range
+    return (math.atan2(sin_mean, cos_mean) * RAD2DEG) % 360.0
+
+
+def recenter_azimuth(az: float, center_az: float) -> float:
+    """Recenter an azimuth angle around a given center.
+    
+    This function recenters an azimuth angle to be within ±180° of
+    a center azimuth. Useful for avoiding discontinuities at 0°/360°.
+    
+    Args:
+        az: Azimuth angle to recenter (degrees), scalar or np.ndarray
+        center_az: Center azimuth (degrees)
+
+    Returns:
+        Recentered azimuth in range [-180, 180); an offset of exactly
+        +180 maps to -180
+
+    Example:
+        >>> recenter_azimuth(10, 180)
+        -170.0
+        >>> recenter_azimuth(350, 180)
+        170.0
+    """
+    # Branchless wrap: single modulo instead of data-dependent loops,
+    # and the same expression works element-wise on arrays
+    return ((az - center_az + 180.0) % 360.0) - 180.0
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the great circle distance between two points on Earth.
+    
+    Uses the haversine formula to calculate distance accounting for
+    Earth's spherical shape.
+    
+    Args:
+        lat1: Latitude of first point (degrees)
+        lon1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lon2: Longitude of second point (degrees)
+        
+    Returns:
+        Distance in meters
+        
+    Example:
+        >>> haversine(52.5200, 13.4050, 48.1351, 11.5820)  # Berlin to Munich
+        504238.7
+    """
+    # Convert to radians
+    lat1 *= DEG2RAD
+    lon1 *= DEG2RAD
+    lat2 *= DEG2RAD
+    lon2 *= DEG2RAD
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    # asin form: one sqrt instead of two plus atan2; the clamp absorbs
+    # floating-point overshoot past 1.0
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
+
+    return R_EARTH * c
+
+
+def haversine_vec(
+    lat1: Union[float, np.ndarray],
+    lon1: Union[float, np.ndarray],
+    lat2: Union[float, np.ndarray],
+    lon2: Union[float, np.ndarray]
+) -> np.ndarray:
+    """Vectorized haversine distance for arrays of point pairs.
+
+    Accepts scalars or arrays of any broadcastable shape; each formula
+    step runs as one NumPy ufunc over the whole batch instead of a
+    Python-level call per pair.
+
+    Args:
+        lat1: Latitudes of first points (degrees)
+        lon1: Longitudes of first points (degrees)
+        lat2: Latitudes of second points (degrees)
+        lon2: Longitudes of second points (degrees)
+
+    Returns:
+        Array of distances in meters (scalar inputs yield a 0-d array)
+
+    Example:
+        >>> haversine_vec([52.5200], [13.4050], [48.1351], [11.5820])
+        array([504238.7...])
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))
+
+    a = (np.sin((lat2 - lat1) * 0.5) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2)
+
+    return R_EARTH * 2.0 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def calculate_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the azimuth from point 1 to point 2.
+    
+    Args:
+        lat1: Latitude of start point (degrees)
+        lon1: Longitude of start point (degrees)
+        lat2: Latitude of end point (degrees)
+        lon2: Longitude of end point (degrees)
+        
+    Returns:
+        Azimuth in degrees (0-360, where 0=North, 90=East)
+        
+    Example:
+        >>> calculate_azimuth(0, 0, 1, 0)  # North
+        0.0
+        >>> calculate_azimuth(0, 0, 0, 1)  # East
+        90.0
+    """
+    # Convert to radians
+    lat1 *= DEG2RAD
+    lon1 *= DEG2RAD
+    lat2 *= DEG2RAD
+    lon2 *= DEG2RAD
+
+    # Calculate bearing
+    dlon = lon2 - lon1
+    y = math.sin(dlon) * math.cos(lat2)
+    x = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dlon)
+    
+    # Calculate azimuth
+    azimuth = math.atan2(y, x)
+    
+    # Convert to degrees and normalize to 0-360
+    return (azimuth * RAD2DEG + 360) % 360
+
+
+def haversine_nb(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Scalar haversine for callers that loop in Python.
+
+    Numba-compiled to native code when numba is installed (the array
+    variant haversine_vec does not help callers iterating row by row);
+    without numba this is a plain-Python twin of haversine.
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lon1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lon2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in meters
+    """
+    # DEG2RAD constant-folds under numba
+    lat1 = lat1 * DEG2RAD
+    lon1 = lon1 * DEG2RAD
+    lat2 = lat2 * DEG2RAD
+    lon2 = lon2 * DEG2RAD
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
+
+    return R_EARTH * c
+
+
+if NUMBA_AVAILABLE:
+    haversine_nb = njit(cache=True, fastmath=True)(haversine_nb)
+
+
+def calculate_azimuth_vec(
+    lat1: Union[float, np.ndarray],
+    lon1: Union[float, np.ndarray],
+    lat2: Union[float, np.ndarray],
+    lon2: Union[float, np.ndarray]
+) -> np.ndarray:
+    """Vectorized azimuth calculation for arrays of point pairs.
+
+    Args:
+        lat1: Latitudes of start points (degrees)
+        lon1: Longitudes of start points (degrees)
+        lat2: Latitudes of end points (degrees)
+        lon2: Longitudes of end points (degrees)
+
+    Returns:
+        Array of azimuths in degrees (0-360, where 0=North, 90=East)
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))
+
+    dlon = lon2 - lon1
+    y = np.sin(dlon) * np.cos(lat2)
+    x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+
+    return np.mod(np.degrees(np.arctan2(y, x)) + 360.0, 360.0)
+
+
+def haversine_and_azimuth_vec(
+    lat1: Union[float, np.ndarray],
+    lon1: Union[float, np.ndarray],
+    lat2: Union[float, np.ndarray],
+    lon2: Union[float, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute distances and azimuths for point pairs in one fused pass.
+
+    Callers that need both values per pair (common in glare analysis)
+    would otherwise evaluate the same six sin/cos terms twice; here each
+    trigonometric term is computed once and feeds both formulas. The
+    haversine term reuses cos(dlat)/cos(dlon) via the half-angle
+    identity sin²(t/2) = (1 - cos(t)) / 2.
+
+    Args:
+        lat1: Latitudes of first points (degrees)
+        lon1: Longitudes of first points (degrees)
+        lat2: Latitudes of second points (degrees)
+        lon2: Longitudes of second points (degrees)
+
+    Returns:
+        Tuple of (distances in meters, azimuths in degrees 0-360)
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lon2, dtype=np.float64))
+
+    dlon = lon2 - lon1
+
+    s1, c1 = np.sin(lat1), np.cos(lat1)
+    s2, c2 = np.sin(lat2), np.cos(lat2)
+    sdl, cdl = np.sin(dlon), np.cos(dlon)
+
+    # cos(dlat) from the already-computed lat terms: cos(a-b) = ca*cb + sa*sb
+    cos_dlat = c1 * c2 + s1 * s2
+    a = 0.5 * (1.0 - cos_dlat) + c1 * c2 * 0.5 * (1.0 - cdl)
+    distances = R_EARTH * 2.0 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    y = sdl * c2
+    x = c1 * s2 - s1 * c2 * cdl
+    azimuths = np.mod(np.degrees(np.arctan2(y, x)) + 360.0, 360.0)
+
+    return distances, azimuths
+
+
+def compute_glare_geometry(
+    sun_az: np.ndarray,
+    sun_el: np.ndarray,
+    pan_az: float,
+    pan_tilt: float,
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fused sun-panel sweep: incidence angles plus observer distances/azimuths.
+
+    Bundles the three hottest per-run computations into one call so the
+    whole sweep is a handful of array passes: incidence angles for the
+    sun-position batch against one panel orientation, and distances and
+    azimuths from the observer to the target points (sharing their trig
+    terms via the fused kernel).
+
+    Args:
+        sun_az: Sun azimuths in degrees
+        sun_el: Sun elevations in degrees
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+        lat0: Observer latitude in degrees
+        lon0: Observer longitude in degrees
+        lats: Target latitudes in degrees
+        lons: Target longitudes in degrees
+
+    Returns:
+        Tuple of (incidence angles in degrees, distances in meters,
+        azimuths in degrees 0-360)
+    """
+    incidence = calculate_incidence_angles(sun_az, sun_el, pan_az, pan_tilt)
+    distances, azimuths = haversine_and_azimuth_vec(lat0, lon0, lats, lons)
+    return incidence, distances, azimuths
+
+
+def make_observer_kernels(lat0: float, lon0: float):
+    """Build distance and azimuth kernels specialized for a fixed observer.
+
+    Glare analyses probe many targets from one observer location, so the
+    observer's radian coordinates and sin/cos terms are evaluated once
+    here instead of on every call. When numba is installed the inner
+    functions are JIT-compiled with the captured values folded in as
+    constants.
+
+    Args:
+        lat0: Observer latitude in degrees
+        lon0: Observer longitude in degrees
+
+    Returns:
+        Tuple of (haversine_from, azimuth_from) functions, each taking
+        (lat, lon) in degrees for the target point
+    """
+    lat0_rad = lat0 * DEG2RAD
+    lon0_rad = lon0 * DEG2RAD
+    s0 = math.sin(lat0_rad)
+    c0 = math.cos(lat0_rad)
+
+    def haversine_from(lat2: float, lon2: float) -> float:
+        lat2 = lat2 * DEG2RAD
+        dlat = lat2 - lat0_rad
+        dlon = lon2 * DEG2RAD - lon0_rad
+        a = math.sin(dlat / 2) ** 2 + c0 * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        return R_EARTH * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
+    def azimuth_from(lat2: float, lon2: float) -> float:
+        lat2 = lat2 * DEG2RAD
+        dlon = lon2 * DEG2RAD - lon0_rad
+        c2 = math.cos(lat2)
+        y = math.sin(dlon) * c2
+        x = c0 * math.sin(lat2) - s0 * c2 * math.cos(dlon)
+        return (math.atan2(y, x) * RAD2DEG + 360.0) % 360.0
+
+    if NUMBA_AVAILABLE:
+        # Closure variables compile into the instruction stream as
+        # constants; disk caching is unavailable for closures
+        haversine_from = njit(fastmath=True)(haversine_from)
+        azimuth_from = njit(fastmath=True)(azimuth_from)
+
+    return haversine_from, azimuth_from
+
+
+def get_panel_normal(pan_az: float, pan_tilt: float) -> np.ndarray:
+    """Calculate the normal vector of a tilted panel.
+    
+    The normal vector points outward from the panel surface.
+    For a horizontal panel (tilt=0), the normal points straight up (0,0,1).
+    
+    Args:
+        pan_az: Panel azimuth in degrees (0=North, 90=East, 180=South)
+        pan_tilt: Panel tilt in degrees (0=horizontal, 90=vertical)
+        
+    Returns:
+        3D normal vector as numpy array [x, y, z]
+        
+    Example:
+        >>> get_panel_normal(180, 0)  # Horizontal panel
+        array([0., 0., 1.])
+        >>> get_panel_normal(180, 90)  # Vertical south-facing
+        array([0., -1., 0.])
+    """
+    return _panel_normal_cached(pan_az, pan_tilt)
+
+
+@lru_cache(maxsize=4096)
+def _panel_normal_cached(pan_az: float, pan_tilt: float) -> np.ndarray:
+    """Compute and cache a panel normal for a unique (azimuth, tilt) pair.
+
+    Glare loops evaluate a handful of distinct panel orientations against
+    a huge number of sun positions; caching saves the two sin and two cos
+    per repeated call. The returned array is read-only so all callers can
+    safely share the cached instance.
+    """
+    az_rad = pan_az * DEG2RAD
+    tilt_rad = pan_tilt * DEG2RAD
+
+    # Calculate normal vector components
+    # For a south-facing panel (az=180°), the normal should point south (negative y)
+    # x: East-West component (positive = East)
+    # y: North-South component (positive = North)
+    # z: Vertical component (positive = Up)
+    sin_tilt = math.sin(tilt_rad)
+    normal = np.array([
+        -math.sin(az_rad) * sin_tilt,
+        math.cos(az_rad) * sin_tilt,
+        math.cos(tilt_rad)
+    ])
+    normal.flags.writeable = False
+    return normal
+
+
+# sin/cos lookup tables at 0.1° resolution (two float64 arrays of 3600
+# entries, ~57 KB total) for workloads that sweep discretized angles;
+# worst-case error is ~1e-4, well inside glare-analysis tolerances
+_SINCOS_STEPS_PER_DEG = 10
+_TBL_RAD = np.deg2rad(np.arange(360 * _SINCOS_STEPS_PER_DEG) / _SINCOS_STEPS_PER_DEG)
+_SIN_TBL = np.sin(_TBL_RAD)
+_COS_TBL = np.cos(_TBL_RAD)
+
+
+def _sincos_deg(deg: float) -> Tuple[float, float]:
+    """Look up (sin, cos) of an angle in degrees at 0.1° resolution."""
+    i = int(round(deg * _SINCOS_STEPS_PER_DEG)) % (360 * _SINCOS_STEPS_PER_DEG)
+    return _SIN_TBL[i], _COS_TBL[i]
+
+
+def get_panel_normal_fast(pan_az: float, pan_tilt: float) -> np.ndarray:
+    """LUT-based panel normal for discretized angle sweeps.
+
+    Replaces the four transcendental calls with table lookups; intended
+    for callers that sweep azimuth/tilt on a fixed grid (e.g. 1° or
+    0.1° steps) where the ~1e-4 table error is irrelevant. Continuous
+    angles (like sun elevation) should keep using get_panel_normal.
+
+    Args:
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+
+    Returns:
+        3D normal vector as numpy array [x, y, z]
+    """
+    sin_az, cos_az = _sincos_deg(pan_az)
+    sin_tilt, cos_tilt = _sincos_deg(pan_tilt)
+    return np.array([-sin_az * sin_tilt, cos_az * sin_tilt, cos_tilt])
+
+
+def get_panel_normal_array(
+    pan_az: np.ndarray,
+    pan_tilt: np.ndarray
+) -> np.ndarray:
+    """Calculate normal vectors for many panels in one vectorized pass.
+
+    Args:
+        pan_az: Panel azimuths in degrees
+        pan_tilt: Panel tilts in degrees
+
+    Returns:
+        Contiguous array of shape (N, 3) with rows [x, y, z]
+    """
+    az_rad = np.radians(np.asarray(pan_az, dtype=np.float64))
+    tilt_rad = np.radians(np.asarray(pan_tilt, dtype=np.float64))
+
+    sin_tilt = np.sin(tilt_rad)
+    normals = np.empty((az_rad.shape[0], 3), dtype=np.float64)
+    normals[:, 0] = -np.sin(az_rad) * sin_tilt
+    normals[:, 1] = np.cos(az_rad) * sin_tilt
+    normals[:, 2] = np.cos(tilt_rad)
+    return normals
+
+
+def get_panel_normal_into(pan_az: float, pan_tilt: float, out: np.ndarray) -> None:
+    """Write a panel normal into a caller-provided buffer.
+
+    Skips the per-call np.array allocation of get_panel_normal; hot
+    loops preallocate one (N, 3) buffer and fill it row by row (or use
+    get_panel_normal_array to fill it in one pass).
+
+    Args:
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+        out: Writable array of at least 3 elements receiving [x, y, z]
+    """
+    az_rad = pan_az * DEG2RAD
+    tilt_rad = pan_tilt * DEG2RAD
+
+    sin_tilt = math.sin(tilt_rad)
+    out[0] = -math.sin(az_rad) * sin_tilt
+    out[1] = math.cos(az_rad) * sin_tilt
+    out[2] = math.cos(tilt_rad)
+
+
+def get_sun_vector(sun_az: float, sun_el: float) -> np.ndarray:
+    """Calculate the unit vector from sun to observer.
+    
+    The vector points from the sun towards the ground/observer.
+    
+    Args:
+        sun_az: Sun azimuth in degrees (0=North, 90=East, 180=South)
+        sun_el: Sun elevation in degrees (0=horizon, 90=zenith)
+        
+    Returns:
+        3D sun vector as numpy array [x, y, z]
+        
+    Example:
+        >>> get_sun_vector(180, 45)  # Sun in south at 45° elevation
+        array([0., -0.707, -0.707])
+    """
+    # Convert to radians
+    az_rad = sun_az * DEG2RAD
+    el_rad = sun_el * DEG2RAD
+    
+    # Calculate sun vector components (from sun to ground)
+    # When sun is in the south (az=180), the vector should point north (positive y)
+    # x: East-West component
+    # y: North-South component  
+    # z: Vertical component (negative because pointing down)
+    x = math.sin(az_rad) * math.cos(el_rad)
+    y = -math.cos(az_rad) * math.cos(el_rad)
+    z = -math.sin(el_rad)
+    
+    return np.array([x, y, z])
+
+
+def get_sun_vector_into(sun_az: float, sun_el: float, out: np.ndarray) -> None:
+    """Write a sun vector into a caller-provided buffer.
+
+    Allocation-free counterpart of get_sun_vector for per-timestep
+    loops that reuse one output row.
+
+    Args:
+        sun_az: Sun azimuth in degrees
+        sun_el: Sun elevation in degrees
+        out: Writable array of at least 3 elements receiving [x, y, z]
+    """
+    az_rad = sun_az * DEG2RAD
+    el_rad = sun_el * DEG2RAD
+
+    cos_el = math.cos(el_rad)
+    out[0] = math.sin(az_rad) * cos_el
+    out[1] = -math.cos(az_rad) * cos_el
+    out[2] = -math.sin(el_rad)
+
+
+def calculate_incidence_angle(sun_az: float, sun_el: float, 
+                            pan_az: float, pan_tilt: float) -> float:
+    """Calculate the angle of incidence of sunlight on a panel.
+    
+    The incidence angle is the angle between the incoming sunlight
+    and the panel normal. 0° means perpendicular (direct) incidence.
+    
+    Args:
+        sun_az: Sun azimuth in degrees
+        sun_el: Sun elevation in degrees
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+        
+    Returns:
+        Incidence angle in degrees (0-180)
+        
+    Example:
+        >>> calculate_incidence_angle(180, 30, 180, 30)  # Optimal alignment
+        0.0
+    """
+    # Get vectors (note: sun vector points from sun to ground, so its
+    # negation points from the ground toward the sun)
+    sun_vec = get_sun_vector(sun_az, sun_el)
+    panel_normal = get_panel_normal(pan_az, pan_tilt)
+
+    # atan2(|cross|, dot) is stable near 0° and 180° where acos(dot)
+    # loses precision, and needs no clamp for floating-point overshoot
+    cos_angle = -float(np.dot(sun_vec, panel_normal))
+    cross = np.cross(-sun_vec, panel_normal)
+    sin_angle = math.sqrt(float(np.dot(cross, cross)))
+
+    return math.atan2(sin_angle, cos_angle) * RAD2DEG
+
+
+def calculate_incidence_angles(
+    sun_az: Union[float, np.ndarray],
+    sun_el: Union[float, np.ndarray],
+    pan_az: Union[float, np.ndarray],
+    pan_tilt: Union[float, np.ndarray]
+) -> np.ndarray:
+    """Calculate incidence angles for broadcastable batches of inputs.
+
+    Uses the closed form of the sun-vector/panel-normal dot product,
+    cos(angle) = sin(el)·cos(tilt) + cos(el)·cos(sun_az - pan_az)·sin(tilt),
+    so no intermediate 3-vectors are allocated — the whole batch is a
+    handful of ufunc passes.
+
+    Args:
+        sun_az: Sun azimuths in degrees
+        sun_el: Sun elevations in degrees
+        pan_az: Panel azimuths in degrees
+        pan_tilt: Panel tilts in degrees
+
+    Returns:
+        Array of incidence angles in degrees (0-180)
+
+    Example:
+        >>> calculate_incidence_angles([180.0], [30.0], 180.0, 30.0)
+        array([0.])
+    """
+    sun_az = np.radians(np.asarray(sun_az, dtype=np.float64))
+    sun_el = np.radians(np.asarray(sun_el, dtype=np.float64))
+    pan_az = np.radians(np.asarray(pan_az, dtype=np.float64))
+    pan_tilt = np.radians(np.asarray(pan_tilt, dtype=np.float64))
+
+    cos_angle = (np.sin(sun_el) * np.cos(pan_tilt) +
+                 np.cos(sun_el) * np.cos(sun_az - pan_az) * np.sin(pan_tilt))
+
+    # Clamp in place to absorb floating-point overshoot before arccos
+    np.clip(cos_angle, -1.0, 1.0, out=cos_angle)
+    return np.degrees(np.arccos(cos_angle))
+
+
+def calculate_angle_between_vectors(v1: np.ndarray, v2: np.ndarray) -> float:
+    """Calculate the angle between two vectors in degrees.
+    
+    Args:
+        v1: First vector
+        v2: Second vector
+        
+    Returns:
+        Angle between vectors in degrees (0-180)
+        
+    Example:
+        >>> v1 = np.array([1, 0, 0])
+        >>> v2 = np.array([0, 1, 0])
+        >>> calculate_angle_between_vectors(v1, v2)
+        90.0
+    """
+    # Normalize vectors
+    v1_norm = _unit3(v1)
+    v2_norm = _unit3(v2)
+
+    # atan2(|cross|, dot) is accurate across the full 0-180° range,
+    # where acos(dot) degrades near the endpoints, and the clamp for
+    # floating-point overshoot becomes unnecessary
+    cross = np.cross(v1_norm, v2_norm)
+    sin_angle = math.sqrt(float(np.dot(cross, cross)))
+    cos_angle = float(np.dot(v1_norm, v2_norm))
+
+    return math.atan2(sin_angle, cos_angle) * RAD2DEG
+
+
+def fit_plane_least_squares(points: List[Tuple[float, float, float]]) -> Tuple[float, float, float]:
+    """Fit a plane through 3D points using least squares.
+    
+    Fits a plane of the form z = A*x + B*y + C to the given points.
+    
+    Args:
+        points: List of (x, y, z) tuples
+        
+    Returns:
+        Tuple of (A, B, C) coefficients
+        
+    Raises:
+        ValueError: If fewer than 3 points provided
+        GeometryError: If points are colinear
+        
+    Example:
+        >>> points = [(0, 0, 0), (1, 0, 1), (0, 1, 2)]
+        >>> A, B, C = fit_plane_least_squares(points)
+        >>> # z = 1*x + 2*y + 0
+    """
+    if len(points) < 3:
+        raise ValueError("Need at least 3 points to fit a plane")
+
+    # Extract coordinates
+    points_array = np.array(points)
+    x = points_array[:, 0]
+    y = points_array[:, 1]
+    z = points_array[:, 2]
+
+    # Normal equations: for z = A*x + B*y + C the 3x3 system
+    # (AtA) @ coeffs = Atb is exact, and a 3x3 LU solve is far cheaper
+    # than the SVD np.linalg.lstsq runs for the typical handful of
+    # corner points per PV area
+    n = float(len(points))
+    sx, sy, sz = x.sum(), y.sum(), z.sum()
+    ata = np.array([
+        [x @ x, x @ y, sx],
+        [x @ y, y @ y, sy],
+        [sx, sy, n]
+    ])
+    atb = np.array([x @ z, y @ z, sz])
+
+    if abs(np.linalg.det(ata)) < 1e-10:
+        raise GeometryError("Points are colinear or coplanar, cannot fit unique plane")
+
+    try:
+        coeffs = np.linalg.solve(ata, atb)
+        return float(coeffs[0]), float(coeffs[1]), float(coeffs[2])
+
+    except np.linalg.LinAlgError as e:
+        raise GeometryError(f"Failed to fit plane: {e}")
+
+
+def bilinear_interpolate(x: float, y: float, 
+                        grid_x: np.ndarray, grid_y: np.ndarray,
+                        grid_z: np.ndarray) -> float:
+    """Perform bilinear interpolation on a regular grid.
+    
+    Args:
+        x: X coordinate to interpolate at
+        y: Y coordinate to interpolate at
+        grid_x: 1D array of x coordinates of grid
+        grid_y: 1D array of y coordinates of grid
+        grid_z: 2D array of z values at grid points [y, x]
+        
+    Returns:
+        Interpolated z value
+        
+    Raises:
+        ValueError: If point is outside grid
+        
+    Example:
+        >>> grid_x = np.array([0, 1])
+        >>> grid_y = np.array([0, 1])
+        >>> grid_z = np.array([[1, 2], [3, 4]])
+        >>> bilinear_interpolate(0.5, 0.5, grid_x, grid_y, grid_z)
+        2.5
+    """
+    # Check if point is outside grid
+    if x < grid_x[0] or x > grid_x[-1]:
+        raise ValueError(f"x={x} is outside grid range [{grid_x[0]}, {grid_x[-1]}]")
+    if y < grid_y[0] or y > grid_y[-1]:
+        raise ValueError(f"y={y} is outside grid range [{grid_y[0]}, {grid_y[-1]}]")
+    
+    # Find surrounding grid points; min/max clamp replaces the four
+    # edge-case branches
+    x_idx = min(max(int(np.searchsorted(grid_x, x)) - 1, 0), len(grid_x) - 2)
+    y_idx = min(max(int(np.searchsorted(grid_y, y)) - 1, 0), len(grid_y) - 2)
+    
+    # Get corner points
+    x1, x2 = grid_x[x_idx], grid_x[x_idx + 1]
+    y1, y2 = grid_y[y_idx], grid_y[y_idx + 1]
+    
+    # Get corner values
+    z11 = grid_z[y_idx, x_idx]
+    z12 = grid_z[y_idx, x_idx + 1]
+    z21 = grid_z[y_idx + 1, x_idx]
+    z22 = grid_z[y_idx + 1, x_idx + 1]
+    
+    # Bilinear interpolation formula
+    dx = x2 - x1
+    dy = y2 - y1
+    
+    if dx == 0 or dy == 0:
+        raise ValueError("Grid spacing cannot be zero")
+
+    # Interpolate; one reciprocal then multiplies instead of a divide
+    # in the accumulation
+    inv_area = 1.0 / (dx * dy)
+    result = (z11 * (x2 - x) * (y2 - y) +
+              z12 * (x - x1) * (y2 - y) +
+              z21 * (x2 - x) * (y - y1) +
+              z22 * (x - x1) * (y - y1)) * inv_area
+
+    return float(result)
+
+
+def bilinear_interpolate_vec(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    grid_x: np.ndarray,
+    grid_y: np.ndarray,
+    grid_z: np.ndarray
+) -> np.ndarray:
+    """Bilinear interpolation for batches of query points.
+
+    One searchsorted per axis covers the entire batch, edge handling is
+    a vectorized clip, and the four corner values are gathered with
+    fancy indexing — versus one Python call with scalar branches per
+    point in bilinear_interpolate.
+
+    Args:
+        xs: X coordinates to interpolate at
+        ys: Y coordinates to interpolate at
+        grid_x: 1D array of x coordinates of grid
+        grid_y: 1D array of y coordinates of grid
+        grid_z: 2D array of z values at grid points [y, x]
+
+    Returns:
+        Array of interpolated z values
+
+    Raises:
+        ValueError: If any point is outside the grid
+
+    Example:
+        >>> grid_x = np.array([0, 1])
+        >>> grid_y = np.array([0, 1])
+        >>> grid_z = np.array([[1, 2], [3, 4]])
+        >>> bilinear_interpolate_vec([0.5], [0.5], grid_x, grid_y, grid_z)
+        array([2.5])
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    if np.any((xs < grid_x[0]) | (xs > grid_x[-1])):
+        raise ValueError(f"x values outside grid range [{grid_x[0]}, {grid_x[-1]}]")
+    if np.any((ys < grid_y[0]) | (ys > grid_y[-1])):
+        raise ValueError(f"y values outside grid range [{grid_y[0]}, {grid_y[-1]}]")
+
+    ix = np.clip(np.searchsorted(grid_x, xs) - 1, 0, grid_x.size - 2)
+    iy = np.clip(np.searchsorted(grid_y, ys) - 1, 0, grid_y.size - 2)
+
+    x1 = grid_x[ix]
+    y1 = grid_y[iy]
+    wx = (xs - x1) / (grid_x[ix + 1] - x1)
+    wy = (ys - y1) / (grid_y[iy + 1] - y1)
+
+    z11 = grid_z[iy, ix]
+    z12 = grid_z[iy, ix + 1]
+    z21 = grid_z[iy + 1, ix]
+    z22 = grid_z[iy + 1, ix + 1]
+
+    return (z11 * (1.0 - wx) * (1.0 - wy) +
+            z12 * wx * (1.0 - wy) +
+            z21 * (1.0 - wx) * wy +
+            z22 * wx * wy)
+
+
+def rotate_point_2d(x: float, y: float, angle: float,
+                    center_x: float = 0, center_y: float = 0) -> Tuple[float, float]:
+    """Rotate a 2D point around a center.
+    
+    Args:
+        x: X coordinate of point
+        y: Y coordinate of point
+        angle: Rotation angle in degrees (positive = counterclockwise)
+        center_x: X coordinate of rotation center
+        center_y: Y coordinate of rotation center
+        
+    Returns:
+        Tuple of (rotated_x, rotated_y)
+        
+    Example:
+        >>> rotate_point_2d(1, 0, 90)  # Rotate (1,0) by 90°
+        (0.0, 1.0)
+    """
+    # Convert angle to radians
+    angle_rad = angle * DEG2RAD
+    
+    # Translate to origin
+    x_translated = x - center_x
+    y_translated = y - center_y
+    
+    # Rotate
+    cos_angle = math.cos(angle_rad)
+    sin_angle = math.sin(angle_rad)
+    
+    x_rotated = x_translated * cos_angle - y_translated * sin_angle
+    y_rotated = x_translated * sin_angle + y_translated * cos_angle
+    
+    # Translate back
+    return x_rotated + center_x, y_rotated + center_y
+
+
+def rotate_points_2d(
+    points: np.ndarray,
+    angle: float,
+    center: Tuple[float, float] = (0.0, 0.0)
+) -> np.ndarray:
+    """Rotate many 2D points around a center with a single matrix.
+
+    Computes sin/cos of the angle once and applies the 2x2 rotation to
+    the whole batch as one matmul, instead of re-evaluating the trig
+    per point as rotate_point_2d does.
+
+    Args:
+        points: Array of shape (N, 2) with point (x, y) pairs
+        angle: Rotation angle in degrees (positive = counterclockwise)
+        center: Rotation center (x, y)
+
+    Returns:
+        Array of shape (N, 2) with the rotated points
+
+    Example:
+        >>> rotate_points_2d(np.array([[1.0, 0.0]]), 90)
+        array([[0., 1.]])
+    """
+    pts = np.asarray(points, dtype=np.float64)
+
+    angle_rad = angle * DEG2RAD
+    c = math.cos(angle_rad)
+    s = math.sin(angle_rad)
+    rotation = np.array([[c, -s], [s, c]])
+
+    centered = pts - center
+    return centered @ rotation.T + center
+
+
+def distance_point_to_line_3d(point: np.ndarray, line_point: np.ndarray, 
+                             line_direction: np.ndarray) -> float:
+    """Calculate the distance from a point to a line in 3D.
+    
+    Args:
+        point: 3D point
+        line_point: Any point on the line
+        line_direction: Direction vector of the line
+        
+    Returns:
+        Distance from point to line
+        
+    Example:
+        >>> point = np.array([1, 1, 0])
+        >>> line_point = np.array([0, 0, 0])
+        >>> line_direction = np.array([1, 0, 0])  # X-axis
+        >>> distance_point_to_line_3d(point, line_point, line_direction)
+        1.0
+    """
+    # Vector from line point to point
+    w = point - line_point
+
+    # Normalize line direction
+    line_dir_norm = _unit3(line_direction)
+
+    # Calculate perpendicular distance
+    # |w - (w·d)d| where d is normalized line direction
+    projection = np.dot(w, line_dir_norm) * line_dir_norm
+    perpendicular = w - projection
+
+    return math.sqrt(float(np.dot(perpendicular, perpendicular)))
+
+
+def distances_points_to_line_3d(
+    points: np.ndarray,
+    line_point: np.ndarray,
+    line_direction: np.ndarray
+) -> np.ndarray:
+    """Calculate distances from many points to one line in 3D.
+
+    Normalizes the direction once and uses the cross-product form
+    |w x d| over the whole batch, so the per-point work is a vectorized
+    cross product and a squared-sum reduction.
+
+    Args:
+        points: Array of shape (N, 3) with the test points
+        line_point: Any point on the line
+        line_direction: Direction vector of the line
+
+    Returns:
+        Array of N distances
+
+    Example:
+        >>> pts = np.array([[1.0, 1.0, 0.0], [0.0, 2.0, 0.0]])
+        >>> distances_points_to_line_3d(pts, np.zeros(3), np.array([1.0, 0.0, 0.0]))
+        array([1., 2.])
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    direction = _unit3(np.asarray(line_direction, dtype=np.float64))
+
+    w = pts - line_point
+    cross = np.cross(w, direction)
+    return np.sqrt(np.einsum('ij,ij->i', cross, cross))
+
+
+def point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
+    """Check if point is inside polygon using ray casting algorithm.
+    
+    Args:
+        point: Point coordinates (x, y)
+        polygon: List of polygon vertices as (x, y) tuples
+        
+    Returns:
+        True if point is inside polygon
+        
+    Example:
+        >>> square = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        >>> point_in_polygon((0.5, 0.5), square)
+        True
+        >>> point_in_polygon((2, 2), square)
+        False
+    """
+    x, y = point
+    inside = False
+
+    # Start from the closing edge so the walk needs no modular index
+    p1x, p1y = polygon[-1]
+    for p2x, p2y in polygon:
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x, p1y = p2x, p2y
+
+    return inside
+
+
+def _point_in_polygon_kernel(x: float, y: float,
+                             poly_x: np.ndarray, poly_y: np.ndarray) -> bool:
+    """Ray-cast test against SoA polygon arrays (same semantics as above)."""
+    n = poly_x.shape[0]
+    inside = False
+    xinters = 0.0
+
+    # Start from the closing edge: the loop index stays in [0, n) so no
+    # per-edge modulo is needed and numba can elide bounds checks
+    p1x = poly_x[n - 1]
+    p1y = poly_y[n - 1]
+    for i in range(n):
+        p2x = poly_x[i]
+        p2y = poly_y[i]
+        if y > min(p1y, p2y):
+            if y <= max(p1y, p2y):
+                if x <= max(p1x, p2x):
+                    if p1y != p2y:
+                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    if p1x == p2x or x <= xinters:
+                        inside = not inside
+        p1x = p2x
+        p1y = p2y
+
+    return inside
+
+
+def _points_in_polygon_kernel(xs: np.ndarray, ys: np.ndarray,
+                              poly_x: np.ndarray, poly_y: np.ndarray,
+                              out: np.ndarray) -> None:
+    """Batched ray-cast; prange parallelizes the point loop under numba."""
+    for i in prange(xs.shape[0]):
+        out[i] = _point_in_polygon_kernel(xs[i], ys[i], poly_x, poly_y)
+
+
+if NUMBA_AVAILABLE:
+    # Compile the ray-cast to native code: the per-edge branchy loop is
+    # interpreter-bound in pure Python, and the batch over points is
+    # embarrassingly parallel
+    _point_in_polygon_kernel = njit(cache=True, fastmath=True)(_point_in_polygon_kernel)
+    _points_in_polygon_kernel = njit(cache=True, parallel=True)(_points_in_polygon_kernel)
+
+
+@dataclass
+class Polygon:
+    """Polygon stored as parallel coordinate arrays for fast hit tests.
+
+    The list-of-tuples representation pays per-element tuple indexing in
+    every edge walk; storing the vertices as two contiguous float64
+    columns (plus cached rolled copies for the edge endpoints) lets the
+    containment tests run as stride-1 array operations.
+
+    Attributes:
+        xs: X coordinates of the vertices
+        ys: Y coordinates of the vertices
+    """
+
+    xs: np.ndarray
+    ys: np.ndarray
+    xs_next: np.ndarray = field(init=False, repr=False)
+    ys_next: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.xs = np.ascontiguousarray(self.xs, dtype=np.float64)
+        self.ys = np.ascontiguousarray(self.ys, dtype=np.float64)
+        # Edge endpoints, precomputed once so containment tests need no
+        # per-edge modular indexing
+        self.xs_next = np.roll(self.xs, -1)
+        self.ys_next = np.roll(self.ys, -1)
+
+    @classmethod
+    def from_points(cls, points: List[Tuple[float, float]]) -> "Polygon":
+        """Build a Polygon from a list of (x, y) vertex tuples."""
+        arr = np.asarray(points, dtype=np.float64)
+        return cls(xs=arr[:, 0], ys=arr[:, 1])
+
+    def contains_point(self, x: float, y: float) -> bool:
+        """Test a single point via the scalar ray-cast kernel."""
+        return bool(_point_in_polygon_kernel(x, y, self.xs, self.ys))
+
+    def contains_points(self, points_xy: np.ndarray) -> np.ndarray:
+        """Test many points with one broadcast edge-crossing evaluation.
+
+        Evaluates the crossing condition for all (point, edge) pairs at
+        once and reduces with XOR along the edge axis — no Python loop
+        at all, at the cost of an (M, V) temporary.
+
+        Args:
+            points_xy: Array of shape (M, 2) with point (x, y) pairs
+
+        Returns:
+            Boolean array of length M, True where the point is inside
+        """
+        pts = np.asarray(points_xy, dtype=np.float64)
+        x = pts[:, 0][:, None]
+        y = pts[:, 1][:, None]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = (self.ys > y) != (self.ys_next > y)
+            xints = ((y - self.ys) * (self.xs_next - self.xs) /
+                     (self.ys_next - self.ys) + self.xs)
+            hits = crosses & (x < xints)
+
+        return np.bitwise_xor.reduce(hits, axis=1)
+
+
+def points_in_polygon_vec(points_xy: np.ndarray, poly_xy: np.ndarray) -> np.ndarray:
+    """Test many points against one polygon in a single native-code pass.
+
+    The polygon is split into two contiguous coordinate arrays so the
+    edge walk runs on stride-1 loads, and the per-point loop is
+    JIT-compiled (and thread-parallel) when numba is installed.
+
+    Args:
+        points_xy: Array of shape (M, 2) with point (x, y) pairs
+        poly_xy: Array of shape (V, 2) with polygon vertices
+
+    Returns:
+        Boolean array of length M, True where the point is inside
+
+    Example:
+        >>> square = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+        >>> points_in_polygon_vec(np.array([(0.5, 0.5), (2, 2)]), square)
+        array([ True, False])
+    """
+    points = np.asarray(points_xy, dtype=np.float64)
+    poly = np.asarray(poly_xy, dtype=np.float64)
+
+    xs = np.ascontiguousarray(points[:, 0])
+    ys = np.ascontiguousarray(points[:, 1])
+    poly_x = np.ascontiguousarray(poly[:, 0])
+    poly_y = np.ascontiguousarray(poly[:, 1])
+
+    out = np.empty(xs.shape[0], dtype=np.bool_)
+    _points_in_polygon_kernel(xs, ys, poly_x, poly_y, out)
+    return out
\ No newline at end of file
@@ -1,558 +1,884 @@
-"""Glare analysis module for solar PV installations.
-
-This module provides the core functionality for analyzing glare from photovoltaic
-panels, including grid generation, visibility checks, and intensity calculations.
-"""
-
-import logging
-import math
-from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional, Union
-import numpy as np
-import pandas as pd
-
-logger = logging.getLogger(__name__)
-
-# Try to import shapely
-try:
-    from shapely.geometry import Polygon, Point as ShapelyPoint
-    SHAPELY_AVAILABLE = True
-except ImportError:
-    SHAPELY_AVAILABLE = False
-    logger.warning("shapely not available. Using simplified geometry calculations.")
-
-from .models import PVArea, ObservationPoint, Coordinate
-from .geometry import (
-    calculate_azimuth, get_panel_normal, haversine, point_in_polygon
-)
-from .reflection import ReflectionProfile
-from ..config import Config
-
-
-@dataclass
-class GridPoint:
-    """Represents a calculation point in the PV grid."""
-    x: float
-    y: float
-    z: float
-    area: float  # Area represented by this grid point
-
-
-@dataclass
-class AngularGridPoint:
-    """Represents a calculation point in angular coordinates."""
-    azimuth: float  # degrees
-    elevation: float  # degrees
-    op_number: int
-    pv_area_name: str
-
-
-@dataclass
-class GlareEvent:
-    """Represents a single glare event."""
-    timestamp: pd.Timestamp
-    op_number: int
-    pv_area_name: str
-    sun_azimuth: float
-    sun_elevation: float
-    reflection_azimuth: float
-    reflection_elevation: float
-    incidence_angle: float
-    dni: float
-    intensity: float  # cd/m²
-    duration_minutes: float = 1.0
-
-
-class GlareAnalyzer:
-    """Main class for glare analysis calculations."""
-    
-    def __init__(
-        self,
-        reflection_profiles: Dict[int, ReflectionProfile],
-        grid_width: float = 1.0,
-        beam_spread: float = 0.5,
-        sun_angle: float = 0.53,
-        glare_threshold: float = 30000.0  # cd/m²
-    ):
-        """Initialize glare analyzer.
-        
-        Args:
-            reflection_profiles: Module reflection profiles by type
-            grid_width: Grid spacing in meters or degrees
-            beam_spread: Beam spread angle in degrees
-            sun_angle: Sun angular diameter in degrees
-            glare_threshold: Minimum intensity to consider as glare
-        """
-        self.reflection_profiles = reflection_profiles
-        self.grid_width = grid_width
-        self.beam_spread = beam_spread
-        self.sun_angle = sun_angle
-        self.glare_threshold = glare_threshold
-        self.angular_threshold = (beam_spread + sun_angle) / 2
-    
-    def generate_pv_grid(
-        self,
-        pv_area: PVArea,
-        grid_spacing: Optional[float] = None
-    ) -> List[GridPoint]:
-        """Generate calculation grid for PV area.
-        
-        Creates a regular grid of points within the PV area polygon.
-        
-        Args:
-            pv_area: PV area to generate grid for
-            grid_spacing: Override default grid spacing
-            
-        Returns:
-            List of grid points
-        """
-        if grid_spacing is None:
-            grid_spacing = self.grid_width
-        
-        # Convert PV area corners to local coordinate system
-        # For now, use a simple approach - proper implementation would
-        # transform to UTM or local tangent plane
-        
-        corners = [(p.longitude, p.latitude) for p in pv_area.coordinates]
-        
-        if SHAPELY_AVAILABLE:
-            polygon = Polygon(corners)
-        else:
-            polygon = None  # Will use point_in_polygon function instead
-        
-        # Get bounding box
-        if SHAPELY_AVAILABLE and polygon:
-            minx, miny, maxx, maxy = polygon.bounds
-        else:
-            # Calculate bounds manually
-            lons = [c[0] for c in corners]
-            lats = [c[1] for c in corners]
-            minx, maxx = min(lons), max(lons)
-            miny, maxy = min(lats), max(lats)
-        
-        # Generate grid points
-        grid_points = []
-        
-        # Calculate grid dimensions
-        nx = int((maxx - minx) / grid_spacing) + 1
-        ny = int((maxy - miny) / grid_spacing) + 1
-        
-        # Cell area
-        cell_area = grid_spacing * grid_spacing
-        
-        for i in range(nx):
-            for j in range(ny):
-                x = minx + i * grid_spacing
-                y = miny + j * grid_spacing
-                
-                # Check if point is inside polygon
-                if SHAPELY_AVAILABLE:
-                    point = ShapelyPoint(x, y)
-                    is_inside = polygon.contains(point)
-                else:
-                    # Use simple point-in-polygon check from geometry module
-                    coords = [(c.latitude, c.longitude) for c in pv_area.coordinates]
-                    is_inside = point_in_polygon((x, y), coords)
-                
-                if is_inside:
-                    # Get elevation (would interpolate from corners in full implementation)
-                    z = pv_area.coordinates[0].ground_elevation
-                    
-                    grid_points.append(GridPoint(x, y, z, cell_area))
-        
-        logger.info(f"Generated {len(grid_points)} grid points for PV area {pv_area.name}")
-        
-        return grid_points
-    
-    def generate_angular_grid(
-        self,
-        observer: ObservationPoint,
-        pv_area: PVArea,
-        angular_spacing: Optional[float] = None
-    ) -> List[AngularGridPoint]:
-        """Generate calculation points in angular domain.
-        
-        Creates a grid of azimuth/elevation angles from observer's perspective
-        that covers the PV area.
-        
-        Args:
-            observer: Observation point
-            pv_area: PV area to cover
-            angular_spacing: Override default angular grid spacing
-            
-        Returns:
-            List of angular grid points
-        """
-        if angular_spacing is None:
-            angular_spacing = self.grid_width
-        
-        # Calculate angular bounds of PV area from observer
-        azimuths = []
-        elevations = []
-        
-        for corner in pv_area.coordinates:
-            # Calculate azimuth and elevation from observer to corner
-            az = calculate_azimuth(
-                observer.coordinate.latitude,
-                observer.coordinate.longitude,
-                corner.latitude,
-                corner.longitude
-            )
-            
-            # Calculate distance and elevation angle
-            dist_horiz = haversine(
-                observer.coordinate.latitude, observer.coordinate.longitude,
-                corner.latitude, corner.longitude
-            )
-            
-            height_diff = corner.ground_elevation - observer.coordinate.ground_elevation
-            el = math.degrees(math.atan2(height_diff, dist_horiz))
-            
-            azimuths.append(az)
-            elevations.append(el)
-        
-        # Handle azimuth wraparound
-        azimuths = np.array(azimuths)
-        # Normalize to handle 0/360 boundary
-        for i in range(1, len(azimuths)):
-            while azimuths[i] - azimuths[i-1] > 180:
-                azimuths[i] -= 360
-            while azimuths[i] - azimuths[i-1] < -180:
-                azimuths[i] += 360
-        
-        # Get bounds
-        min_az = azimuths.min() - self.angular_threshold
-        max_az = azimuths.max() + self.angular_threshold
-        min_el = min(elevations) - self.angular_threshold
-        max_el = max(elevations) + self.angular_threshold
-        
-        # Generate grid
-        angular_grid = []
-        
-        az = min_az
-        while az <= max_az:
-            el = min_el
-            while el <= max_el:
-                # Check if point is inside PV area angular bounds
-                # (simplified - full implementation would project back to check)
-                angular_grid.append(AngularGridPoint(
-                    azimuth=az % 360,  # Normalize to [0, 360)
-                    elevation=el,
-                    op_number=1,  # Default to 1, should be passed from calling function
-                    pv_area_name=pv_area.name
-                ))
-                el += angular_spacing
-            az += angular_spacing
-        
-        logger.debug(f"Generated {len(angular_grid)} angular grid points for observer {observer.name}")
-        
-        return angular_grid
-    
-    def check_glare_hit(
-        self,
-        reflection_az: float,
-        reflection_el: float,
-        target_az: float,
-        target_el: float,
-        threshold: Optional[float] = None
-    ) -> bool:
-        """Check if reflection hits target within threshold.
-        
-        Args:
-            reflection_az: Reflection azimuth in degrees
-            reflection_el: Reflection elevation in degrees
-            target_az: Target azimuth in degrees
-            target_el: Target elevation in degrees
-            threshold: Angular threshold in degrees
-            
-        Returns:
-            True if hit detected
-        """
-        if threshold is None:
-            threshold = self.angular_threshold
-        
-        # Convert to radians
-        refl_az_rad = math.radians(reflection_az)
-        refl_el_rad = math.radians(reflection_el)
-        target_az_rad = math.radians(target_az)
-        target_el_rad = math.radians(target_el)
-        
-        # Calculate angular distance
-        # Handle azimuth wraparound
-        delta_az = abs(refl_az_rad - target_az_rad)
-        if delta_az > math.pi:
-            delta_az = 2 * math.pi - delta_az
-        
-        delta_el = abs(refl_el_rad - target_el_rad)
-        
-        # Euclidean distance in angular space
-        angular_distance = math.sqrt(delta_az**2 + delta_el**2)
-        
-        return angular_distance <= math.radians(threshold)
-    
-    def calculate_glare_intensity(
-        self,
-        dni: float,
-        incidence_angle: float,
-        reflection_coeff: float,
-        area: float,
-        distance: float
-    ) -> float:
-        """Calculate glare intensity at observer.
-        
-        Args:
-            dni: Direct normal irradiance in W/m²
-            incidence_angle: Angle of incidence in degrees
-            reflection_coeff: Reflection coefficient (0-1)
-            area: Reflecting area in m²
-            distance: Distance to observer in m
-            
-        Returns:
-            Luminous intensity in cd/m²
-        """
-        # Direct irradiance on panel
-        cos_inc = math.cos(math.radians(incidence_angle))
-        irradiance_on_panel = dni * cos_inc
-        
-        # Reflected luminous flux
-        # Using dynamic luminous efficacy
-        k_dynamic = 130.0  # lm/W
-        luminous_flux = irradiance_on_panel * area * reflection_coeff * k_dynamic
-        
-        # Solid angle subtended by observer
-        # Simplified - assumes small angle
-        solid_angle = 1.0 / (distance * distance)
-        
-        # Luminance
-        luminance = luminous_flux * solid_angle / area
-        
-        return luminance
-    
-    def detect_glare_vectorized(
-        self,
-        reflection_df: pd.DataFrame,
-        angular_grid: List[AngularGridPoint],
-        pv_area: PVArea
-    ) -> List[GlareEvent]:
-        """Detect glare events using vectorized operations.
-        
-        Args:
-            reflection_df: DataFrame with reflection calculations
-            angular_grid: Angular grid points to check
-            pv_area: PV area being analyzed
-            
-        Returns:
-            List of glare events
-        """
-        # Filter angular grid for this PV area
-        grid_points = [p for p in angular_grid if p.pv_area_name == pv_area.name]
-        if not grid_points:
-            return []
-        
-        # Extract grid angles
-        grid_azimuths = np.array([p.azimuth for p in grid_points])
-        grid_elevations = np.array([p.elevation for p in grid_points])
-        
-        # Filter reflection data for this PV area
-        pv_reflections = reflection_df[reflection_df['pv_area_name'] == pv_area.name]
-        if pv_reflections.empty:
-            return []
-        
-        # Vectorized hit detection
-        glare_events = []
-        
-        threshold_rad = math.radians(self.angular_threshold)
-        
-        # Process in chunks for memory efficiency
-        chunk_size = 1000
-        for i in range(0, len(pv_reflections), chunk_size):
-            chunk = pv_reflections.iloc[i:i+chunk_size]
-            
-            # Get reflection angles
-            refl_az = np.radians(chunk['reflection_azimuth'].values)
-            refl_el = np.radians(chunk['reflection_elevation'].values)
-            
-            # Expand arrays for broadcasting
-            refl_az_exp = refl_az[:, np.newaxis]
-            refl_el_exp = refl_el[:, np.newaxis]
-            grid_az_exp = np.radians(grid_azimuths[np.newaxis, :])
-            grid_el_exp = np.radians(grid_elevations[np.newaxis, :])
-            
-            # Calculate angular distances
-            delta_az = np.abs(refl_az_exp - grid_az_exp)
-            delta_az = np.minimum(delta_az, 2 * np.pi - delta_az)  # Handle wraparound
-            delta_el = np.abs(refl_el_exp - grid_el_exp)
-            
-            # Euclidean distance in angular space
-            angular_distances = np.sqrt(delta_az**2 + delta_el**2)
-            
-            # Find hits
-            hits = angular_distances <= threshold_rad
-            hit_indices = np.where(hits)
-            
-            # Create glare events for hits
-            for refl_idx, grid_idx in zip(hit_indices[0], hit_indices[1]):
-                refl_row = chunk.iloc[refl_idx]
-                grid_point = grid_points[grid_idx]
-                
-                # Skip if incidence angle too large
-                if refl_row.get('incidence_angle', 0) > 89:
-                    continue
-                
-                # Calculate intensity if we have the data
-                intensity = 0.0
-                if 'dni' in refl_row and 'incidence_angle' in refl_row:
-                    # Get reflection coefficient
-                    module_type = pv_area.module_type
-                    if module_type in self.reflection_profiles:
-                        profile = self.reflection_profiles[module_type]
-                        refl_coeff = profile.get_coefficient(refl_row['incidence_angle'])
-                        
-                        # Simplified intensity calculation
-                        # In full implementation, would calculate actual distance and area
-                        intensity = self.calculate_glare_intensity(
-                            refl_row['dni'],
-                            refl_row['incidence_angle'],
-                            refl_coeff,
-                            area=1.0,  # Placeholder
-                            distance=100.0  # Placeholder
-                        )
-                
-                if intensity >= self.glare_threshold:
-                    event = GlareEvent(
-                        timestamp=refl_row.name if isinstance(refl_row.name, pd.Timestamp) else pd.Timestamp.now(),
-                        op_number=grid_point.op_number,
-                        pv_area_name=pv_area.name,
-                        sun_azimuth=refl_row.get('sun_azimuth', 0),
-                        sun_elevation=refl_row.get('sun_elevation', 0),
-                        reflection_azimuth=refl_row.get('reflection_azimuth', 0),
-                        reflection_elevation=refl_row.get('reflection_elevation', 0),
-                        incidence_angle=refl_row.get('incidence_angle', 0),
-                        dni=refl_row.get('dni', 0),
-                        intensity=intensity
-                    )
-                    glare_events.append(event)
-        
-        return glare_events
-    
-    def aggregate_glare_periods(
-        self,
-        glare_events: List[GlareEvent],
-        gap_threshold_minutes: int = 5
-    ) -> pd.DataFrame:
-        """Aggregate continuous glare periods.
-        
-        Args:
-            glare_events: List of glare events
-            gap_threshold_minutes: Maximum gap to consider continuous
-            
-        Returns:
-            DataFrame with aggregated glare periods
-        """
-        if not glare_events:
-            return pd.DataFrame()
-        
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame([
-            {
-                'timestamp': e.timestamp,
-                'op_number': e.op_number,
-                'pv_area_name': e.pv_area_name,
-                'intensity': e.intensity,
-                'duration_minutes': e.duration_minutes
-            }
-            for e in glare_events
-        ])
-        
-        # Sort by observation point, PV area, and time
-        df = df.sort_values(['op_number', 'pv_area_name', 'timestamp'])
-        
-        # Group and aggregate
-        periods = []
-        
-        for (op, pv_area), group in df.groupby(['op_number', 'pv_area_name']):
-            # Find continuous periods
-            group = group.reset_index(drop=True)
-            
-            period_start = group.iloc[0]['timestamp']
-            period_end = period_start
-            period_intensity_sum = 0
-            period_count = 0
-            
-            for i in range(len(group)):
-                current_time = group.iloc[i]['timestamp']
-                
-                # Check if this is part of the same period
-                if i > 0:
-                    time_gap = (current_time - period_end).total_seconds() / 60
-                    if time_gap > gap_threshold_minutes:
-                        # End current period
-                        periods.append({
-                            'op_number': op,
-                            'pv_area_name': pv_area,
-                            'start_time': period_start,
-                            'end_time': period_end,
-                            'duration_minutes': (period_end - period_start).total_seconds() / 60,
-                            'average_intensity': period_intensity_sum / period_count if period_count > 0 else 0
-                        })
-                        
-                        # Start new period
-                        period_start = current_time
-                        period_intensity_sum = 0
-                        period_count = 0
-                
-                # Update current period
-                period_end = current_time
-                period_intensity_sum += group.iloc[i]['intensity']
-                period_count += 1
-            
-            # Add final period
-            if period_count > 0:
-                periods.append({
-                    'op_number': op,
-                    'pv_area_name': pv_area,
-                    'start_time': period_start,
-                    'end_time': period_end,
-                    'duration_minutes': (period_end - period_start).total_seconds() / 60,
-                    'average_intensity': period_intensity_sum / period_count
-                })
-        
-        return pd.DataFrame(periods)
-
-
-def calculate_glare_statistics(glare_periods: pd.DataFrame) -> Dict:
-    """Calculate summary statistics from glare periods.
-    
-    Args:
-        glare_periods: DataFrame with aggregated glare periods
-        
-    Returns:
-        Dictionary with statistics
-    """
-    if glare_periods.empty:
-        return {
-            'total_glare_minutes': 0,
-            'days_with_glare': 0,
-            'max_daily_minutes': 0,
-            'average_daily_minutes': 0,
-            'max_intensity': 0,
-            'average_intensity': 0
-        }
-    
-    # Add date column
-    glare_periods['date'] = glare_periods['start_time'].dt.date
-    
-    # Daily statistics
-    daily_stats = glare_periods.groupby('date').agg({
-        'duration_minutes': 'sum',
-        'average_intensity': 'mean'
-    })
-    
-    return {
-        'total_glare_minutes': glare_periods['duration_minutes'].sum(),
-        'days_with_glare': len(daily_stats),
-        'max_daily_minutes': daily_stats['duration_minutes'].max(),
-        'average_daily_minutes': daily_stats['duration_minutes'].mean(),
-        'max_intensity': glare_periods['average_intensity'].max(),
-        'average_intensity': glare_periods['average_intensity'].mean()
+"""Glare analysis module for solar PV installations.
+
+This module provides the core functionality for analyzing glare from photovoltaic
+panels, including grid generation, visibility checks, and intensity calculations.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Optional, Union
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Try to import shapely
+try:
+    from shapely.geometry import Polygon, Point as ShapelyPoint
+    SHAPELY_AVAILABLE = True
+    try:
+        # One C call for a whole point batch; not present in all builds
+        from shapely.vectorized import contains as _shapely_contains
+    except ImportError:
+        _shapely_contains = None
+except ImportError:
+    SHAPELY_AVAILABLE = False
+    _shapely_contains = None
+    logger.warning("shapely not available. Using simplified geometry calculations.")
+
+# Try to import scipy for KD-tree based hit detection
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Try to import numba for the compiled hit kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+from .models import PVArea, ObservationPoint, Coordinate
+from .geometry import (
+    calculate_azimuth, calculate_azimuth_vec, get_panel_normal, haversine,
+    haversine_vec, points_in_polygon_vec
+)
+from .reflection import ReflectionProfile
+from ..config import Config
+
+
+@dataclass
+class GridPoint:
+    """Represents a calculation point in the PV grid."""
+    x: float
+    y: float
+    z: float
+    area: float  # Area represented by this grid point
+
+
+@dataclass
+class AngularGridPoint:
+    """Represents a calculation point in angular coordinates."""
+    azimuth: float  # degrees
+    elevation: float  # degrees
+    op_number: int
+    pv_area_name: str
+
+
+@dataclass
+class AngularGrid:
+    """Angular calculation grid in structure-of-arrays layout.
+
+    Downstream hit detection consumes whole columns, so the grid keeps
+    azimuth/elevation as two parallel arrays (plus their radian forms,
+    converted once) instead of a list of per-cell dataclass objects.
+
+    Attributes:
+        azimuth: Azimuths in degrees, normalized to [0, 360)
+        elevation: Elevations in degrees
+        op_number: Observation point number the grid belongs to
+        pv_area_name: Name of the PV area the grid covers
+    """
+    azimuth: np.ndarray
+    elevation: np.ndarray
+    op_number: int
+    pv_area_name: str
+    azimuth_rad: np.ndarray = None
+    elevation_rad: np.ndarray = None
+
+    def __post_init__(self):
+        self.azimuth_rad = np.radians(self.azimuth)
+        self.elevation_rad = np.radians(self.elevation)
+
+    def __len__(self) -> int:
+        return self.azimuth.size
+
+
+@dataclass
+class GlareEvent:
+    """Represents a single glare event."""
+    timestamp: pd.Timestamp
+    op_number: int
+    pv_area_name: str
+    sun_azimuth: float
+    sun_elevation: float
+    reflection_azimuth: float
+    reflection_elevation: float
+    incidence_angle: float
+    dni: float
+    intensity: float  # cd/m²
+    duration_minutes: float = 1.0
+
+
+# Column order of the event frame produced by detect_glare_frame;
+# matches the GlareEvent fields
+_EVENT_COLUMNS = (
+    'timestamp', 'op_number', 'pv_area_name', 'sun_azimuth',
+    'sun_elevation', 'reflection_azimuth', 'reflection_elevation',
+    'incidence_angle', 'dni', 'intensity', 'duration_minutes'
+)
+
+
+def _dense_hit_kernel(refl_az, refl_el, grid_az, grid_el,
+                      threshold_sq, two_pi, out_pairs):
+    """Dense angular hit test writing (row, grid) index pairs.
+
+    Two parallel passes over the (rows x grid) space: the first counts
+    hits per row, a prefix sum turns the counts into disjoint write
+    offsets, and the second pass fills out_pairs without any shared
+    counter. Returns the number of pairs written, or the negated
+    required size when out_pairs is too small (caller resizes and
+    retries).
+    """
+    n_rows = refl_az.shape[0]
+    n_grid = grid_az.shape[0]
+    counts = np.zeros(n_rows + 1, dtype=np.int64)
+
+    for r in prange(n_rows):
+        c = 0
+        for g in range(n_grid):
+            d_az = abs(refl_az[r] - grid_az[g])
+            if d_az > two_pi - d_az:
+                d_az = two_pi - d_az
+            d_el = refl_el[r] - grid_el[g]
+            if d_az * d_az + d_el * d_el <= threshold_sq:
+                c += 1
+        counts[r + 1] = c
+
+    for r in range(n_rows):
+        counts[r + 1] += counts[r]
+    total = counts[n_rows]
+    if total > out_pairs.shape[0]:
+        return -total
+
+    for r in prange(n_rows):
+        k = counts[r]
+        for g in range(n_grid):
+            d_az = abs(refl_az[r] - grid_az[g])
+            if d_az > two_pi - d_az:
+                d_az = two_pi - d_az
+            d_el = refl_el[r] - grid_el[g]
+            if d_az * d_az + d_el * d_el <= threshold_sq:
+                out_pairs[k, 0] = r
+                out_pairs[k, 1] = g
+                k += 1
+    return total
+
+
+if NUMBA_AVAILABLE:
+    _dense_hit_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _dense_hit_kernel
+    )
+
+
+class GlareAnalyzer:
+    """Main class for glare analysis calculations."""
+    
+    def __init__(
+        self,
+        reflection_profiles: Dict[int, ReflectionProfile],
+        grid_width: float = 1.0,
+        beam_spread: float = 0.5,
+        sun_angle: float = 0.53,
+        glare_threshold: float = 30000.0  # cd/m²
+    ):
+        """Initialize glare analyzer.
+        
+        Args:
+            reflection_profiles: Module reflection profiles by type
+            grid_width: Grid spacing in meters or degrees
+            beam_spread: Beam spread angle in degrees
+            sun_angle: Sun angular diameter in degrees
+            glare_threshold: Minimum intensity to consider as glare
+        """
+        self.reflection_profiles = reflection_profiles
+        self.grid_width = grid_width
+        self.beam_spread = beam_spread
+        self.sun_angle = sun_angle
+        self.glare_threshold = glare_threshold
+        self.angular_threshold = (beam_spread + sun_angle) / 2
+        # Radian forms of the angular threshold, cached so the hit tests
+        # compare squared distances without converting per call
+        self._threshold_rad = math.radians(self.angular_threshold)
+        self._threshold_rad_sq = self._threshold_rad ** 2
+        # Dynamic luminous efficacy (lm/W) and the azimuth wrap period,
+        # bound once instead of being rebuilt at each computation site
+        self._k_dynamic = 130.0
+        self._two_pi = 2.0 * math.pi
+    
+    def generate_pv_grid(
+        self,
+        pv_area: PVArea,
+        grid_spacing: Optional[float] = None
+    ) -> List[GridPoint]:
+        """Generate calculation grid for PV area.
+        
+        Creates a regular grid of points within the PV area polygon.
+        
+        Args:
+            pv_area: PV area to generate grid for
+            grid_spacing: Override default grid spacing
+            
+        Returns:
+            List of grid points
+        """
+        if grid_spacing is None:
+            grid_spacing = self.grid_width
+        
+        # Convert PV area corners to local coordinate system
+        # For now, use a simple approach - proper implementation would
+        # transform to UTM or local tangent plane
+        
+        corners = [(p.longitude, p.latitude) for p in pv_area.coordinates]
+
+        if SHAPELY_AVAILABLE:
+            polygon = Polygon(corners)
+            minx, miny, maxx, maxy = polygon.bounds
+        else:
+            polygon = None
+            lons = [c[0] for c in corners]
+            lats = [c[1] for c in corners]
+            minx, maxx = min(lons), max(lons)
+            miny, maxy = min(lats), max(lats)
+
+        # Calculate grid dimensions
+        nx = int((maxx - minx) / grid_spacing) + 1
+        ny = int((maxy - miny) / grid_spacing) + 1
+
+        # Cell area
+        cell_area = grid_spacing * grid_spacing
+
+        # Build all candidate points over the bounding box at once; the
+        # containment test then runs as one batch call instead of a
+        # Python loop constructing a point object per cell
+        xs, ys = np.meshgrid(
+            minx + np.arange(nx) * grid_spacing,
+            miny + np.arange(ny) * grid_spacing,
+            indexing='ij'
+        )
+        xs = xs.ravel()
+        ys = ys.ravel()
+
+        if SHAPELY_AVAILABLE and _shapely_contains is not None:
+            mask = _shapely_contains(polygon, xs, ys)
+        else:
+            # The numba-compiled batch ray-cast beats a per-point
+            # polygon.contains loop, so it also covers shapely builds
+            # without the vectorized module
+            mask = points_in_polygon_vec(
+                np.column_stack([xs, ys]),
+                np.asarray(corners, dtype=np.float64)
+            )
+
+        # Get elevation (would interpolate from corners in full implementation)
+        z = pv_area.coordinates[0].ground_elevation
+        grid_points = [
+            GridPoint(float(x), float(y), z, cell_area)
+            for x, y in zip(xs[mask], ys[mask])
+        ]
+
+        logger.info(f"Generated {len(grid_points)} grid points for PV area {pv_area.name}")
+        
+        return grid_points
+    
+    def generate_angular_grid(
+        self,
+        observer: ObservationPoint,
+        pv_area: PVArea,
+        angular_spacing: Optional[float] = None
+    ) -> AngularGrid:
+        """Generate calculation points in angular domain.
+        
+        Creates a grid of azimuth/elevation angles from observer's perspective
+        that covers the PV area.
+        
+        Args:
+            observer: Observation point
+            pv_area: PV area to cover
+            angular_spacing: Override default angular grid spacing
+            
+        Returns:
+            Angular grid in SoA layout
+        """
+        if angular_spacing is None:
+            angular_spacing = self.grid_width
+        
+        # Calculate angular bounds of PV area from observer; corner
+        # columns are packed once so azimuth, distance and elevation
+        # come out of three array calls instead of a trig loop
+        corners = pv_area.coordinates
+        n_corners = len(corners)
+        corner_lats = np.fromiter(
+            (c.latitude for c in corners), dtype=np.float64, count=n_corners
+        )
+        corner_lons = np.fromiter(
+            (c.longitude for c in corners), dtype=np.float64, count=n_corners
+        )
+        corner_elevs = np.fromiter(
+            (c.ground_elevation for c in corners), dtype=np.float64, count=n_corners
+        )
+
+        obs_lat = observer.coordinate.latitude
+        obs_lon = observer.coordinate.longitude
+
+        azimuths = calculate_azimuth_vec(obs_lat, obs_lon, corner_lats, corner_lons)
+        dist_horiz = haversine_vec(obs_lat, obs_lon, corner_lats, corner_lons)
+        height_diff = corner_elevs - observer.coordinate.ground_elevation
+        elevations = np.degrees(np.arctan2(height_diff, dist_horiz))
+        
+        # Handle azimuth wraparound: np.unwrap applies the same
+        # +/-360 normalization as the old nested while loops in one call
+        azimuths = np.degrees(np.unwrap(np.radians(azimuths)))
+        
+        # Get bounds
+        min_az = azimuths.min() - self.angular_threshold
+        max_az = azimuths.max() + self.angular_threshold
+        min_el = elevations.min() - self.angular_threshold
+        max_el = elevations.max() + self.angular_threshold
+        
+        # Generate the grid as two flat columns; the epsilon keeps the
+        # inclusive upper bound of the old while loops
+        az_vals = np.arange(min_az, max_az + 1e-9, angular_spacing)
+        el_vals = np.arange(min_el, max_el + 1e-9, angular_spacing)
+        az_mesh, el_mesh = np.meshgrid(az_vals, el_vals, indexing='ij')
+
+        angular_grid = AngularGrid(
+            azimuth=np.mod(az_mesh.ravel(), 360.0),  # Normalize to [0, 360)
+            elevation=el_mesh.ravel(),
+            op_number=1,  # Default to 1, should be passed from calling function
+            pv_area_name=pv_area.name
+        )
+
+        logger.debug(f"Generated {len(angular_grid)} angular grid points for observer {observer.name}")
+        
+        return angular_grid
+    
+    def check_glare_hit(
+        self,
+        reflection_az: float,
+        reflection_el: float,
+        target_az: float,
+        target_el: float,
+        threshold: Optional[float] = None
+    ) -> bool:
+        """Check if reflection hits target within threshold.
+        
+        Args:
+            reflection_az: Reflection azimuth in degrees
+            reflection_el: Reflection elevation in degrees
+            target_az: Target azimuth in degrees
+            target_el: Target elevation in degrees
+            threshold: Angular threshold in degrees
+            
+        Returns:
+            True if hit detected
+        """
+        if threshold is None:
+            threshold = self.angular_threshold
+        
+        # Convert to radians
+        refl_az_rad = math.radians(reflection_az)
+        refl_el_rad = math.radians(reflection_el)
+        target_az_rad = math.radians(target_az)
+        target_el_rad = math.radians(target_el)
+        
+        # Calculate angular distance
+        # Handle azimuth wraparound
+        delta_az = abs(refl_az_rad - target_az_rad)
+        if delta_az > math.pi:
+            delta_az = self._two_pi - delta_az
+        
+        delta_el = abs(refl_el_rad - target_el_rad)
+        
+        # Compare squared distances in angular space; avoids the sqrt
+        if threshold == self.angular_threshold:
+            threshold_rad_sq = self._threshold_rad_sq
+        else:
+            threshold_rad_sq = math.radians(threshold) ** 2
+        return delta_az * delta_az + delta_el * delta_el <= threshold_rad_sq
+    
+    def calculate_glare_intensity(
+        self,
+        dni: float,
+        incidence_angle: float,
+        reflection_coeff: float,
+        area: float,
+        distance: float
+    ) -> float:
+        """Calculate glare intensity at observer.
+        
+        Args:
+            dni: Direct normal irradiance in W/m²
+            incidence_angle: Angle of incidence in degrees
+            reflection_coeff: Reflection coefficient (0-1)
+            area: Reflecting area in m²
+            distance: Distance to observer in m
+            
+        Returns:
+            Luminous intensity in cd/m²
+        """
+        # Direct irradiance on panel
+        cos_inc = math.cos(math.radians(incidence_angle))
+        irradiance_on_panel = dni * cos_inc
+        
+        # Reflected luminous flux
+        # Using dynamic luminous efficacy
+        luminous_flux = irradiance_on_panel * area * reflection_coeff * self._k_dynamic
+        
+        # Solid angle subtended by observer
+        # Simplified - assumes small angle
+        solid_angle = 1.0 / (distance * distance)
+        
+        # Luminance
+        luminance = luminous_flux * solid_angle / area
+        
+        return luminance
+    
+    def _intensity_vec(
+        self,
+        dni: np.ndarray,
+        incidence_angle: np.ndarray,
+        reflection_coeff: np.ndarray,
+        distance: float
+    ) -> np.ndarray:
+        """Vectorized glare intensity for arrays of hits.
+
+        Fuses the steps of calculate_glare_intensity into one ufunc
+        expression. The area terms cancel algebraically (the luminous
+        flux scales with area and the luminance divides by it), so the
+        fused form drops them entirely.
+
+        Args:
+            dni: Direct normal irradiances in W/m²
+            incidence_angle: Angles of incidence in degrees
+            reflection_coeff: Reflection coefficients (0-1)
+            distance: Distance to observer in m
+
+        Returns:
+            Array of luminous intensities in cd/m²
+        """
+        return (self._k_dynamic * dni * np.cos(np.deg2rad(incidence_angle)) *
+                reflection_coeff / (distance * distance))
+
+    def detect_glare_frame(
+        self,
+        reflection_df: pd.DataFrame,
+        angular_grid: Union[AngularGrid, List[AngularGridPoint]],
+        pv_area: PVArea
+    ) -> pd.DataFrame:
+        """Detect glare events, returned as a DataFrame of columns.
+
+        Hits stay in array form end to end: each chunk appends column
+        buffers and the result is concatenated once, so no per-event
+        Python objects are created. detect_glare_vectorized wraps this
+        into GlareEvent objects for callers that want them.
+
+        Args:
+            reflection_df: DataFrame with reflection calculations
+            angular_grid: Angular grid (SoA) or legacy list of grid points
+            pv_area: PV area being analyzed
+
+        Returns:
+            DataFrame with one row per glare event (columns matching
+            the GlareEvent fields)
+        """
+        empty = pd.DataFrame(columns=list(_EVENT_COLUMNS))
+
+        # Resolve the grid columns; the SoA grid hands them over directly
+        if isinstance(angular_grid, AngularGrid):
+            if angular_grid.pv_area_name != pv_area.name:
+                return empty
+            grid_azimuths = angular_grid.azimuth
+            grid_elevations = angular_grid.elevation
+            op_numbers = np.full(grid_azimuths.size, angular_grid.op_number)
+        else:
+            # Legacy list-of-points layout
+            grid_points = [p for p in angular_grid if p.pv_area_name == pv_area.name]
+            if not grid_points:
+                return empty
+            grid_azimuths = np.array([p.azimuth for p in grid_points])
+            grid_elevations = np.array([p.elevation for p in grid_points])
+            op_numbers = np.array([p.op_number for p in grid_points])
+
+        if grid_azimuths.size == 0:
+            return empty
+        
+        # Filter reflection data for this PV area
+        pv_reflections = reflection_df[reflection_df['pv_area_name'] == pv_area.name]
+        if pv_reflections.empty:
+            return empty
+        
+        # Per-chunk column buffers, concatenated once at the end
+        frame_parts = []
+        
+
+        # Column presence and the reflection profile are invariant over
+        # the chunk loop
+        columns = pv_reflections.columns
+        has_intensity_data = 'dni' in columns and 'incidence_angle' in columns
+        # Resolve the profile only when intensity data is present: the
+        # pipeline constructs the analyzer with a Config in place of the
+        # profiles dict, and that path never carries dni/incidence columns
+        profile = (self.reflection_profiles.get(pv_area.module_type)
+                   if has_intensity_data else None)
+
+        def _column(chunk, name):
+            """Column as a contiguous array, zeros when absent."""
+            if name in columns:
+                return chunk[name].to_numpy()
+            return np.zeros(len(chunk))
+
+        # Grid radians are loop-invariant: convert (or reuse the grid's
+        # precomputed arrays) once instead of per chunk. The hit test
+        # runs in float32 -- half the memory traffic through the
+        # distance matrix, and single precision (~1e-7 rad) is orders
+        # of magnitude finer than the threshold scale. Intensity math
+        # below stays float64.
+        if isinstance(angular_grid, AngularGrid):
+            grid_az_rad = angular_grid.azimuth_rad.astype(np.float32)
+            grid_el_rad = angular_grid.elevation_rad.astype(np.float32)
+        else:
+            grid_az_rad = np.radians(grid_azimuths).astype(np.float32)
+            grid_el_rad = np.radians(grid_elevations).astype(np.float32)
+        two_pi = np.float32(self._two_pi)
+
+        # Comparing squared distance against the squared threshold makes
+        # the sqrt over the whole matrix unnecessary
+        threshold_sq = np.float32(self._threshold_rad_sq)
+
+        row_block = 256
+        grid_block = 1024
+        n_grid = grid_az_rad.size
+
+        if NUMBA_AVAILABLE:
+            # Compiled parallel kernel: index pairs land in one
+            # preallocated buffer, grown on the rare overflow report
+            hit_pairs = np.empty((65536, 2), dtype=np.int32)
+        elif SCIPY_AVAILABLE:
+            # KD-tree over the grid: each chunk row then does one ball
+            # query instead of a distance test against every grid cell.
+            # The grid columns are duplicated at az +/- 2*pi so queries
+            # near the 0/360 seam still find their neighbours; the index
+            # map folds the copies back to real grid indices.
+            tree_az = np.concatenate(
+                [grid_az_rad, grid_az_rad + two_pi, grid_az_rad - two_pi]
+            )
+            tree_el = np.tile(grid_el_rad, 3)
+            tree_index = np.tile(np.arange(n_grid), 3)
+            grid_tree = cKDTree(np.column_stack([tree_az, tree_el]))
+        else:
+            # Cache blocking: the full (chunk x grid) distance matrix
+            # spills out of L2 for realistic grids, so it is computed in
+            # fixed-size tiles. The two scratch buffers are allocated
+            # once and every ufunc below writes into them (out=), so the
+            # tile working set stays cache-resident and no per-tile
+            # temporaries are created.
+            scratch_az = np.empty(
+                (row_block, min(grid_block, n_grid)), dtype=np.float32
+            )
+            scratch_el = np.empty_like(scratch_az)
+
+        # Process in chunks sized from a cache budget rather than a
+        # fixed row count: the hit test touches roughly n_rows x n_grid
+        # float32 cells across ~4 live arrays, so the chunk is chosen to
+        # keep that working set near 512 KiB (about L2 size). The floor
+        # keeps tiny chunks from drowning in per-chunk overhead.
+        target_bytes = 512 * 1024
+        chunk_size = max(64, target_bytes // (n_grid * 4 * 4))
+
+        # Reusable radian buffers: each chunk converts into the same
+        # float32 storage via out= instead of allocating two fresh
+        # arrays, with the tail chunk just taking a shorter slice.
+        # Together with the tile scratch above, the inner loop then
+        # runs allocation-free.
+        rad_az_buf = np.empty(chunk_size, dtype=np.float32)
+        rad_el_buf = np.empty(chunk_size, dtype=np.float32)
+        for i in range(0, len(pv_reflections), chunk_size):
+            chunk = pv_reflections.iloc[i:i+chunk_size]
+
+            # SoA extraction: one contiguous array per column, so the
+            # hit path below is bulk fancy indexing instead of a pandas
+            # Series construction (chunk.iloc) per hit
+            refl_az_deg = _column(chunk, 'reflection_azimuth')
+            refl_el_deg = _column(chunk, 'reflection_elevation')
+            sun_az_arr = _column(chunk, 'sun_azimuth')
+            sun_el_arr = _column(chunk, 'sun_elevation')
+            inc_arr = _column(chunk, 'incidence_angle')
+            dni_arr = _column(chunk, 'dni')
+            timestamps = np.asarray(chunk.index)
+
+            # Early reject: rows that cannot produce glare (grazing
+            # incidence, no direct irradiance) drop out here, before
+            # the row x grid hit test ever sees them
+            valid = inc_arr <= 89
+            if 'dni' in columns:
+                valid &= dni_arr > 0
+            if not valid.all():
+                if not valid.any():
+                    continue
+                refl_az_deg = refl_az_deg[valid]
+                refl_el_deg = refl_el_deg[valid]
+                sun_az_arr = sun_az_arr[valid]
+                sun_el_arr = sun_el_arr[valid]
+                inc_arr = inc_arr[valid]
+                dni_arr = dni_arr[valid]
+                timestamps = timestamps[valid]
+
+            n_rows = refl_az_deg.size
+            refl_az = np.radians(refl_az_deg, out=rad_az_buf[:n_rows])
+            refl_el = np.radians(refl_el_deg, out=rad_el_buf[:n_rows])
+
+            if NUMBA_AVAILABLE:
+                total = _dense_hit_kernel(
+                    refl_az, refl_el, grid_az_rad, grid_el_rad,
+                    threshold_sq, two_pi, hit_pairs
+                )
+                if total < 0:
+                    hit_pairs = np.empty((-total, 2), dtype=np.int32)
+                    total = _dense_hit_kernel(
+                        refl_az, refl_el, grid_az_rad, grid_el_rad,
+                        threshold_sq, two_pi, hit_pairs
+                    )
+                if total == 0:
+                    continue
+                r_idx = hit_pairs[:total, 0]
+                g_idx = hit_pairs[:total, 1]
+            elif SCIPY_AVAILABLE:
+                # One ball query per chunk row against the wrapped grid
+                neighbours = grid_tree.query_ball_point(
+                    np.column_stack([refl_az, refl_el]), r=self._threshold_rad
+                )
+                r_idx = np.repeat(
+                    np.arange(n_rows), [len(nb) for nb in neighbours]
+                )
+                if r_idx.size == 0:
+                    continue
+                flat = np.fromiter(
+                    (j for nb in neighbours for j in nb),
+                    dtype=np.intp, count=r_idx.size
+                )
+                g_idx = tree_index[flat]
+            else:
+                # Tiled angular-distance test; hit indices are collected
+                # per tile and offset back into chunk/grid coordinates
+                r_parts = []
+                g_parts = []
+                for r0 in range(0, n_rows, row_block):
+                    r1 = min(r0 + row_block, n_rows)
+                    tile_az = refl_az[r0:r1, np.newaxis]
+                    tile_el = refl_el[r0:r1, np.newaxis]
+                    for g0 in range(0, n_grid, grid_block):
+                        g1 = min(g0 + grid_block, n_grid)
+                        d_az = scratch_az[:r1 - r0, :g1 - g0]
+                        d_el = scratch_el[:r1 - r0, :g1 - g0]
+
+                        # |refl_az - grid_az| with azimuth wraparound
+                        np.subtract(tile_az, grid_az_rad[g0:g1], out=d_az)
+                        np.abs(d_az, out=d_az)
+                        np.subtract(two_pi, d_az, out=d_el)
+                        np.minimum(d_az, d_el, out=d_az)
+
+                        np.subtract(tile_el, grid_el_rad[g0:g1], out=d_el)
+                        np.abs(d_el, out=d_el)
+
+                        # Squared Euclidean distance in angular space
+                        np.multiply(d_az, d_az, out=d_az)
+                        np.multiply(d_el, d_el, out=d_el)
+                        np.add(d_az, d_el, out=d_az)
+
+                        rr, gg = np.nonzero(d_az <= threshold_sq)
+                        if rr.size:
+                            r_parts.append(rr + r0)
+                            g_parts.append(gg + g0)
+
+                if not r_parts:
+                    continue
+                r_idx = np.concatenate(r_parts)
+                g_idx = np.concatenate(g_parts)
+
+            # Calculate intensities for the surviving hits in one pass
+            if has_intensity_data and profile is not None:
+                inc_hit = inc_arr[r_idx]
+                refl_coeff = profile.get_coefficient_vec(inc_hit)
+                # distance=100.0 placeholder as before; the full
+                # implementation would use actual distance and area
+                intensities = self._intensity_vec(
+                    dni_arr[r_idx], inc_hit, refl_coeff, distance=100.0
+                )
+            else:
+                intensities = np.zeros(r_idx.size)
+
+            # Keep only hits above the glare threshold, as columns
+            strong = intensities >= self.glare_threshold
+            if not strong.any():
+                continue
+            r_s = r_idx[strong]
+            g_s = g_idx[strong]
+            frame_parts.append(pd.DataFrame({
+                'timestamp': timestamps[r_s],
+                'op_number': op_numbers[g_s],
+                'pv_area_name': pv_area.name,
+                'sun_azimuth': sun_az_arr[r_s],
+                'sun_elevation': sun_el_arr[r_s],
+                'reflection_azimuth': refl_az_deg[r_s],
+                'reflection_elevation': refl_el_deg[r_s],
+                'incidence_angle': inc_arr[r_s],
+                'dni': dni_arr[r_s],
+                'intensity': intensities[strong],
+                'duration_minutes': 1.0
+            }))
+
+        if not frame_parts:
+            return empty
+        return pd.concat(frame_parts, ignore_index=True)
+
+    def detect_glare_vectorized(
+        self,
+        reflection_df: pd.DataFrame,
+        angular_grid: Union[AngularGrid, List[AngularGridPoint]],
+        pv_area: PVArea
+    ) -> List[GlareEvent]:
+        """Detect glare events using vectorized operations.
+
+        Thin wrapper around detect_glare_frame that materializes one
+        GlareEvent per row at the API boundary; downstream steps that
+        operate on columns (aggregate_glare_periods) can take the frame
+        directly and skip this conversion.
+
+        Args:
+            reflection_df: DataFrame with reflection calculations
+            angular_grid: Angular grid (SoA) or legacy list of grid points
+            pv_area: PV area being analyzed
+            
+        Returns:
+            List of glare events
+        """
+        frame = self.detect_glare_frame(reflection_df, angular_grid, pv_area)
+        return [
+            GlareEvent(
+                timestamp=row.timestamp if isinstance(row.timestamp, pd.Timestamp)
+                else pd.Timestamp.now(),
+                op_number=int(row.op_number),
+                pv_area_name=row.pv_area_name,
+                sun_azimuth=row.sun_azimuth,
+                sun_elevation=row.sun_elevation,
+                reflection_azimuth=row.reflection_azimuth,
+                reflection_elevation=row.reflection_elevation,
+                incidence_angle=row.incidence_angle,
+                dni=row.dni,
+                intensity=float(row.intensity),
+                duration_minutes=float(row.duration_minutes)
+            )
+            for row in frame.itertuples(index=False)
+        ]
+    
+    def aggregate_glare_periods(
+        self,
+        glare_events: Union[List[GlareEvent], pd.DataFrame],
+        gap_threshold_minutes: int = 5
+    ) -> pd.DataFrame:
+        """Aggregate continuous glare periods.
+        
+        Args:
+            glare_events: List of glare events, or the event frame from
+                detect_glare_frame (used as-is, no conversion)
+            gap_threshold_minutes: Maximum gap to consider continuous
+            
+        Returns:
+            DataFrame with aggregated glare periods
+        """
+        if isinstance(glare_events, pd.DataFrame):
+            # Frame from detect_glare_frame: use the columns directly
+            if glare_events.empty:
+                return pd.DataFrame()
+            df = glare_events[[
+                'timestamp', 'op_number', 'pv_area_name',
+                'intensity', 'duration_minutes'
+            ]]
+        else:
+            if not glare_events:
+                return pd.DataFrame()
+
+            # Convert to DataFrame for easier processing
+            df = pd.DataFrame([
+                {
+                    'timestamp': e.timestamp,
+                    'op_number': e.op_number,
+                    'pv_area_name': e.pv_area_name,
+                    'intensity': e.intensity,
+                    'duration_minutes': e.duration_minutes
+                }
+                for e in glare_events
+            ])
+        
+        # Sort by observation point, PV area, and time
+        df = df.sort_values(['op_number', 'pv_area_name', 'timestamp'])
+        
+        # Split each (op, pv_area) group into continuous periods: a gap
+        # above the threshold starts a new period id, and the period
+        # bounds and mean intensity then come from one groupby.agg
+        # instead of an iloc loop over every event
+        frames = []
+        for (op, pv_area), group in df.groupby(['op_number', 'pv_area_name']):
+            gaps = group['timestamp'].diff().dt.total_seconds() / 60
+            period_id = gaps.gt(gap_threshold_minutes).cumsum()
+            agg = group.groupby(period_id).agg(
+                start_time=('timestamp', 'first'),
+                end_time=('timestamp', 'last'),
+                average_intensity=('intensity', 'mean')
+            )
+            agg['op_number'] = op
+            agg['pv_area_name'] = pv_area
+            frames.append(agg)
+
+        periods = pd.concat(frames, ignore_index=True)
+        periods['duration_minutes'] = (
+            periods['end_time'] - periods['start_time']
+        ).dt.total_seconds() / 60
+
+        return periods[[
+            'op_number', 'pv_area_name', 'start_time', 'end_time',
+            'duration_minutes', 'average_intensity'
+        ]]
+
+
+def calculate_glare_statistics(glare_periods: pd.DataFrame) -> Dict:
+    """Calculate summary statistics from glare periods.
+    
+    Args:
+        glare_periods: DataFrame with aggregated glare periods
+        
+    Returns:
+        Dictionary with statistics
+    """
+    if glare_periods.empty:
+        return {
+            'total_glare_minutes': 0,
+            'days_with_glare': 0,
+            'max_daily_minutes': 0,
+            'average_daily_minutes': 0,
+            'max_intensity': 0,
+            'average_intensity': 0
+        }
+    
+    # Add date column
+    glare_periods['date'] = glare_periods['start_time'].dt.date
+    
+    # Daily statistics
+    daily_stats = glare_periods.groupby('date').agg({
+        'duration_minutes': 'sum',
+        'average_intensity': 'mean'
+    })
+    
+    return {
+        'total_glare_minutes': glare_periods['duration_minutes'].sum(),
+        'days_with_glare': len(daily_stats),
+        'max_daily_minutes': daily_stats['duration_minutes'].max(),
+        'average_daily_minutes': daily_stats['duration_minutes'].mean(),
+        'max_intensity': glare_periods['average_intensity'].max(),
+        'average_intensity': glare_periods['average_intensity'].mean()
     }
\ No newline at end of file
@@ -1,331 +1,553 @@
-"""Data models and type definitions for the glare analysis system."""
-
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Union, Tuple
-from datetime import datetime
-import numpy as np
-import pandas as pd
-
-
-@dataclass
-class Coordinate:
-    """Represents a geographic coordinate with optional elevation data."""
-    
-    latitude: float
-    longitude: float
-    ground_elevation: float = 0.0
-    height_above_ground: float = 0.0
-    name: str = ""
-    
-    def __post_init__(self):
-        """Validate coordinate values."""
-        if not (-90 <= self.latitude <= 90):
-            raise ValueError(f"Latitude must be between -90 and 90, got {self.latitude}")
-        if not (-180 <= self.longitude <= 180):
-            raise ValueError(f"Longitude must be between -180 and 180, got {self.longitude}")
-        if self.ground_elevation < 0:
-            raise ValueError(f"Ground elevation cannot be negative, got {self.ground_elevation}")
-        if self.height_above_ground < 0:
-            raise ValueError(f"Height above ground cannot be negative, got {self.height_above_ground}")
-    
-    @property
-    def total_height(self) -> float:
-        """Get total height above sea level."""
-        return self.ground_elevation + self.height_above_ground
-
-
-@dataclass
-class ObserverPoint(Coordinate):
-    """Represents an observation point with viewing characteristics."""
-    
-    dp_type: str = "default"
-    fov_direction: Optional[float] = None  # degrees
-    fov_expansion: Optional[float] = None  # degrees
-    
-    def __post_init__(self):
-        """Validate observer point values."""
-        super().__post_init__()
-        if self.fov_direction is not None and not (0 <= self.fov_direction <= 360):
-            raise ValueError(f"FOV direction must be between 0 and 360, got {self.fov_direction}")
-        if self.fov_expansion is not None and not (0 <= self.fov_expansion <= 180):
-            raise ValueError(f"FOV expansion must be between 0 and 180, got {self.fov_expansion}")
-
-
-@dataclass
-class ObservationPoint:
-    """Represents an observation point for glare analysis."""
-    
-    name: str
-    coordinate: Coordinate
-    
-    def __post_init__(self):
-        """Validate observation point."""
-        if not self.name:
-            raise ValueError("Observation point name cannot be empty")
-
-
-@dataclass
-class Polygon:
-    """Represents a polygon geometry."""
-    
-    coordinates: List[Coordinate]
-    
-    def __post_init__(self):
-        """Validate polygon."""
-        if len(self.coordinates) < 3:
-            raise ValueError("Polygon must have at least 3 coordinates")
-
-
-@dataclass
-class Hole:
-    """Represents a hole in a polygon."""
-    
-    coordinates: List[Coordinate]
-    
-    def __post_init__(self):
-        """Validate hole."""
-        if len(self.coordinates) < 3:
-            raise ValueError("Hole must have at least 3 coordinates")
-
-
-@dataclass
-class PVArea:
-    """Represents a photovoltaic area with orientation and location."""
-    
-    name: str
-    polygon: Polygon
-    holes: List[Hole]
-    azimuth: float  # degrees (0 = North, 90 = East, 180 = South, 270 = West)
-    tilt: float     # degrees (0 = horizontal, 90 = vertical)
-    module_type: int = 1
-    
-    def __post_init__(self):
-        """Validate PV area values."""
-        if not self.name:
-            raise ValueError("PV area name cannot be empty")
-        if not (0 <= self.azimuth <= 360):
-            raise ValueError(f"Azimuth must be between 0 and 360, got {self.azimuth}")
-        if not (0 <= self.tilt <= 90):
-            raise ValueError(f"Tilt must be between 0 and 90, got {self.tilt}")
-        if self.module_type not in [0, 1, 2]:
-            raise ValueError(f"Module type must be 0, 1, or 2, got {self.module_type}")
-    
-    @property
-    def coordinates(self) -> List[Coordinate]:
-        """Get coordinates for backward compatibility."""
-        return self.polygon.coordinates
-    
-    @property
-    def centroid(self) -> Coordinate:
-        """Calculate the centroid of the PV area."""
-        coords = self.polygon.coordinates
-        if not coords:
-            raise ValueError("Cannot calculate centroid of empty coordinate list")
-        
-        lat_sum = sum(coord.latitude for coord in coords)
-        lon_sum = sum(coord.longitude for coord in coords)
-        count = len(coords)
-        
-        return Coordinate(
-            latitude=lat_sum / count,
-            longitude=lon_sum / count,
-            ground_elevation=coords[0].ground_elevation,
-            name=f"{self.name}_centroid"
-        )
-
-
-@dataclass
-class SunPosition:
-    """Represents the sun's position at a specific time."""
-    
-    azimuth: float      # degrees
-    elevation: float    # degrees
-    timestamp: datetime
-    
-    def __post_init__(self):
-        """Validate sun position values."""
-        if not (0 <= self.azimuth <= 360):
-            raise ValueError(f"Sun azimuth must be between 0 and 360, got {self.azimuth}")
-        if not (-90 <= self.elevation <= 90):
-            raise ValueError(f"Sun elevation must be between -90 and 90, got {self.elevation}")
-    
-    @property
-    def is_above_horizon(self) -> bool:
-        """Check if sun is above horizon."""
-        return self.elevation > 0
-
-
-@dataclass
-class Vector3D:
-    """Represents a 3D vector."""
-    
-    x: float
-    y: float
-    z: float
-    
-    def __post_init__(self):
-        """Validate that vector components are finite."""
-        if not all(np.isfinite([self.x, self.y, self.z])):
-            raise ValueError("Vector components must be finite numbers")
-    
-    def normalize(self) -> "Vector3D":
-        """Return normalized vector."""
-        magnitude = self.magnitude()
-        if magnitude == 0:
-            raise ValueError("Cannot normalize zero vector")
-        return Vector3D(self.x / magnitude, self.y / magnitude, self.z / magnitude)
-    
-    def magnitude(self) -> float:
-        """Calculate vector magnitude."""
-        return np.sqrt(self.x**2 + self.y**2 + self.z**2)
-    
-    def dot(self, other: "Vector3D") -> float:
-        """Calculate dot product with another vector."""
-        return self.x * other.x + self.y * other.y + self.z * other.z
-    
-    def cross(self, other: "Vector3D") -> "Vector3D":
-        """Calculate cross product with another vector."""
-        return Vector3D(
-            self.y * other.z - self.z * other.y,
-            self.z * other.x - self.x * other.z,
-            self.x * other.y - self.y * other.x
-        )
-
-
-@dataclass
-class ReflectionResult:
-    """Result of a reflection calculation."""
-    
-    reflection_direction: Vector3D
-    incidence_angle: float  # degrees
-    reflection_coefficient: float
-    timestamp: datetime
-    
-    def __post_init__(self):
-        """Validate reflection result values."""
-        if not (0 <= self.incidence_angle <= 90):
-            raise ValueError(f"Incidence angle must be between 0 and 90, got {self.incidence_angle}")
-        if not (0 <= self.reflection_coefficient <= 1):
-            raise ValueError(f"Reflection coefficient must be between 0 and 1, got {self.reflection_coefficient}")
-
-
-@dataclass
-class GlareEvent:
-    """Represents a single glare event."""
-    
-    timestamp: datetime
-    luminance: float  # cd/m²
-    reflection_azimuth: float
-    reflection_elevation: float
-    sun_azimuth: float = 0.0
-    sun_elevation: float = 0.0
-    op_number: int = 1
-    
-    def __post_init__(self):
-        """Validate glare event values."""
-        if self.luminance < 0:
-            raise ValueError(f"Luminance cannot be negative, got {self.luminance}")
-
-
-@dataclass
-class AngularGridPoint:
-    """Represents a point in an angular grid."""
-    
-    azimuth: float
-    elevation: float
-    solid_angle: float = 0.0
-    
-    def __post_init__(self):
-        """Validate angular grid point values."""
-        if not (0 <= self.azimuth <= 360):
-            raise ValueError(f"Azimuth must be between 0 and 360, got {self.azimuth}")
-        if not (-90 <= self.elevation <= 90):
-            raise ValueError(f"Elevation must be between -90 and 90, got {self.elevation}")
-
-
-@dataclass
-class GlareResult:
-    """Result of a glare analysis calculation."""
-    
-    intensity: float        # cd/m²
-    duration: float         # minutes
-    risk_level: str         # 'low', 'medium', 'high'
-    pv_area: PVArea
-    observer: ObserverPoint
-    sun_position: SunPosition
-    reflection_result: ReflectionResult
-    metadata: Dict[str, Any]
-    
-    def __post_init__(self):
-        """Validate glare result values."""
-        if self.intensity < 0:
-            raise ValueError(f"Intensity cannot be negative, got {self.intensity}")
-        if self.duration < 0:
-            raise ValueError(f"Duration cannot be negative, got {self.duration}")
-        if self.risk_level not in ['low', 'medium', 'high']:
-            raise ValueError(f"Risk level must be 'low', 'medium', or 'high', got {self.risk_level}")
-
-
-@dataclass
-class SimulationParameters:
-    """Parameters for glare simulation."""
-    
-    grid_width: float = 1.0
-    resolution_minutes: int = 10
-    sun_elevation_threshold: float = 3.0
-    beam_spread: float = 0.5
-    sun_angle: float = 0.53
-    sun_reflection_threshold: float = 2.0
-    intensity_threshold: float = 30000.0  # cd/m²
-    module_type: int = 1
-    max_calculation_distance: float = 10000.0  # meters
-    use_multiprocessing: bool = True
-    max_workers: Optional[int] = None
-    
-    def __post_init__(self):
-        """Validate simulation parameters."""
-        if self.grid_width <= 0:
-            raise ValueError(f"Grid width must be positive, got {self.grid_width}")
-        if self.resolution_minutes <= 0:
-            raise ValueError(f"Resolution must be positive, got {self.resolution_minutes}")
-        if self.intensity_threshold <= 0:
-            raise ValueError(f"Intensity threshold must be positive, got {self.intensity_threshold}")
-        if self.max_calculation_distance <= 0:
-            raise ValueError(f"Max calculation distance must be positive, got {self.max_calculation_distance}")
-        if not (-90 <= self.sun_elevation_threshold <= 90):
-            raise ValueError(f"Sun elevation threshold must be between -90 and 90, got {self.sun_elevation_threshold}")
-
-
-@dataclass
-class ProjectMetadata:
-    """Metadata for a glare analysis project."""
-    
-    project_name: str
-    description: str = ""
-    client: str = ""
-    date_created: datetime = None
-    analysis_type: str = "glare_analysis"
-    version: str = "1.0.0"
-    
-    def __post_init__(self):
-        """Set default values."""
-        if self.date_created is None:
-            self.date_created = datetime.now()
-
-
-# Type aliases for common data structures
-CoordinateList = List[Coordinate]
-ObserverPointList = List[ObserverPoint]
-PVAreaList = List[PVArea]
-GlareResultList = List[GlareResult]
-SunPositionList = List[SunPosition]
-
-# Numpy array type aliases
-NumpyArray = np.ndarray
-PandasDataFrame = pd.DataFrame
-PandasSeries = pd.Series
-
-# Input/Output type aliases
-JSONData = Dict[str, Any]
-ExcelData = Dict[str, PandasDataFrame]
+"""Data models and type definitions for the glare analysis system."""
+
+import math
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Union, Tuple
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+# Validation switch: range checks on model construction dominate tight
+# solver loops where the inputs come from already-validated arrays.
+# Disabled under python -O, mirroring how compiled extensions drop
+# bounds checks in release builds.
+_VALIDATE = __debug__
+
+
+class Coordinate:
+    """Represents a geographic coordinate with optional elevation data.
+
+    Hand-written __slots__ class rather than a dataclass: simulations
+    create these by the hundred thousand, and dropping the per-instance
+    __dict__ roughly quarters the footprint while speeding up
+    construction.
+    """
+
+    __slots__ = ('latitude', 'longitude', 'ground_elevation',
+                 'height_above_ground', 'name')
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        ground_elevation: float = 0.0,
+        height_above_ground: float = 0.0,
+        name: str = ""
+    ):
+        if _VALIDATE:
+            if not (-90 <= latitude <= 90):
+                raise ValueError(f"Latitude must be between -90 and 90, got {latitude}")
+            if not (-180 <= longitude <= 180):
+                raise ValueError(f"Longitude must be between -180 and 180, got {longitude}")
+            if ground_elevation < 0:
+                raise ValueError(f"Ground elevation cannot be negative, got {ground_elevation}")
+            if height_above_ground < 0:
+                raise ValueError(f"Height above ground cannot be negative, got {height_above_ground}")
+        self.latitude = latitude
+        self.longitude = longitude
+        self.ground_elevation = ground_elevation
+        self.height_above_ground = height_above_ground
+        self.name = name
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(latitude={self.latitude!r}, "
+                f"longitude={self.longitude!r}, "
+                f"ground_elevation={self.ground_elevation!r}, "
+                f"height_above_ground={self.height_above_ground!r}, "
+                f"name={self.name!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.latitude, self.longitude, self.ground_elevation,
+                self.height_above_ground, self.name) == \
+               (other.latitude, other.longitude, other.ground_elevation,
+                other.height_above_ground, other.name)
+
+    @property
+    def total_height(self) -> float:
+        """Get total height above sea level."""
+        return self.ground_elevation + self.height_above_ground
+
+
+class ObserverPoint(Coordinate):
+    """Represents an observation point with viewing characteristics."""
+
+    __slots__ = ('dp_type', 'fov_direction', 'fov_expansion')
+
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        ground_elevation: float = 0.0,
+        height_above_ground: float = 0.0,
+        name: str = "",
+        dp_type: str = "default",
+        fov_direction: Optional[float] = None,  # degrees
+        fov_expansion: Optional[float] = None   # degrees
+    ):
+        super().__init__(latitude, longitude, ground_elevation,
+                         height_above_ground, name)
+        if _VALIDATE:
+            if fov_direction is not None and not (0 <= fov_direction <= 360):
+                raise ValueError(f"FOV direction must be between 0 and 360, got {fov_direction}")
+            if fov_expansion is not None and not (0 <= fov_expansion <= 180):
+                raise ValueError(f"FOV expansion must be between 0 and 180, got {fov_expansion}")
+        self.dp_type = dp_type
+        self.fov_direction = fov_direction
+        self.fov_expansion = fov_expansion
+
+    def __eq__(self, other) -> bool:
+        base = super().__eq__(other)
+        if base is NotImplemented or base is False:
+            return base
+        return (self.dp_type, self.fov_direction, self.fov_expansion) == \
+               (other.dp_type, other.fov_direction, other.fov_expansion)
+
+
+@dataclass
+class ObservationPoint:
+    """Represents an observation point for glare analysis."""
+    
+    name: str
+    coordinate: Coordinate
+    
+    def __post_init__(self):
+        """Validate observation point."""
+        if not _VALIDATE:
+            return
+        if not self.name:
+            raise ValueError("Observation point name cannot be empty")
+
+
+@dataclass
+class Polygon:
+    """Represents a polygon geometry."""
+    
+    coordinates: List[Coordinate]
+    
+    def __post_init__(self):
+        """Validate polygon."""
+        if not _VALIDATE:
+            return
+        if len(self.coordinates) < 3:
+            raise ValueError("Polygon must have at least 3 coordinates")
+
+    @cached_property
+    def coord_array(self) -> np.ndarray:
+        """(N, 2) matrix of [latitude, longitude] rows.
+
+        Built lazily on first access so batch consumers (centroid,
+        containment tests) read one contiguous array instead of
+        extracting attributes vertex by vertex.
+        """
+        return np.array(
+            [(c.latitude, c.longitude) for c in self.coordinates],
+            dtype=np.float64
+        )
+
+
+@dataclass
+class Hole:
+    """Represents a hole in a polygon."""
+    
+    coordinates: List[Coordinate]
+    
+    def __post_init__(self):
+        """Validate hole."""
+        if not _VALIDATE:
+            return
+        if len(self.coordinates) < 3:
+            raise ValueError("Hole must have at least 3 coordinates")
+
+
+@dataclass
+class PVArea:
+    """Represents a photovoltaic area with orientation and location."""
+    
+    name: str
+    polygon: Polygon
+    holes: List[Hole]
+    azimuth: float  # degrees (0 = North, 90 = East, 180 = South, 270 = West)
+    tilt: float     # degrees (0 = horizontal, 90 = vertical)
+    module_type: int = 1
+    
+    def __post_init__(self):
+        """Validate PV area values."""
+        if not _VALIDATE:
+            return
+        if not self.name:
+            raise ValueError("PV area name cannot be empty")
+        if not (0 <= self.azimuth <= 360):
+            raise ValueError(f"Azimuth must be between 0 and 360, got {self.azimuth}")
+        if not (0 <= self.tilt <= 90):
+            raise ValueError(f"Tilt must be between 0 and 90, got {self.tilt}")
+        if self.module_type not in [0, 1, 2]:
+            raise ValueError(f"Module type must be 0, 1, or 2, got {self.module_type}")
+    
+    @property
+    def coordinates(self) -> List[Coordinate]:
+        """Get coordinates for backward compatibility."""
+        return self.polygon.coordinates
+    
+    @cached_property
+    def centroid(self) -> Coordinate:
+        """Centroid of the PV area.
+
+        Computed once from the polygon's packed coordinate matrix and
+        cached on the instance; the geometry never changes after
+        construction, so repeated accesses are attribute reads.
+        """
+        coords = self.polygon.coordinates
+        if not coords:
+            raise ValueError("Cannot calculate centroid of empty coordinate list")
+        
+        lat_mean, lon_mean = self.polygon.coord_array.mean(axis=0)
+        
+        return Coordinate(
+            latitude=float(lat_mean),
+            longitude=float(lon_mean),
+            ground_elevation=coords[0].ground_elevation,
+            name=f"{self.name}_centroid"
+        )
+
+
+class SunPosition:
+    """Represents the sun's position at a specific time."""
+
+    __slots__ = ('azimuth', 'elevation', 'timestamp')
+
+    def __init__(self, azimuth: float, elevation: float, timestamp: datetime):
+        if _VALIDATE:
+            if not (0 <= azimuth <= 360):
+                raise ValueError(f"Sun azimuth must be between 0 and 360, got {azimuth}")
+            if not (-90 <= elevation <= 90):
+                raise ValueError(f"Sun elevation must be between -90 and 90, got {elevation}")
+        self.azimuth = azimuth
+        self.elevation = elevation
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return (f"SunPosition(azimuth={self.azimuth!r}, "
+                f"elevation={self.elevation!r}, timestamp={self.timestamp!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.azimuth, self.elevation, self.timestamp) == \
+               (other.azimuth, other.elevation, other.timestamp)
+
+    @property
+    def is_above_horizon(self) -> bool:
+        """Check if sun is above horizon."""
+        return self.elevation > 0
+
+
+class Vector3D:
+    """Represents a 3D vector."""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x: float, y: float, z: float):
+        # Scalar finiteness checks: x != x catches NaN and math.isinf
+        # the infinities, without np.isfinite allocating a temp array
+        if _VALIDATE and (x != x or y != y or z != z or
+                          math.isinf(x) or math.isinf(y) or math.isinf(z)):
+            raise ValueError("Vector components must be finite numbers")
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def _unchecked(cls, x: float, y: float, z: float) -> "Vector3D":
+        """Construct without any validation.
+
+        For solver-internal loops whose components come straight from
+        trusted numeric arrays; skips __init__ entirely.
+        """
+        v = object.__new__(cls)
+        v.x = x
+        v.y = y
+        v.z = z
+        return v
+
+    def __repr__(self) -> str:
+        return f"Vector3D(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y, self.z) == (other.x, other.y, other.z)
+    
+    def normalize(self) -> "Vector3D":
+        """Return normalized vector."""
+        magnitude = self.magnitude()
+        if magnitude == 0:
+            raise ValueError("Cannot normalize zero vector")
+        inv = 1.0 / magnitude
+        return Vector3D(self.x * inv, self.y * inv, self.z * inv)
+    
+    def magnitude(self) -> float:
+        """Calculate vector magnitude."""
+        # math.sqrt on the scalar sum; np.sqrt would box the value
+        # through ufunc dispatch for a 3-float operation
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+    
+    def dot(self, other: "Vector3D") -> float:
+        """Calculate dot product with another vector."""
+        return self.x * other.x + self.y * other.y + self.z * other.z
+    
+    def cross(self, other: "Vector3D") -> "Vector3D":
+        """Calculate cross product with another vector."""
+        return Vector3D(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x
+        )
+
+
+@dataclass
+class ReflectionResult:
+    """Result of a reflection calculation."""
+    
+    reflection_direction: Vector3D
+    incidence_angle: float  # degrees
+    reflection_coefficient: float
+    timestamp: datetime
+    
+    def __post_init__(self):
+        """Validate reflection result values."""
+        if not _VALIDATE:
+            return
+        if not (0 <= self.incidence_angle <= 90):
+            raise ValueError(f"Incidence angle must be between 0 and 90, got {self.incidence_angle}")
+        if not (0 <= self.reflection_coefficient <= 1):
+            raise ValueError(f"Reflection coefficient must be between 0 and 1, got {self.reflection_coefficient}")
+
+
+class GlareEvent:
+    """Represents a single glare event."""
+
+    __slots__ = ('timestamp', 'luminance', 'reflection_azimuth',
+                 'reflection_elevation', 'sun_azimuth', 'sun_elevation',
+                 'op_number')
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        luminance: float,  # cd/m²
+        reflection_azimuth: float,
+        reflection_elevation: float,
+        sun_azimuth: float = 0.0,
+        sun_elevation: float = 0.0,
+        op_number: int = 1
+    ):
+        if _VALIDATE and luminance < 0:
+            raise ValueError(f"Luminance cannot be negative, got {luminance}")
+        self.timestamp = timestamp
+        self.luminance = luminance
+        self.reflection_azimuth = reflection_azimuth
+        self.reflection_elevation = reflection_elevation
+        self.sun_azimuth = sun_azimuth
+        self.sun_elevation = sun_elevation
+        self.op_number = op_number
+
+    def __repr__(self) -> str:
+        return (f"GlareEvent(timestamp={self.timestamp!r}, "
+                f"luminance={self.luminance!r}, "
+                f"reflection_azimuth={self.reflection_azimuth!r}, "
+                f"reflection_elevation={self.reflection_elevation!r}, "
+                f"sun_azimuth={self.sun_azimuth!r}, "
+                f"sun_elevation={self.sun_elevation!r}, "
+                f"op_number={self.op_number!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.timestamp, self.luminance, self.reflection_azimuth,
+                self.reflection_elevation, self.sun_azimuth,
+                self.sun_elevation, self.op_number) == \
+               (other.timestamp, other.luminance, other.reflection_azimuth,
+                other.reflection_elevation, other.sun_azimuth,
+                other.sun_elevation, other.op_number)
+
+
+@dataclass
+class AngularGridPoint:
+    """Represents a point in an angular grid."""
+    
+    azimuth: float
+    elevation: float
+    solid_angle: float = 0.0
+    
+    def __post_init__(self):
+        """Validate angular grid point values."""
+        if not _VALIDATE:
+            return
+        if not (0 <= self.azimuth <= 360):
+            raise ValueError(f"Azimuth must be between 0 and 360, got {self.azimuth}")
+        if not (-90 <= self.elevation <= 90):
+            raise ValueError(f"Elevation must be between -90 and 90, got {self.elevation}")
+
+
+@dataclass
+class GlareResult:
+    """Result of a glare analysis calculation."""
+    
+    intensity: float        # cd/m²
+    duration: float         # minutes
+    risk_level: str         # 'low', 'medium', 'high'
+    pv_area: PVArea
+    observer: ObserverPoint
+    sun_position: SunPosition
+    reflection_result: ReflectionResult
+    metadata: Dict[str, Any]
+    
+    def __post_init__(self):
+        """Validate glare result values."""
+        if not _VALIDATE:
+            return
+        if self.intensity < 0:
+            raise ValueError(f"Intensity cannot be negative, got {self.intensity}")
+        if self.duration < 0:
+            raise ValueError(f"Duration cannot be negative, got {self.duration}")
+        if self.risk_level not in ['low', 'medium', 'high']:
+            raise ValueError(f"Risk level must be 'low', 'medium', or 'high', got {self.risk_level}")
+
+
+@dataclass
+class SimulationParameters:
+    """Parameters for glare simulation."""
+    
+    grid_width: float = 1.0
+    resolution_minutes: int = 10
+    sun_elevation_threshold: float = 3.0
+    beam_spread: float = 0.5
+    sun_angle: float = 0.53
+    sun_reflection_threshold: float = 2.0
+    intensity_threshold: float = 30000.0  # cd/m²
+    module_type: int = 1
+    max_calculation_distance: float = 10000.0  # meters
+    use_multiprocessing: bool = True
+    max_workers: Optional[int] = None
+    
+    def __post_init__(self):
+        """Validate simulation parameters."""
+        if not _VALIDATE:
+            return
+        if self.grid_width <= 0:
+            raise ValueError(f"Grid width must be positive, got {self.grid_width}")
+        if self.resolution_minutes <= 0:
+            raise ValueError(f"Resolution must be positive, got {self.resolution_minutes}")
+        if self.intensity_threshold <= 0:
+            raise ValueError(f"Intensity threshold must be positive, got {self.intensity_threshold}")
+        if self.max_calculation_distance <= 0:
+            raise ValueError(f"Max calculation distance must be positive, got {self.max_calculation_distance}")
+        if not (-90 <= self.sun_elevation_threshold <= 90):
+            raise ValueError(f"Sun elevation threshold must be between -90 and 90, got {self.sun_elevation_threshold}")
+
+
+@dataclass
+class ProjectMetadata:
+    """Metadata for a glare analysis project."""
+    
+    project_name: str
+    description: str = ""
+    client: str = ""
+    date_created: datetime = None
+    analysis_type: str = "glare_analysis"
+    version: str = "1.0.0"
+    
+    def __post_init__(self):
+        """Set default values."""
+        if self.date_created is None:
+            self.date_created = datetime.now()
+
+
+class CoordinateArray:
+    """Structure-of-arrays storage for large coordinate sets.
+
+    Keeps latitude, longitude, ground elevation and height above ground as
+    columns of one contiguous float64 array so batch consumers (pyproj,
+    NumPy reductions) can read the buffers directly instead of extracting
+    attributes from N Coordinate instances. Rows are wrapped lazily as
+    Coordinate objects on indexing, keeping the list-of-Coordinate API.
+    """
+
+    __slots__ = ('values',)
+
+    def __init__(self, values: np.ndarray):
+        """Initialize from a (N, 4) array of [lat, lon, elevation, height] rows."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != 4:
+            raise ValueError(f"CoordinateArray expects shape (N, 4), got {values.shape}")
+        self.values = values
+
+    @classmethod
+    def from_coordinates(cls, coordinates: List[Coordinate]) -> "CoordinateArray":
+        """Build a CoordinateArray from a list of Coordinate instances."""
+        values = np.empty((len(coordinates), 4), dtype=np.float64)
+        for i, coord in enumerate(coordinates):
+            values[i, 0] = coord.latitude
+            values[i, 1] = coord.longitude
+            values[i, 2] = coord.ground_elevation
+            values[i, 3] = coord.height_above_ground
+        return cls(values)
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        """Latitude column view."""
+        return self.values[:, 0]
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        """Longitude column view."""
+        return self.values[:, 1]
+
+    @property
+    def ground_elevations(self) -> np.ndarray:
+        """Ground elevation column view."""
+        return self.values[:, 2]
+
+    @property
+    def heights_above_ground(self) -> np.ndarray:
+        """Height above ground column view."""
+        return self.values[:, 3]
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __getitem__(self, index: int) -> Coordinate:
+        row = self.values[index]
+        return Coordinate(
+            latitude=float(row[0]),
+            longitude=float(row[1]),
+            ground_elevation=float(row[2]),
+            height_above_ground=float(row[3])
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"CoordinateArray(n={len(self)})"
+
+
+# Type aliases for common data structures
+CoordinateList = List[Coordinate]
+ObserverPointList = List[ObserverPoint]
+PVAreaList = List[PVArea]
+GlareResultList = List[GlareResult]
+SunPositionList = List[SunPosition]
+
+# Numpy array type aliases
+NumpyArray = np.ndarray
+PandasDataFrame = pd.DataFrame
+PandasSeries = pd.Series
+
+# Input/Output type aliases
+JSONData = Dict[str, Any]
+ExcelData = Dict[str, PandasDataFrame]
 ReportData = Dict[str, Union[str, int, float, List, Dict]]
\ No newline at end of file
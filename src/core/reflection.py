@@ -1,357 +1,655 @@
-"""Reflection calculations for glare analysis.
-
-This module provides functions for calculating reflection directions,
-coefficients, and intensities based on sun position and panel orientation.
-"""
-
-import logging
-import math
-from typing import Dict, List, Tuple, Optional, Union, Callable
-import numpy as np
-import pandas as pd
-from pathlib import Path
-from .models import PVArea, SunPosition
-from .geometry import get_panel_normal, get_sun_vector, calculate_incidence_angle
-from ..config import config
-from .reflection_csv_loader import load_reflection_profiles_auto
-from .reflection_base import ReflectionProfile, ReflectionError
-
-# Optional scipy import for advanced interpolation
-try:
-    from scipy.interpolate import interp1d
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-    logger = logging.getLogger(__name__)
-    logger.warning("scipy not available. Using linear interpolation for reflection profiles.")
-
-
-logger = logging.getLogger(__name__)
-
-
-def calculate_reflection_direction(
-    sun_az: float,
-    sun_el: float,
-    pan_az: float,
-    pan_tilt: float
-) -> Tuple[float, float]:
-    """Calculate the direction of reflected sunlight.
-    
-    Uses the law of reflection: angle of incidence equals angle of reflection.
-    The reflection occurs in the plane containing the incident ray and surface normal.
-    
-    Args:
-        sun_az: Sun azimuth in degrees (0=North, 90=East)
-        sun_el: Sun elevation in degrees (0=horizon, 90=zenith)
-        pan_az: Panel azimuth in degrees
-        pan_tilt: Panel tilt in degrees (0=horizontal, 90=vertical)
-        
-    Returns:
-        Tuple of (reflected_azimuth, reflected_elevation) in degrees
-        
-    Example:
-        >>> # Sun from south at 60°, south-facing panel tilted 30°
-        >>> refl_az, refl_el = calculate_reflection_direction(180, 60, 180, 30)
-        >>> print(f"Reflection: azimuth {refl_az:.1f}°, elevation {refl_el:.1f}°")
-    """
-    # Get sun vector (from sun to ground)
-    sun_vec = get_sun_vector(sun_az, sun_el)
-    
-    # Get panel normal
-    panel_normal = get_panel_normal(pan_az, pan_tilt)
-    
-    # Calculate incident vector (from ground to sun = negative of sun vector)
-    incident_vec = -sun_vec
-    
-    # Apply reflection law: r = i - 2(i·n)n
-    dot_product = np.dot(incident_vec, panel_normal)
-    reflection_vec = incident_vec - 2 * dot_product * panel_normal
-    
-    # Convert reflection vector to azimuth and elevation
-    # Note: reflection_vec points away from panel
-    x, y, z = reflection_vec
-    
-    # Calculate elevation
-    reflection_el = math.degrees(math.asin(z))
-    
-    # Calculate azimuth
-    reflection_az = math.degrees(math.atan2(x, y))
-    if reflection_az < 0:
-        reflection_az += 360
-    
-    return reflection_az, reflection_el
-
-
-def load_reflection_profiles(csv_path: Union[str, Path]) -> Dict[int, ReflectionProfile]:
-    """Load reflection profiles from CSV file.
-    
-    This function now auto-detects the CSV format and handles both:
-    - Original format: IA,Value,ModuleType
-    - Standard format: Incident Angle,Module Type 0,Module Type 1,Module Type 2
-    
-    Args:
-        csv_path: Path to CSV file with reflection data
-        
-    Returns:
-        Dictionary mapping module type to ReflectionProfile
-        
-    Raises:
-        ReflectionError: If file cannot be loaded or parsed
-    """
-    return load_reflection_profiles_auto(csv_path)
-
-
-def calculate_reflection_coefficient(
-    incidence_angle: float,
-    module_type: int,
-    profiles: Dict[int, ReflectionProfile]
-) -> float:
-    """Get reflection coefficient for given angle and module type.
-    
-    Args:
-        incidence_angle: Angle of incidence in degrees
-        module_type: Module type (0, 1, or 2)
-        profiles: Dictionary of reflection profiles
-        
-    Returns:
-        Reflection coefficient (0-1)
-        
-    Raises:
-        ValueError: If module type not found in profiles
-    """
-    if module_type not in profiles:
-        raise ValueError(f"Module type {module_type} not found in profiles")
-    
-    return profiles[module_type].get_coefficient(incidence_angle)
-
-
-def calculate_direct_irradiance_on_plane(
-    dni: float,
-    sun_el: float,
-    sun_az: float,
-    pan_tilt: float,
-    pan_az: float
-) -> float:
-    """Calculate direct irradiance on a tilted plane.
-    
-    Uses the cosine of the incidence angle to project DNI onto the plane.
-    
-    Args:
-        dni: Direct Normal Irradiance in W/m²
-        sun_el: Sun elevation in degrees
-        sun_az: Sun azimuth in degrees
-        pan_tilt: Panel tilt in degrees
-        pan_az: Panel azimuth in degrees
-        
-    Returns:
-        Direct irradiance on plane in W/m²
-        
-    Example:
-        >>> # Sun at 60° elevation, 30° tilted panel, both facing south
-        >>> di = calculate_direct_irradiance_on_plane(800, 60, 180, 30, 180)
-        >>> print(f"Direct irradiance on plane: {di:.0f} W/m²")
-        Direct irradiance on plane: 800 W/m²
-    """
-    # Get incidence angle
-    incidence_angle = calculate_incidence_angle(sun_az, sun_el, pan_az, pan_tilt)
-    
-    # Calculate cosine factor
-    cos_factor = math.cos(math.radians(incidence_angle))
-    
-    # DNI on plane = DNI * cos(incidence_angle)
-    # But ensure non-negative (sun behind panel)
-    di_plane = max(0, dni * cos_factor)
-    
-    return di_plane
-
-
-def generate_reflection_dataframe(
-    sun_df: pd.DataFrame,
-    pv_areas: List[PVArea],
-    profiles: Optional[Dict[int, ReflectionProfile]] = None
-) -> pd.DataFrame:
-    """Generate DataFrame with reflection calculations for all sun positions and PV areas.
-    
-    Args:
-        sun_df: DataFrame with sun positions (must have azimuth, elevation columns)
-        pv_areas: List of PV areas to calculate reflections for
-        profiles: Optional reflection profiles (for coefficient calculation)
-        
-    Returns:
-        DataFrame with columns:
-        - pv_area_name: Name of PV area
-        - timestamp: Time of calculation
-        - sun_azimuth, sun_elevation: Sun position
-        - reflection_azimuth, reflection_elevation: Reflection direction
-        - incidence_angle: Angle between sun and panel normal
-        - reflection_coefficient: Reflection coefficient (if profiles provided)
-        - dni, dhi, ghi: Irradiance values (if present in sun_df)
-        - di_plane: Direct irradiance on panel plane
-        
-    Example:
-        >>> refl_df = generate_reflection_dataframe(sun_df, pv_areas, profiles)
-        >>> print(f"Generated {len(refl_df)} reflection calculations")
-    """
-    results = []
-    
-    # Check if irradiance data is available
-    has_irradiance = all(col in sun_df.columns for col in ['dni', 'dhi', 'ghi'])
-    
-    for pv_area in pv_areas:
-        logger.debug(f"Calculating reflections for PV area: {pv_area.name}")
-        
-        for idx, sun_row in sun_df.iterrows():
-            # Calculate reflection direction
-            refl_az, refl_el = calculate_reflection_direction(
-                sun_row['azimuth'],
-                sun_row['elevation'],
-                pv_area.azimuth,
-                pv_area.tilt
-            )
-            
-            # Calculate incidence angle
-            inc_angle = calculate_incidence_angle(
-                sun_row['azimuth'],
-                sun_row['elevation'],
-                pv_area.azimuth,
-                pv_area.tilt
-            )
-            
-            # Build result row
-            result = {
-                'pv_area_name': pv_area.name,
-                'timestamp': idx,
-                'sun_azimuth': sun_row['azimuth'],
-                'sun_elevation': sun_row['elevation'],
-                'reflection_azimuth': refl_az,
-                'reflection_elevation': refl_el,
-                'incidence_angle': inc_angle
-            }
-            
-            # Add reflection coefficient if profiles available
-            if profiles and pv_area.module_type in profiles:
-                result['reflection_coefficient'] = calculate_reflection_coefficient(
-                    inc_angle, pv_area.module_type, profiles
-                )
-            
-            # Add irradiance data if available
-            if has_irradiance:
-                result['dni'] = sun_row['dni']
-                result['dhi'] = sun_row['dhi']
-                result['ghi'] = sun_row['ghi']
-                
-                # Calculate direct irradiance on plane
-                result['di_plane'] = calculate_direct_irradiance_on_plane(
-                    sun_row['dni'],
-                    sun_row['elevation'],
-                    sun_row['azimuth'],
-                    pv_area.tilt,
-                    pv_area.azimuth
-                )
-            
-            results.append(result)
-    
-    # Create DataFrame
-    df = pd.DataFrame(results)
-    
-    # Set timestamp as index if it exists
-    if 'timestamp' in df.columns:
-        df.set_index('timestamp', inplace=True)
-    
-    return df
-
-
-def add_luminance_to_glare_results(
-    df_glare: pd.DataFrame,
-    profile_func: Callable[[float], float],
-    k_dynamic: float = 130.0,
-    scale_factor: float = 100000.0
-) -> pd.DataFrame:
-    """Calculate and add luminance values to glare results.
-    
-    Luminance is calculated based on:
-    - Reflection coefficient (from incidence angle)
-    - Direct irradiance on panel plane
-    - Dynamic luminous efficacy
-    
-    Args:
-        df_glare: DataFrame with glare results (must have incidence_angle, di_plane)
-        profile_func: Function that returns reflection coefficient for given angle
-        k_dynamic: Dynamic luminous efficacy in lm/W (default 130)
-        scale_factor: Scale factor for luminance calculation (default 100000)
-        
-    Returns:
-        DataFrame with added 'luminance' column in cd/m²
-        
-    Note:
-        Formula: luminance = profile(angle) * di_plane * k_dynamic / scale_factor
-    """
-    df_result = df_glare.copy()
-    
-    # Calculate reflection coefficients
-    reflection_coeffs = df_result['incidence_angle'].apply(profile_func)
-    
-    # Calculate luminance
-    # Note: The scale factor converts from illuminance to luminance
-    df_result['luminance'] = (
-        reflection_coeffs * 
-        df_result['di_plane'] * 
-        k_dynamic / 
-        scale_factor
-    )
-    
-    # Ensure non-negative
-    df_result['luminance'] = df_result['luminance'].clip(lower=0)
-    
-    logger.debug(f"Added luminance values, range: {df_result['luminance'].min():.0f} - {df_result['luminance'].max():.0f} cd/m²")
-    
-    return df_result
-
-
-def create_reflection_interpolator(
-    profiles: Dict[int, ReflectionProfile],
-    module_type: int,
-    fit_log: bool = True
-) -> Callable[[float], float]:
-    """Create an interpolation function for reflection coefficients.
-    
-    Args:
-        profiles: Dictionary of reflection profiles
-        module_type: Module type to create interpolator for
-        fit_log: If True, fit in log space for better low-angle behavior (requires scipy)
-        
-    Returns:
-        Function that maps incidence angle to reflection coefficient
-        
-    Raises:
-        ValueError: If module type not found
-    """
-    if module_type not in profiles:
-        raise ValueError(f"Module type {module_type} not found in profiles")
-    
-    profile = profiles[module_type]
-    
-    if fit_log and SCIPY_AVAILABLE:
-        # Fit in log space for better low-angle behavior
-        # Add small epsilon to avoid log(0)
-        eps = 1e-6
-        log_coeffs = np.log(profile.coefficients + eps)
-        
-        # Create interpolator in log space
-        log_interp = interp1d(
-            profile.angles,
-            log_coeffs,
-            kind='cubic',
-            bounds_error=False,
-            fill_value=(log_coeffs[0], log_coeffs[-1])
-        )
-        
-        # Return function that converts back from log space
-        def interpolator(angle: float) -> float:
-            angle = np.clip(angle, 0, 90)
-            return np.exp(log_interp(angle)) - eps
-        
-        return interpolator
-    else:
-        # Direct interpolation using built-in method
-        return lambda angle: profile.get_coefficient(angle)
\ No newline at end of file
+"""Reflection calculations for glare analysis.
+
+This module provides functions for calculating reflection directions,
+coefficients, and intensities based on sun position and panel orientation.
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union, Callable
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from .models import PVArea, SunPosition
+from .geometry import get_panel_normal, calculate_incidence_angle
+from ..config import config
+from .reflection_csv_loader import load_reflection_profiles_auto
+from .reflection_base import ReflectionProfile, ReflectionError
+
+# Optional scipy import for advanced interpolation
+try:
+    from scipy.interpolate import PchipInterpolator
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    logger = logging.getLogger(__name__)
+    logger.warning("scipy not available. Using linear interpolation for reflection profiles.")
+
+
+# Try to import numba for compiled reflection kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+logger = logging.getLogger(__name__)
+
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
+def _refl_dir_kernel(sun_az: float, sun_el: float,
+                     pan_az: float, pan_tilt: float) -> Tuple[float, float]:
+    """Reflection direction for one sun position in plain arithmetic.
+
+    Inlines the sun vector, panel normal and reflection law as scalar
+    math (conventions identical to geometry.get_sun_vector /
+    get_panel_normal) so the function compiles cleanly under numba and
+    costs no array allocations when interpreted.
+    """
+    saz = sun_az * _DEG2RAD
+    sel = sun_el * _DEG2RAD
+    paz = pan_az * _DEG2RAD
+    ptl = pan_tilt * _DEG2RAD
+
+    # Incident vector (ground to sun) = -get_sun_vector
+    cos_el = math.cos(sel)
+    ix = -math.sin(saz) * cos_el
+    iy = math.cos(saz) * cos_el
+    iz = math.sin(sel)
+
+    # Panel normal
+    sin_tilt = math.sin(ptl)
+    nx = -math.sin(paz) * sin_tilt
+    ny = math.cos(paz) * sin_tilt
+    nz = math.cos(ptl)
+
+    # Reflection law r = i - 2(i.n)n
+    dot = ix * nx + iy * ny + iz * nz
+    rx = ix - 2.0 * dot * nx
+    ry = iy - 2.0 * dot * ny
+    rz = iz - 2.0 * dot * nz
+
+    if rz > 1.0:
+        rz = 1.0
+    elif rz < -1.0:
+        rz = -1.0
+    reflection_el = math.asin(rz) * _RAD2DEG
+
+    # Branchless wrap into [0, 360); atan2 yields (-180, 180] so one
+    # added period suffices
+    reflection_az = math.fmod(math.atan2(rx, ry) * _RAD2DEG + 360.0, 360.0)
+
+    return reflection_az, reflection_el
+
+
+def _refl_dir_batch(sun_az, sun_el, pan_az, pan_tilt,
+                    out_az, out_el, out_inc):
+    """Batch reflection direction and incidence angle kernel.
+
+    Fills the three output arrays in one pass over the sun positions;
+    under numba the loop runs compiled and parallel (prange).
+    """
+    paz = pan_az * _DEG2RAD
+    ptl = pan_tilt * _DEG2RAD
+    sin_tilt = math.sin(ptl)
+    cos_tilt = math.cos(ptl)
+    nx = -math.sin(paz) * sin_tilt
+    ny = math.cos(paz) * sin_tilt
+    nz = cos_tilt
+
+    for i in prange(sun_az.shape[0]):
+        saz = sun_az[i] * _DEG2RAD
+        sel = sun_el[i] * _DEG2RAD
+        cos_el = math.cos(sel)
+        sin_el = math.sin(sel)
+        ix = -math.sin(saz) * cos_el
+        iy = math.cos(saz) * cos_el
+        iz = sin_el
+
+        dot = ix * nx + iy * ny + iz * nz
+        rx = ix - 2.0 * dot * nx
+        ry = iy - 2.0 * dot * ny
+        rz = iz - 2.0 * dot * nz
+
+        if rz > 1.0:
+            rz = 1.0
+        elif rz < -1.0:
+            rz = -1.0
+        out_el[i] = math.asin(rz) * _RAD2DEG
+
+        out_az[i] = math.fmod(math.atan2(rx, ry) * _RAD2DEG + 360.0, 360.0)
+
+        # Closed-form incidence angle (same as
+        # geometry.calculate_incidence_angles)
+        cos_inc = sin_el * cos_tilt + cos_el * math.cos(saz - paz) * sin_tilt
+        if cos_inc > 1.0:
+            cos_inc = 1.0
+        elif cos_inc < -1.0:
+            cos_inc = -1.0
+        out_inc[i] = math.acos(cos_inc) * _RAD2DEG
+
+
+if NUMBA_AVAILABLE:
+    _refl_dir_kernel = njit(cache=True, fastmath=True)(_refl_dir_kernel)
+    _refl_dir_batch = njit(cache=True, fastmath=True, parallel=True)(
+        _refl_dir_batch
+    )
+
+
+# Scalar results memoized on inputs quantized to 0.01 degrees: sweeps
+# re-evaluate the same sun position for many observers and sub-steps,
+# and 0.01 degrees is far below the angular tolerances used anywhere
+# downstream, so the quantization is lossless in practice while keeping
+# the hit rate high.
+_QUANT = 100.0
+_INV_QUANT = 1.0 / _QUANT
+
+
+@lru_cache(maxsize=4096)
+def _refl_dir_cached(sa_q: int, se_q: int, pa_q: int, pt_q: int) -> Tuple[float, float]:
+    """Reflection direction for quantized (sun, panel) angles."""
+    return _refl_dir_kernel(sa_q * _INV_QUANT, se_q * _INV_QUANT,
+                            pa_q * _INV_QUANT, pt_q * _INV_QUANT)
+
+
+@lru_cache(maxsize=4096)
+def _incidence_cached(sa_q: int, se_q: int, pa_q: int, pt_q: int) -> float:
+    """Incidence angle for quantized (sun, panel) angles."""
+    return calculate_incidence_angle(sa_q * _INV_QUANT, se_q * _INV_QUANT,
+                                     pa_q * _INV_QUANT, pt_q * _INV_QUANT)
+
+
+def calculate_reflection_direction(
+    sun_az: float,
+    sun_el: float,
+    pan_az: float,
+    pan_tilt: float
+) -> Tuple[float, float]:
+    """Calculate the direction of reflected sunlight.
+    
+    Uses the law of reflection: angle of incidence equals angle of reflection.
+    The reflection occurs in the plane containing the incident ray and surface normal.
+    
+    Args:
+        sun_az: Sun azimuth in degrees (0=North, 90=East)
+        sun_el: Sun elevation in degrees (0=horizon, 90=zenith)
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees (0=horizontal, 90=vertical)
+        
+    Returns:
+        Tuple of (reflected_azimuth, reflected_elevation) in degrees
+        
+    Example:
+        >>> # Sun from south at 60°, south-facing panel tilted 30°
+        >>> refl_az, refl_el = calculate_reflection_direction(180, 60, 180, 30)
+        >>> print(f"Reflection: azimuth {refl_az:.1f}°, elevation {refl_el:.1f}°")
+    """
+    # Quantize to 0.01 degrees and go through the memoized kernel;
+    # repeated sun positions become dictionary hits
+    return _refl_dir_cached(round(sun_az * _QUANT), round(sun_el * _QUANT),
+                            round(pan_az * _QUANT), round(pan_tilt * _QUANT))
+
+
+def calculate_reflection_directions(
+    sun_az: np.ndarray,
+    sun_el: np.ndarray,
+    pan_az: float,
+    pan_tilt: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate reflection directions for a batch of sun positions.
+
+    Vectorized counterpart of calculate_reflection_direction: the sun
+    vectors are built as one (N, 3) array, the reflection law is a
+    single matrix-vector product plus a rank-1 update, and the angle
+    extraction runs as whole-array ufuncs. Conventions match the scalar
+    version exactly (get_sun_vector / get_panel_normal axes).
+
+    Args:
+        sun_az: Sun azimuths in degrees
+        sun_el: Sun elevations in degrees
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+
+    Returns:
+        Tuple of (reflection_azimuths, reflection_elevations) in degrees,
+        azimuths normalized to [0, 360)
+    """
+    az = np.radians(np.asarray(sun_az, dtype=np.float64))
+    el = np.radians(np.asarray(sun_el, dtype=np.float64))
+
+    # Incident vectors (ground to sun) = -get_sun_vector, as (N, 3)
+    cos_el = np.cos(el)
+    incident = np.empty((az.size, 3))
+    incident[:, 0] = -np.sin(az) * cos_el
+    incident[:, 1] = np.cos(az) * cos_el
+    incident[:, 2] = np.sin(el)
+
+    # Reflection law r = i - 2(i.n)n over the whole batch
+    normal = get_panel_normal(pan_az, pan_tilt)
+    dot = incident @ normal
+    reflection = incident - 2.0 * dot[:, np.newaxis] * normal
+
+    reflection_el = np.degrees(np.arcsin(np.clip(reflection[:, 2], -1.0, 1.0)))
+    reflection_az = np.mod(
+        np.degrees(np.arctan2(reflection[:, 0], reflection[:, 1])), 360.0
+    )
+    return reflection_az, reflection_el
+
+
+def _reflect_batch_numpy(
+    sun_az: np.ndarray,
+    sun_el: np.ndarray,
+    pan_az: float,
+    pan_tilt: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reflection directions and incidence angles from one trig pass.
+
+    The panel normal is computed once per call and the incident-vector
+    dot product it shares with the reflection law doubles as the
+    incidence cosine, so the batch needs a single set of sun sin/cos
+    evaluations instead of separate passes for direction and angle.
+
+    Args:
+        sun_az: Sun azimuths in degrees
+        sun_el: Sun elevations in degrees
+        pan_az: Panel azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+
+    Returns:
+        Tuple of (reflection_azimuths, reflection_elevations,
+        incidence_angles) in degrees
+    """
+    az = np.radians(np.asarray(sun_az, dtype=np.float64))
+    el = np.radians(np.asarray(sun_el, dtype=np.float64))
+
+    cos_el = np.cos(el)
+    incident = np.empty((az.size, 3))
+    incident[:, 0] = -np.sin(az) * cos_el
+    incident[:, 1] = np.cos(az) * cos_el
+    incident[:, 2] = np.sin(el)
+
+    normal = get_panel_normal(pan_az, pan_tilt)
+    dot = incident @ normal
+    reflection = incident - 2.0 * dot[:, np.newaxis] * normal
+
+    reflection_el = np.degrees(np.arcsin(np.clip(reflection[:, 2], -1.0, 1.0)))
+    reflection_az = np.mod(
+        np.degrees(np.arctan2(reflection[:, 0], reflection[:, 1])), 360.0
+    )
+    incidence = np.degrees(np.arccos(np.clip(dot, -1.0, 1.0)))
+    return reflection_az, reflection_el, incidence
+
+
+class SunData(NamedTuple):
+    """Sun positions in structure-of-arrays form for the solver core.
+
+    All fields are parallel arrays over the timestamps; the irradiance
+    columns are None when the source data has none. Buffers in this
+    layout feed the compiled kernels directly, with no pandas indexing
+    in the hot path.
+    """
+
+    timestamps: np.ndarray
+    azimuth: np.ndarray
+    elevation: np.ndarray
+    dni: Optional[np.ndarray] = None
+    dhi: Optional[np.ndarray] = None
+    ghi: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_dataframe(cls, sun_df: pd.DataFrame) -> "SunData":
+        """Extract the sun columns of a DataFrame into arrays."""
+        has_irradiance = all(
+            col in sun_df.columns for col in ('dni', 'dhi', 'ghi')
+        )
+        return cls(
+            timestamps=sun_df.index.to_numpy(),
+            azimuth=sun_df['azimuth'].to_numpy(dtype=np.float64),
+            elevation=sun_df['elevation'].to_numpy(dtype=np.float64),
+            dni=sun_df['dni'].to_numpy(dtype=np.float64) if has_irradiance else None,
+            dhi=sun_df['dhi'].to_numpy(dtype=np.float64) if has_irradiance else None,
+            ghi=sun_df['ghi'].to_numpy(dtype=np.float64) if has_irradiance else None
+        )
+
+
+def load_reflection_profiles(csv_path: Union[str, Path]) -> Dict[int, ReflectionProfile]:
+    """Load reflection profiles from CSV file.
+    
+    This function now auto-detects the CSV format and handles both:
+    - Original format: IA,Value,ModuleType
+    - Standard format: Incident Angle,Module Type 0,Module Type 1,Module Type 2
+    
+    Args:
+        csv_path: Path to CSV file with reflection data
+        
+    Returns:
+        Dictionary mapping module type to ReflectionProfile
+        
+    Raises:
+        ReflectionError: If file cannot be loaded or parsed
+    """
+    return load_reflection_profiles_auto(csv_path)
+
+
+def calculate_reflection_coefficient(
+    incidence_angle: float,
+    module_type: int,
+    profiles: Dict[int, ReflectionProfile]
+) -> float:
+    """Get reflection coefficient for given angle and module type.
+    
+    Args:
+        incidence_angle: Angle of incidence in degrees
+        module_type: Module type (0, 1, or 2)
+        profiles: Dictionary of reflection profiles
+        
+    Returns:
+        Reflection coefficient (0-1)
+        
+    Raises:
+        ValueError: If module type not found in profiles
+    """
+    if module_type not in profiles:
+        raise ValueError(f"Module type {module_type} not found in profiles")
+    
+    return profiles[module_type].get_coefficient(incidence_angle)
+
+
+def calculate_direct_irradiance_on_plane(
+    dni: float,
+    sun_el: float,
+    sun_az: float,
+    pan_tilt: float,
+    pan_az: float
+) -> float:
+    """Calculate direct irradiance on a tilted plane.
+    
+    Uses the cosine of the incidence angle to project DNI onto the plane.
+    
+    Args:
+        dni: Direct Normal Irradiance in W/m²
+        sun_el: Sun elevation in degrees
+        sun_az: Sun azimuth in degrees
+        pan_tilt: Panel tilt in degrees
+        pan_az: Panel azimuth in degrees
+        
+    Returns:
+        Direct irradiance on plane in W/m²
+        
+    Example:
+        >>> # Sun at 60° elevation, 30° tilted panel, both facing south
+        >>> di = calculate_direct_irradiance_on_plane(800, 60, 180, 30, 180)
+        >>> print(f"Direct irradiance on plane: {di:.0f} W/m²")
+        Direct irradiance on plane: 800 W/m²
+    """
+    # Get incidence angle (memoized on 0.01-degree quantized inputs)
+    incidence_angle = _incidence_cached(
+        round(sun_az * _QUANT), round(sun_el * _QUANT),
+        round(pan_az * _QUANT), round(pan_tilt * _QUANT)
+    )
+    
+    # Calculate cosine factor
+    cos_factor = math.cos(math.radians(incidence_angle))
+    
+    # DNI on plane = DNI * cos(incidence_angle)
+    # But ensure non-negative (sun behind panel)
+    di_plane = max(0, dni * cos_factor)
+    
+    return di_plane
+
+
+def _generate_reflection_arrays(
+    sun_data: SunData,
+    pv_areas: List[PVArea],
+    profiles: Optional[Dict[int, ReflectionProfile]] = None
+) -> Dict[str, np.ndarray]:
+    """Solver core of generate_reflection_dataframe, pandas-free.
+
+    Works entirely on the SunData arrays: the output columns for all
+    PV areas are preallocated at full length and each area fills its
+    slice, via the compiled batch kernel when numba is available.
+    Callers that stay in array land (e.g. further NumPy or numba
+    stages) should use this directly and skip the DataFrame wrapper.
+
+    Args:
+        sun_data: Sun positions as parallel arrays
+        pv_areas: List of PV areas to calculate reflections for
+        profiles: Optional reflection profiles (for coefficient calculation)
+
+    Returns:
+        Dict of column name to array, one row per (pv_area, timestamp);
+        empty when there are no PV areas
+    """
+    if not pv_areas:
+        return {}
+
+    n = sun_data.azimuth.size
+    m = len(pv_areas)
+    total = m * n
+    has_irradiance = (sun_data.dni is not None and
+                      sun_data.dhi is not None and
+                      sun_data.ghi is not None)
+
+    refl_az = np.empty(total)
+    refl_el = np.empty(total)
+    inc_angles = np.empty(total)
+    if profiles:
+        coeffs = np.full(total, np.nan)
+
+    for j, pv_area in enumerate(pv_areas):
+        logger.debug(f"Calculating reflections for PV area: {pv_area.name}")
+        part = slice(j * n, (j + 1) * n)
+
+        if NUMBA_AVAILABLE:
+            # One compiled parallel pass fills all three column slices
+            _refl_dir_batch(
+                sun_data.azimuth, sun_data.elevation,
+                pv_area.azimuth, pv_area.tilt,
+                refl_az[part], refl_el[part], inc_angles[part]
+            )
+        else:
+            refl_az[part], refl_el[part], inc_angles[part] = \
+                _reflect_batch_numpy(
+                    sun_data.azimuth, sun_data.elevation,
+                    pv_area.azimuth, pv_area.tilt
+                )
+
+        if profiles and pv_area.module_type in profiles:
+            coeffs[part] = profiles[pv_area.module_type].get_coefficient_vec(
+                inc_angles[part]
+            )
+
+    arrays = {
+        'pv_area_name': np.concatenate(
+            [np.full(n, pv_area.name, dtype=object) for pv_area in pv_areas]
+        ),
+        'timestamp': np.tile(np.asarray(sun_data.timestamps), m),
+        'sun_azimuth': np.tile(sun_data.azimuth, m),
+        'sun_elevation': np.tile(sun_data.elevation, m),
+        'reflection_azimuth': refl_az,
+        'reflection_elevation': refl_el,
+        'incidence_angle': inc_angles
+    }
+
+    if profiles:
+        arrays['reflection_coefficient'] = coeffs
+
+    if has_irradiance:
+        arrays['dni'] = np.tile(sun_data.dni, m)
+        arrays['dhi'] = np.tile(sun_data.dhi, m)
+        arrays['ghi'] = np.tile(sun_data.ghi, m)
+        # Direct irradiance on plane, clamped when the sun is behind
+        # the panel
+        arrays['di_plane'] = np.maximum(
+            0.0, arrays['dni'] * np.cos(np.radians(inc_angles))
+        )
+
+    return arrays
+
+
+def generate_reflection_dataframe(
+    sun_df: pd.DataFrame,
+    pv_areas: List[PVArea],
+    profiles: Optional[Dict[int, ReflectionProfile]] = None
+) -> pd.DataFrame:
+    """Generate DataFrame with reflection calculations for all sun positions and PV areas.
+    
+    Args:
+        sun_df: DataFrame with sun positions (must have azimuth, elevation columns)
+        pv_areas: List of PV areas to calculate reflections for
+        profiles: Optional reflection profiles (for coefficient calculation)
+        
+    Returns:
+        DataFrame with columns:
+        - pv_area_name: Name of PV area
+        - timestamp: Time of calculation
+        - sun_azimuth, sun_elevation: Sun position
+        - reflection_azimuth, reflection_elevation: Reflection direction
+        - incidence_angle: Angle between sun and panel normal
+        - reflection_coefficient: Reflection coefficient (if profiles provided)
+        - dni, dhi, ghi: Irradiance values (if present in sun_df)
+        - di_plane: Direct irradiance on panel plane
+        
+    Example:
+        >>> refl_df = generate_reflection_dataframe(sun_df, pv_areas, profiles)
+        >>> print(f"Generated {len(refl_df)} reflection calculations")
+    """
+    sun_data = SunData.from_dataframe(sun_df)
+    arrays = _generate_reflection_arrays(sun_data, pv_areas, profiles)
+    if not arrays:
+        return pd.DataFrame()
+
+    # Create DataFrame (the only pandas construction in the pipeline)
+    df = pd.DataFrame(arrays, copy=False)
+    
+    # Set timestamp as index if it exists
+    if 'timestamp' in df.columns:
+        df.set_index('timestamp', inplace=True)
+    
+    return df
+
+
+def add_luminance_to_glare_results(
+    df_glare: pd.DataFrame,
+    profile_func: Callable[[float], float],
+    k_dynamic: float = 130.0,
+    scale_factor: float = 100000.0
+) -> pd.DataFrame:
+    """Calculate and add luminance values to glare results.
+    
+    Luminance is calculated based on:
+    - Reflection coefficient (from incidence angle)
+    - Direct irradiance on panel plane
+    - Dynamic luminous efficacy
+    
+    Args:
+        df_glare: DataFrame with glare results (must have incidence_angle, di_plane)
+        profile_func: Function that returns reflection coefficient for given angle
+        k_dynamic: Dynamic luminous efficacy in lm/W (default 130)
+        scale_factor: Scale factor for luminance calculation (default 100000)
+        
+    Returns:
+        DataFrame with added 'luminance' column in cd/m²
+        
+    Note:
+        Formula: luminance = profile(angle) * di_plane * k_dynamic / scale_factor
+    """
+    df_result = df_glare.copy()
+    
+    # Calculate reflection coefficients for the whole column at once;
+    # fall back to the per-element apply only for callables that cannot
+    # take arrays
+    angles = df_result['incidence_angle'].to_numpy()
+    try:
+        reflection_coeffs = np.asarray(profile_func(angles), dtype=np.float64)
+        if reflection_coeffs.shape != angles.shape:
+            raise TypeError("profile_func did not return a matching array")
+    except (TypeError, ValueError):
+        reflection_coeffs = df_result['incidence_angle'].apply(profile_func)
+    
+    # Calculate luminance
+    # Note: The scale factor converts from illuminance to luminance
+    df_result['luminance'] = (
+        reflection_coeffs * 
+        df_result['di_plane'] * 
+        k_dynamic / 
+        scale_factor
+    )
+    
+    # Ensure non-negative
+    df_result['luminance'] = df_result['luminance'].clip(lower=0)
+    
+    logger.debug(f"Added luminance values, range: {df_result['luminance'].min():.0f} - {df_result['luminance'].max():.0f} cd/m²")
+    
+    return df_result
+
+
+def create_reflection_interpolator(
+    profiles: Dict[int, ReflectionProfile],
+    module_type: int,
+    fit_log: bool = True
+) -> Callable[[float], float]:
+    """Create an interpolation function for reflection coefficients.
+    
+    Args:
+        profiles: Dictionary of reflection profiles
+        module_type: Module type to create interpolator for
+        fit_log: If True, fit in log space for better low-angle behavior (requires scipy)
+        
+    Returns:
+        Function that maps incidence angle to reflection coefficient
+        
+    Raises:
+        ValueError: If module type not found
+    """
+    if module_type not in profiles:
+        raise ValueError(f"Module type {module_type} not found in profiles")
+    
+    profile = profiles[module_type]
+
+    # Built interpolators are cached on the profile instance itself, so
+    # the spline construction cost is paid once per profile and the
+    # cache's lifetime is exactly the profile's -- no identity-reuse
+    # hazard and nothing accumulates past the data it was built from
+    cache = getattr(profile, '_interpolator_cache', None)
+    if cache is None:
+        cache = {}
+        profile._interpolator_cache = cache
+    cached = cache.get(fit_log)
+    if cached is not None:
+        return cached
+    
+    if fit_log and SCIPY_AVAILABLE:
+        # Fit in log space for better low-angle behavior
+        # Add small epsilon to avoid log(0)
+        eps = 1e-6
+        log_coeffs = np.log(np.asarray(profile.coefficients, dtype=np.float64) + eps)
+        
+        # PCHIP is monotone and shape-preserving, so it cannot
+        # overshoot into negative coefficients at low angles the way a
+        # cubic spline can
+        pchip = PchipInterpolator(
+            np.asarray(profile.angles, dtype=np.float64),
+            log_coeffs,
+            extrapolate=False
+        )
+        lo = float(profile.angles[0])
+        hi = float(profile.angles[-1])
+        
+        # Return function that converts back from log space; accepts
+        # scalars or whole arrays, clamping to the profile's endpoints
+        # like the old fill_value did
+        def interpolator(angle: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+            angle = np.clip(np.asarray(angle, dtype=np.float64), lo, hi)
+            return np.exp(pchip(angle)) - eps
+    else:
+        # Direct interpolation; batch-capable via np.interp
+        interpolator = profile.get_coefficient_vec
+
+    cache[fit_log] = interpolator
+    return interpolator
\ No newline at end of file
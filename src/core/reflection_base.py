@@ -1,74 +1,102 @@
-"""Base classes for reflection module."""
-
-import numpy as np
-from typing import List
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class ReflectionError(Exception):
-    """Exception raised for reflection calculation errors."""
-    pass
-
-
-class ReflectionProfile:
-    """Container for module reflection characteristics.
-    
-    Stores and interpolates reflection coefficients based on incidence angle.
-    This is a simplified version without scipy dependency for basic functionality.
-    """
-    
-    def __init__(self, angles: List[float], coefficients: List[float], module_type: int):
-        """Initialize reflection profile.
-        
-        Args:
-            angles: List of incidence angles in degrees
-            coefficients: List of reflection coefficients (0-1)
-            module_type: Module type identifier (0, 1, or 2)
-        """
-        if len(angles) != len(coefficients):
-            raise ValueError("Angles and coefficients must have same length")
-        
-        self.module_type = module_type
-        self.angles = np.array(angles)
-        self.coefficients = np.array(coefficients)
-        
-        # Sort by angles to ensure proper interpolation
-        sort_idx = np.argsort(self.angles)
-        self.angles = self.angles[sort_idx]
-        self.coefficients = self.coefficients[sort_idx]
-    
-    def get_coefficient(self, angle: float) -> float:
-        """Get reflection coefficient for given incidence angle.
-        
-        Uses linear interpolation between known values.
-        
-        Args:
-            angle: Incidence angle in degrees
-            
-        Returns:
-            Reflection coefficient (0-1)
-        """
-        # Ensure angle is in valid range
-        angle = np.clip(angle, 0, 90)
-        
-        # Handle edge cases
-        if angle <= self.angles[0]:
-            return float(self.coefficients[0])
-        if angle >= self.angles[-1]:
-            return float(self.coefficients[-1])
-        
-        # Linear interpolation
-        idx = np.searchsorted(self.angles, angle)
-        x0, x1 = self.angles[idx-1], self.angles[idx]
-        y0, y1 = self.coefficients[idx-1], self.coefficients[idx]
-        
-        # Interpolate
-        t = (angle - x0) / (x1 - x0)
-        coeff = y0 + t * (y1 - y0)
-        
-        return float(coeff)
-    
-    def __repr__(self) -> str:
+"""Base classes for reflection module."""
+
+import numpy as np
+from bisect import bisect_right
+from typing import List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReflectionError(Exception):
+    """Exception raised for reflection calculation errors."""
+    pass
+
+
+class ReflectionProfile:
+    """Container for module reflection characteristics.
+    
+    Stores and interpolates reflection coefficients based on incidence angle.
+    This is a simplified version without scipy dependency for basic functionality.
+    """
+    
+    def __init__(self, angles: List[float], coefficients: List[float], module_type: int):
+        """Initialize reflection profile.
+        
+        Args:
+            angles: List of incidence angles in degrees
+            coefficients: List of reflection coefficients (0-1)
+            module_type: Module type identifier (0, 1, or 2)
+        """
+        if len(angles) != len(coefficients):
+            raise ValueError("Angles and coefficients must have same length")
+        
+        self.module_type = module_type
+        # Contiguous float32 tables: profiles hold well under a hundred
+        # points with coefficients in [0, 1], so single precision (~7
+        # digits) vastly exceeds measurement accuracy while halving the
+        # cache footprint read by every batched np.interp call
+        self.angles = np.ascontiguousarray(angles, dtype=np.float32)
+        self.coefficients = np.ascontiguousarray(coefficients, dtype=np.float32)
+        
+        # Sort by angles to ensure proper interpolation
+        sort_idx = np.argsort(self.angles)
+        self.angles = self.angles[sort_idx]
+        self.coefficients = self.coefficients[sort_idx]
+
+        # Scalar lookup tables: plain float lists plus precomputed
+        # segment slopes, so get_coefficient runs as one C-level bisect
+        # and a multiply-add with no per-call ndarray boxing
+        self._angles_list = [float(a) for a in self.angles]
+        self._coeffs_list = [float(c) for c in self.coefficients]
+        self._slopes = [
+            (c1 - c0) / (a1 - a0) if a1 != a0 else 0.0
+            for a0, a1, c0, c1 in zip(
+                self._angles_list[:-1], self._angles_list[1:],
+                self._coeffs_list[:-1], self._coeffs_list[1:]
+            )
+        ]
+    
+    def get_coefficient(self, angle: float) -> float:
+        """Get reflection coefficient for given incidence angle.
+        
+        Uses linear interpolation between known values.
+        
+        Args:
+            angle: Incidence angle in degrees
+            
+        Returns:
+            Reflection coefficient (0-1)
+        """
+        # Handle edge cases (also covers clamping outside [0, 90])
+        angles = self._angles_list
+        if angle <= angles[0]:
+            return self._coeffs_list[0]
+        if angle >= angles[-1]:
+            return self._coeffs_list[-1]
+        
+        # Linear interpolation on the precomputed segment slope;
+        # bisect_right is the same binary search searchsorted does,
+        # but without routing a scalar through ufunc machinery
+        idx = bisect_right(angles, angle)
+        x0 = angles[idx - 1]
+        return self._coeffs_list[idx - 1] + (angle - x0) * self._slopes[idx - 1]
+
+    def get_coefficient_vec(self, angles: np.ndarray) -> np.ndarray:
+        """Get reflection coefficients for an array of incidence angles.
+
+        One np.interp call replaces a Python-level get_coefficient
+        dispatch (with its own searchsorted) per angle; endpoints clamp
+        the same way as the scalar version.
+
+        Args:
+            angles: Incidence angles in degrees
+
+        Returns:
+            Array of reflection coefficients (0-1)
+        """
+        angles = np.clip(np.asarray(angles, dtype=np.float64), 0, 90)
+        return np.interp(angles, self.angles, self.coefficients)
+
+    def __repr__(self) -> str:
         return f"ReflectionProfile(module_type={self.module_type}, angles={len(self.angles)})"
\ No newline at end of file
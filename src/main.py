@@ -11,7 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Union, Optional
 
-from .config import Config
+from .config import Config, get_config
 from .core.models import (
     PVArea, ObservationPoint, Coordinate, SimulationParameters
 )
@@ -27,17 +27,17 @@ __version__ = "1.0.0"
 
 
 def calculate_glare(
-    input_data: Union[str, Dict[str, Any]], 
+    input_data: Union[str, bytes, Dict[str, Any]],
     config: Optional[Config] = None
 ) -> Dict[str, Any]:
     """
     Calculate glare from solar PV installations.
-    
+
     This is the main entry point that matches the original API while using
     the refactored modular architecture underneath.
-    
+
     Args:
-        input_data: JSON string or dictionary containing:
+        input_data: JSON string/bytes or dictionary containing:
             - pv_areas: List of PV area definitions
             - list_of_ops: List of observation points
             - meta_data: Project metadata
@@ -63,18 +63,19 @@ def calculate_glare(
     start_time = time.time()
     
     try:
-        # Setup configuration
+        # Setup configuration (the default is validated once via get_config)
         if config is None:
-            config = Config()
-        
+            config = get_config()
+        config.ensure_dirs()
+
         # Setup logging
         _setup_logging(config)
         
         logger.info(f"Starting glare analysis v{__version__}")
         logger.info(f"Configuration: {config}")
         
-        # Parse input data
-        if isinstance(input_data, str):
+        # Parse input data (dicts are consumed directly, avoiding a re-parse)
+        if isinstance(input_data, (str, bytes)):
             try:
                 input_data = json.loads(input_data)
             except json.JSONDecodeError as e: